@@ -28,7 +28,7 @@ from typing import Dict, List, Optional, Tuple
 
 from android_backup_parser import (
     AndroidBackup, AndroidBackupFile, AndroidBackupParser,
-    parse_tar_path, UNMAPPABLE_TOKENS,
+    parse_tar_path, UNMAPPABLE_TOKENS, _BufferReader,
 )
 from ios_backup_parser import ParsingLog
 
@@ -211,7 +211,7 @@ class ALEXParser:
         if progress_callback:
             progress_callback(30, 100, "Parsing tar archive from backup.ab...")
 
-        tar_stream = io.BytesIO(tar_data)
+        tar_stream = _BufferReader(tar_data)
         try:
             tar_handle = tarfile.open(fileobj=tar_stream, mode='r:')
             member_lookup = {m.name: m for m in tar_handle.getmembers()}
@@ -29,6 +29,7 @@ import zlib
 import hashlib
 import datetime
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from ios_backup_parser import ParsingLog, ParsingLogEntry
@@ -61,6 +62,26 @@ TOKEN_PATH_MAPPINGS = {
 KNOWN_TOKENS = set(TOKEN_PATH_MAPPINGS.keys()) | UNMAPPABLE_TOKENS
 
 
+@lru_cache(maxsize=4096)
+def _parse_tar_dir(head: str) -> Optional[Tuple[str, str, str]]:
+    """Get the (domain, token, relative path prefix) for entries in a directory.
+
+    head is the stripped directory path; the prefix ends in '/' unless
+    entries sit at the top of the domain. Returns None when the domain
+    or token comes from the entry's own name (e.g. "apps/<pkg>/<token>").
+    """
+    parts = head.split('/')
+    if parts[0] == 'apps':
+        if len(parts) < 3:
+            return None
+        return parts[1], parts[2], '/'.join(parts[2:]) + '/'
+    elif parts[0] == 'shared':
+        if len(parts) < 2:
+            return None
+        return f"shared/{parts[1]}", '', '/'.join(parts[2:]) + '/' if len(parts) > 2 else ''
+    return parts[0], '', '/'.join(parts[1:]) + '/' if len(parts) > 1 else ''
+
+
 def parse_tar_path(member_name: str) -> Tuple[str, str, str]:
     """Parse a tar member name into (domain, token, relative_path).
 
@@ -70,7 +91,17 @@ def parse_tar_path(member_name: str) -> Tuple[str, str, str]:
         - token: AOSP backup token or ""
         - relative_path: token + remaining path for tree display
     """
-    parts = member_name.strip('./').split('/')
+    stripped = member_name.strip('./')
+    # Entries in the same directory share their domain and token, so the
+    # directory is parsed once and the base name appended
+    head, sep, base = stripped.rpartition('/')
+    if sep:
+        parsed = _parse_tar_dir(head)
+        if parsed is not None:
+            domain, token, prefix = parsed
+            return domain, token, prefix + base
+
+    parts = stripped.split('/')
 
     if parts[0] == 'apps' and len(parts) >= 2:
         package_name = parts[1]
@@ -95,12 +126,56 @@ def parse_tar_path(member_name: str) -> Tuple[str, str, str]:
         return parts[0], '', '/'.join(parts[1:]) if len(parts) > 1 else ''
 
 
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only file object over a bytes-like buffer, without copying it."""
+
+    def __init__(self, buffer):
+        self._buf = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._buf) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError("negative seek position")
+        self._pos = pos
+        return pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._buf) if size is None or size < 0 else self._pos + size
+        data = bytes(self._buf[self._pos:end])
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self._buf[self._pos:self._pos + len(b)]
+        n = len(data)
+        b[:n] = data
+        self._pos += n
+        return n
+
+
 class AndroidBackupError(Exception):
     """Exception raised for Android backup parsing errors."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AndroidBackupFile:
     """Represents a file from an Android backup.
 
@@ -164,6 +239,28 @@ class AndroidBackup:
             by_domain[f.domain].append(f)
         return by_domain
 
+    # Handles kept open for content extraction, including those the Magnet
+    # and ALEX parsers attach, in the order they must be closed: member
+    # readers before the archive they read from
+    _HANDLE_ATTRS = (
+        '_magnet_sdcard_tar', '_magnet_sdcard_raw', '_magnet_adb_tar', '_magnet_zip',
+        '_alex_zip', '_backup_handle',
+    )
+
+    def close(self):
+        """Close the archive handles kept for content extraction.
+
+        File content can no longer be read from the backup afterwards.
+        """
+        for name in self._HANDLE_ATTRS:
+            handle = getattr(self, name, None)
+            if handle is not None:
+                handle.close()
+                setattr(self, name, None)
+        self._tar_data = None
+        if getattr(self, '_magnet_sdcard_tar_data', None) is not None:
+            self._magnet_sdcard_tar_data = None
+
 
 class AndroidBackupParser:
     """Parser for Android .ab backup files."""
@@ -389,7 +486,7 @@ class AndroidBackupParser:
         if progress_callback:
             progress_callback(30, 100, "Parsing tar archive...")
 
-        tar_stream = io.BytesIO(tar_data)
+        tar_stream = _BufferReader(tar_data)
         try:
             tar_handle = tarfile.open(fileobj=tar_stream, mode='r:')
             member_lookup = {m.name: m for m in tar_handle.getmembers()}
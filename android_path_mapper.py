@@ -14,7 +14,9 @@ from android_backup_parser import (
     AndroidBackup, AndroidBackupFile,
     TOKEN_PATH_MAPPINGS, UNMAPPABLE_TOKENS,
 )
-from path_mapper import MappingStatus, PathMapping, MappingStatistics
+from path_mapper import (
+    MappingStatus, PathMapping, MappingStatistics, MappingStatusIndex, MAPPING_PROGRESS_INTERVAL,
+)
 from filesystem_loader import FilesystemAcquisition, FilesystemFile
 
 
@@ -33,6 +35,7 @@ class AndroidPathMapper:
         self.filesystem = filesystem
         self.mappings: List[PathMapping] = []
         self.statistics = MappingStatistics()
+        self._status_index = MappingStatusIndex()
         self._apk_dir_cache: Dict[str, Optional[str]] = {}  # package -> resolved dir name
 
     def _resolve_apk_dir(self, package_name: str) -> Optional[str]:
@@ -127,10 +130,13 @@ class AndroidPathMapper:
             return f'{base_path}/{remaining}', f"Token '{token}' mapping"
         return base_path, f"Token '{token}' mapping"
 
-    def map_all(self) -> List[PathMapping]:
+    def map_all(self, progress_callback=None) -> List[PathMapping]:
         """
         Map all backup files to filesystem paths.
 
+        Args:
+            progress_callback: Optional callback(current, total, message) for progress updates
+
         Returns:
             List of PathMapping results
         """
@@ -164,10 +170,20 @@ class AndroidPathMapper:
                 self.statistics.total_filesystem_files += 1
 
         # Map each backup file
+        total = self.statistics.total_backup_files
+        done = 0
+        # Local names for the statuses used per file below
+        status_mapped = MappingStatus.MAPPED
+        status_not_found = MappingStatus.NOT_FOUND
+        status_unmappable = MappingStatus.UNMAPPABLE
         for backup_file in self.backup.files:
             if backup_file.is_directory:
                 continue
 
+            if progress_callback and done % MAPPING_PROGRESS_INTERVAL == 0:
+                progress_callback(done, total, f"Mapping files: {done}/{total}")
+            done += 1
+
             fs_path, notes = self._map_backup_file(backup_file)
 
             if fs_path is None:
@@ -175,7 +191,7 @@ class AndroidPathMapper:
                     backup_file=backup_file,
                     filesystem_path=None,
                     filesystem_file=None,
-                    status=MappingStatus.UNMAPPABLE,
+                    status=status_unmappable,
                     notes=notes,
                 )
                 self.statistics.unmappable_files += 1
@@ -187,7 +203,7 @@ class AndroidPathMapper:
                         backup_file=backup_file,
                         filesystem_path=fs_path,
                         filesystem_file=fs_file,
-                        status=MappingStatus.MAPPED,
+                        status=status_mapped,
                         notes=notes,
                     )
                     self.statistics.mapped_files += 1
@@ -197,13 +213,16 @@ class AndroidPathMapper:
                         backup_file=backup_file,
                         filesystem_path=fs_path,
                         filesystem_file=None,
-                        status=MappingStatus.NOT_FOUND,
+                        status=status_not_found,
                         notes=notes,
                     )
                     self.statistics.not_found_files += 1
 
             self.mappings.append(mapping)
 
+        if progress_callback:
+            progress_callback(total, total, "Mapping complete")
+
         # Calculate files unique to each side
         self.statistics.backup_only_files = (
             self.statistics.not_found_files + self.statistics.unmappable_files
@@ -244,12 +263,13 @@ class AndroidPathMapper:
             by_domain[domain].append(mapping)
         return by_domain
 
+    def get_mappings_by_status(self) -> Dict[MappingStatus, List[PathMapping]]:
+        """Group mappings by status, partitioning once per map_all() run."""
+        return self._status_index.by_status(self.mappings)
+
     def get_unmapped_backup_files(self) -> list:
-        """Get list of backup files that couldn't be mapped."""
-        return [
-            m.backup_file for m in self.mappings
-            if m.status in (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE)
-        ]
+        """Get list of backup files that couldn't be mapped, in mapping order."""
+        return self._status_index.unmapped_backup_files(self.mappings)
 
     def get_filesystem_files_not_in_backup(self) -> List[FilesystemFile]:
         """Get list of filesystem files that have no corresponding backup file."""
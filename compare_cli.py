@@ -160,9 +160,10 @@ def output_summary(mapper: PathMapper):
     # Domain breakdown
     print(f"\nBy Domain:")
     by_domain = mapper.get_mappings_by_domain()
+    status_mapped = MappingStatus.MAPPED
     for domain in sorted(by_domain.keys()):
         domain_mappings = by_domain[domain]
-        mapped = sum(1 for m in domain_mappings if m.status == MappingStatus.MAPPED)
+        mapped = sum(1 for m in domain_mappings if m.status is status_mapped)
         total = len(domain_mappings)
         pct = (mapped / total * 100) if total > 0 else 0
         print(f"  {domain}: {mapped}/{total} ({pct:.1f}%)")
@@ -238,9 +239,10 @@ def output_json(mapper, backup, filesystem):
 
     # Domain breakdown
     by_domain = mapper.get_mappings_by_domain()
+    status_mapped = MappingStatus.MAPPED
     for domain in sorted(by_domain.keys()):
         domain_mappings = by_domain[domain]
-        mapped = sum(1 for m in domain_mappings if m.status == MappingStatus.MAPPED)
+        mapped = sum(1 for m in domain_mappings if m.status is status_mapped)
         total = len(domain_mappings)
         result["by_domain"][domain] = {
             "total": total,
@@ -255,8 +257,9 @@ def output_csv_unmapped(mapper: PathMapper):
     """Output unmapped backup files as CSV."""
     print("domain,relative_path,file_size,status,notes")
 
+    unmapped_statuses = (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE)
     for mapping in mapper.mappings:
-        if mapping.status in (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE):
+        if mapping.status in unmapped_statuses:
             bf = mapping.backup_file
             # Escape quotes in fields
             domain = bf.domain.replace('"', '""')
@@ -7,6 +7,7 @@ Handles loading filesystem acquisitions from various formats:
 - Extracted directories
 """
 
+import io
 import os
 import re
 import sqlite3
@@ -15,7 +16,7 @@ import tempfile
 import zipfile
 import plistlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Iterator
+from typing import BinaryIO, Dict, List, Optional, Set, Iterator
 from pathlib import Path
 
 
@@ -111,8 +112,9 @@ class FilesystemAcquisition:
             self.build_index()
 
         # Try direct lookup
-        if path in self._file_index:
-            return self._file_index[path]
+        match = self._file_index.get(path)
+        if match is not None:
+            return match
 
         if self.platform == 'ios':
             # iOS: try with /private prefix
@@ -727,3 +729,42 @@ class FilesystemLoader:
             return None
 
         return self._read_file_content(fs_file.path)
+
+    def get_file_stream(self, acquisition: FilesystemAcquisition, fs_file: FilesystemFile) -> Optional[BinaryIO]:
+        """
+        Open a file from the acquisition for streaming reads.
+
+        Args:
+            acquisition: Loaded acquisition object
+            fs_file: The file to open
+
+        Returns:
+            Binary file object (caller closes it), or None if unable to open
+        """
+        if fs_file.is_directory:
+            return None
+
+        clean_path = fs_file.path.lstrip('/')
+
+        if self._format == 'zip':
+            # The member stream keeps the archive file open until it is closed itself
+            try:
+                with zipfile.ZipFile(self.path, 'r') as zf:
+                    for try_path in [clean_path, './' + clean_path]:
+                        try:
+                            return zf.open(try_path)
+                        except KeyError:
+                            continue
+            except Exception:
+                pass
+            return None
+
+        if self._format == 'directory':
+            try:
+                return open(os.path.join(self.path, clean_path), 'rb')
+            except OSError:
+                return None
+
+        # Tar members are read whole; a member stream cannot outlive the archive
+        content = self._read_file_content(fs_file.path)
+        return io.BytesIO(content) if content is not None else None
@@ -10,12 +10,87 @@ UFED-style logical+) that don't conform to iOS backup or Android .ab formats.
 """
 
 import os
+import re
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Tuple
 
 from filesystem_loader import FilesystemAcquisition, FilesystemFile
 from ios_backup_parser import ParsingLog
-from path_mapper import PathMapping, MappingStatus, MappingStatistics
+from path_mapper import (
+    PathMapping, MappingStatus, MappingStatistics, MappingStatusIndex, MAPPING_PROGRESS_INTERVAL,
+)
+
+
+# Domain prefixes, matched against the path with surrounding slashes stripped.
+# Alternatives are tried in order, so more specific layouts come first.
+_ANDROID_DOMAIN_RE = re.compile(r"""
+    (?: data/data/(?P<data>[^/]*)             # /data/data/<pkg>/...
+      | data/user/[^/]*/(?P<user>[^/]*)       # /data/user/0/<pkg>/...
+      | data/app/(?P<app>[^/]*)               # /data/app/<pkg>-<suffix>/...
+      | sdcard                                # shared storage → shared/0
+      | storage/emulated/[^/]*
+      | data/media/[^/]*
+    )(?=/|\Z)                                 # ends on a component boundary
+    """, re.VERBOSE)
+
+_IOS_DOMAIN_RE = re.compile(r"""
+    (?:private/)?var/mobile
+    (?:/Containers/
+        (?:Data/Application/(?P<app>[^/]*)  # AppContainer-<GUID>
+         | Shared/AppGroup/(?P<group>[^/]*) # AppGroup-<GUID>
+        )
+    )?                                      # otherwise HomeDomain
+    (?=/|\Z)
+    """, re.VERBOSE)
+
+
+def _extract_generic(path: str) -> Tuple[str, str]:
+    """Fallback: first path component as domain."""
+    domain, _, rel = path.strip('/').partition('/')
+    return (sys.intern(domain), rel)
+
+
+def _extract_android(path: str) -> Tuple[str, str]:
+    """Group Android paths by package name, or shared/0 for shared storage."""
+    m = _ANDROID_DOMAIN_RE.match(path.strip('/'))
+    if m is None:
+        return _extract_generic(path)
+    rel = m.string[m.end() + 1:]
+    if m.group('data') is not None:
+        return (sys.intern(m.group('data')), rel)
+    if m.group('user') is not None:
+        return (sys.intern(m.group('user')), rel)
+    if m.group('app') is not None:
+        return (sys.intern(m.group('app').rsplit('-', 1)[0]), rel)
+    return ('shared/0', rel)
+
+
+def _extract_ios(path: str) -> Tuple[str, str]:
+    """Group iOS paths by app container/group, or HomeDomain."""
+    m = _IOS_DOMAIN_RE.match(path.strip('/'))
+    if m is None:
+        return _extract_generic(path)
+    rel = m.string[m.end() + 1:]
+    if m.group('app') is not None:
+        return (sys.intern(f'AppContainer-{m.group("app")}'), rel)
+    if m.group('group') is not None:
+        return (sys.intern(f'AppGroup-{m.group("group")}'), rel)
+    return ('HomeDomain', rel)
+
+
+_EXTRACTORS: Dict[str, Callable[[str], Tuple[str, str]]] = {
+    'android': _extract_android,
+    'ios': _extract_ios,
+}
+
+
+def _extractor_for(platform: str) -> Callable[[str], Tuple[str, str]]:
+    """Select the domain extractor for a platform once, outside per-file loops."""
+    return _EXTRACTORS.get(platform, _extract_generic)
 
 
 def extract_domain_from_path(path: str, platform: str) -> Tuple[str, str]:
@@ -25,89 +100,55 @@ def extract_domain_from_path(path: str, platform: str) -> Tuple[str, str]:
     For Android, groups by package name where possible.
     For iOS, groups by container or domain equivalent.
     Falls back to first path component otherwise.
+
+    Computed domain strings are interned: thousands of files share each
+    domain, so this collapses them onto a single string object and lets
+    dict keying hit the identity fast path.
     """
-    parts = path.strip('/').split('/')
-    if not parts or parts == ['']:
-        return ('', '')
-
-    if platform == 'android':
-        # /data/data/<pkg>/... or /data/user/0/<pkg>/...
-        if len(parts) >= 3 and parts[0] == 'data' and parts[1] == 'data':
-            pkg = parts[2]
-            rel = '/'.join(parts[3:]) if len(parts) > 3 else ''
-            return (pkg, rel)
-        if len(parts) >= 4 and parts[0] == 'data' and parts[1] == 'user':
-            # /data/user/0/<pkg>/...
-            pkg = parts[3]
-            rel = '/'.join(parts[4:]) if len(parts) > 4 else ''
-            return (pkg, rel)
-        # /data/app/<pkg>-<suffix>/...
-        if len(parts) >= 3 and parts[0] == 'data' and parts[1] == 'app':
-            pkg = parts[2].rsplit('-', 1)[0]
-            rel = '/'.join(parts[3:]) if len(parts) > 3 else ''
-            return (pkg, rel)
-        # Shared storage paths → shared/0
-        if parts[0] == 'sdcard':
-            rel = '/'.join(parts[1:]) if len(parts) > 1 else ''
-            return ('shared/0', rel)
-        if parts[0] == 'storage' and len(parts) >= 3 and parts[1] == 'emulated':
-            # /storage/emulated/0/...
-            rel = '/'.join(parts[3:]) if len(parts) > 3 else ''
-            return ('shared/0', rel)
-        if (parts[0] == 'data' and parts[1] == 'media'
-                and len(parts) >= 3):
-            # /data/media/0/...
-            rel = '/'.join(parts[3:]) if len(parts) > 3 else ''
-            return ('shared/0', rel)
-
-    elif platform == 'ios':
-        # /private/var/mobile/Containers/Data/Application/<GUID>/...
-        stripped = parts
-        if stripped and stripped[0] == 'private':
-            stripped = stripped[1:]
-        if (len(stripped) >= 6
-                and stripped[:4] == ['var', 'mobile', 'Containers', 'Data']
-                and stripped[4] == 'Application'):
-            guid = stripped[5]
-            rel = '/'.join(stripped[6:]) if len(stripped) > 6 else ''
-            return (f'AppContainer-{guid}', rel)
-        # /private/var/mobile/Containers/Shared/AppGroup/<GUID>/...
-        if (len(stripped) >= 6
-                and stripped[:4] == ['var', 'mobile', 'Containers', 'Shared']
-                and stripped[4] == 'AppGroup'):
-            guid = stripped[5]
-            rel = '/'.join(stripped[6:]) if len(stripped) > 6 else ''
-            return (f'AppGroup-{guid}', rel)
-        # /private/var/mobile/...
-        if len(stripped) >= 2 and stripped[0] == 'var' and stripped[1] == 'mobile':
-            rel = '/'.join(stripped[2:]) if len(stripped) > 2 else ''
-            return ('HomeDomain', rel)
-
-    # Fallback: first path component as domain
-    if len(parts) >= 2:
-        return (parts[0], '/'.join(parts[1:]))
-    return (parts[0], '')
+    return _extractor_for(platform)(path)
 
 
 class FilesystemAsBackupFile:
-    """Wraps a FilesystemFile to duck-type as BackupFile/AndroidBackupFile."""
+    """Wraps a FilesystemFile to duck-type as BackupFile/AndroidBackupFile.
+
+    Only the path-derived fields are stored; size, mode, flags and mtime
+    are derived from the wrapped file on access.
+    """
+
+    __slots__ = ('_fs_file', 'domain', 'relative_path', 'file_id', '__weakref__')
 
-    def __init__(self, fs_file: FilesystemFile, platform: str):
+    def __init__(self, fs_file: FilesystemFile, platform: str,
+                 extractor: Optional[Callable[[str], Tuple[str, str]]] = None):
         self._fs_file = fs_file
-        self.domain, self.relative_path = extract_domain_from_path(
-            fs_file.normalized_path, platform
-        )
+        if extractor is None:
+            extractor = _extractor_for(platform)
+        self.domain, self.relative_path = extractor(fs_file.normalized_path)
         self.file_id = fs_file.path
-        self.file_size = fs_file.size
-        self.actual_file_size = fs_file.size
-        self.mode = 0o40755 if fs_file.is_directory else 0o100644
-        self.modified_time = fs_file.modified_time or 0.0
-        self.flags = 2 if fs_file.is_directory else 1
 
     @property
     def is_directory(self) -> bool:
         return self._fs_file.is_directory
 
+    @property
+    def file_size(self) -> int:
+        return self._fs_file.size
+
+    @property
+    def actual_file_size(self) -> int:
+        return self._fs_file.size
+
+    @property
+    def mode(self) -> int:
+        return 0o40755 if self._fs_file.is_directory else 0o100644
+
+    @property
+    def flags(self) -> int:
+        return 2 if self._fs_file.is_directory else 1
+
+    @property
+    def modified_time(self) -> float:
+        return self._fs_file.modified_time or 0.0
+
     @property
     def full_domain_path(self) -> str:
         if self.relative_path:
@@ -115,6 +156,15 @@ class FilesystemAsBackupFile:
         return self.domain
 
 
+# Wrappers shared between FilesystemAsBackup instances built over the same
+# acquisition (reloads, or the same acquisition on both sides of a
+# comparison). A wrapper keeps its FilesystemFile alive, so the id() in the
+# key cannot be reused while the entry exists.
+_wrapper_cache: 'weakref.WeakValueDictionary[Tuple[int, str], FilesystemAsBackupFile]' = (
+    weakref.WeakValueDictionary()
+)
+
+
 class FilesystemAsBackup:
     """Wraps a FilesystemAcquisition to duck-type as a Backup object."""
 
@@ -129,14 +179,38 @@ class FilesystemAsBackup:
         self.platform = acquisition.platform
         self.parsing_log = ParsingLog()
 
-        # Derive a device name from the archive filename
-        self.device_name = os.path.basename(acquisition.path)
+        # Derive a device name from the archive filename (either separator)
+        self.device_name = (
+            acquisition.path.replace('\\', '/').rpartition('/')[2]
+            or acquisition.path
+        )
 
-        # Wrap all files
-        self.files: List[FilesystemAsBackupFile] = [
-            FilesystemAsBackupFile(f, acquisition.platform)
-            for f in acquisition.files
-        ]
+        # Wrap all files, reusing any live wrapper for the same file
+        platform = acquisition.platform
+        extractor = _extractor_for(platform)
+        self.files: List[FilesystemAsBackupFile] = []
+        for f in acquisition.files:
+            key = (id(f), platform)
+            wrapper = _wrapper_cache.get(key)
+            if wrapper is None:
+                wrapper = FilesystemAsBackupFile(f, platform, extractor)
+                _wrapper_cache[key] = wrapper
+            self.files.append(wrapper)
+
+
+# Below this many source files a thread pool costs more than it saves.
+PARALLEL_LOOKUP_MIN_FILES = 50000
+
+# Source files looked up per thread-pool task. ThreadPoolExecutor.map()
+# submits one task per item (its chunksize only applies to processes), so
+# batch explicitly to keep per-task overhead small next to a dict lookup.
+PARALLEL_LOOKUP_BATCH = 4096
+
+
+def _gil_disabled() -> bool:
+    """True on a free-threaded (PEP 703) build running without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
 
 
 class FilesystemMapper:
@@ -147,15 +221,30 @@ class FilesystemMapper:
         self.filesystem = filesystem
         self.mappings: List[PathMapping] = []
         self.statistics = MappingStatistics()
+        self._status_index = MappingStatusIndex()
+        self._by_fs_path: Dict[str, PathMapping] = {}
+        self._by_domain: Dict[str, List[PathMapping]] = {}
+        self._by_domain_count = 0
+
+    def map_all(self, progress_callback=None) -> List[PathMapping]:
+        """Map source files to reference filesystem by normalized path.
 
-    def map_all(self) -> List[PathMapping]:
-        """Map source files to reference filesystem by normalized path."""
+        progress_callback(current, total, message), if given, is called every
+        MAPPING_PROGRESS_INTERVAL files.
+        """
         self.mappings = []
         self.statistics = MappingStatistics()
 
         # Ensure reference index is built
         self.filesystem.build_index()
 
+        find_file = self.filesystem.find_file
+
+        def lookup(bf):
+            # Use the underlying FilesystemFile's normalized path for lookup
+            fs_path = bf._fs_file.normalized_path
+            return fs_path, find_file(fs_path)
+
         # Count totals
         source_files = [f for f in self.backup.files if not f.is_directory]
         source_dirs = [f for f in self.backup.files if f.is_directory]
@@ -171,29 +260,61 @@ class FilesystemMapper:
         mapped = 0
         not_found = 0
 
-        # Track which reference files get matched
-        matched_ref_paths = set()
+        # Index mappings by matched reference path. A count alone is not
+        # enough: aliased source paths (/data/data vs /data/user/0) can
+        # resolve to the same reference file, so the first mapping wins.
+        by_fs_path: Dict[str, PathMapping] = {}
+        self._by_fs_path = by_fs_path
 
-        for bf in source_files:
-            # Use the underlying FilesystemFile's normalized path for lookup
-            fs_path = bf._fs_file.normalized_path
-            match = self.filesystem.find_file(fs_path)
+        # Group by domain in the same pass; bf.domain is already in hand
+        by_domain: Dict[str, List[PathMapping]] = {}
+        self._by_domain = by_domain
+
+        # Lookups are independent, so spread them across cores where threads
+        # actually run in parallel. Under the GIL, pure dict lookups gain
+        # nothing from threads and stay serial.
+        if len(source_files) >= PARALLEL_LOOKUP_MIN_FILES and _gil_disabled():
+            batches = [
+                source_files[i:i + PARALLEL_LOOKUP_BATCH]
+                for i in range(0, len(source_files), PARALLEL_LOOKUP_BATCH)
+            ]
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(chain.from_iterable(
+                    executor.map(lambda batch: [lookup(bf) for bf in batch], batches)
+                ))
+        else:
+            results = map(lookup, source_files)
+
+        total = len(source_files)
+        status_mapped = MappingStatus.MAPPED
+        status_not_found = MappingStatus.NOT_FOUND
+        for i, (bf, (fs_path, match)) in enumerate(zip(source_files, results)):
+            if progress_callback and i % MAPPING_PROGRESS_INTERVAL == 0:
+                progress_callback(i, total, f"Mapping files: {i}/{total}")
 
             if match:
-                status = MappingStatus.MAPPED
+                status = status_mapped
                 mapped += 1
-                matched_ref_paths.add(match.normalized_path)
             else:
-                status = MappingStatus.NOT_FOUND
+                status = status_not_found
                 not_found += 1
 
-            self.mappings.append(PathMapping(
+            mapping = PathMapping(
                 backup_file=bf,
                 filesystem_path=fs_path,
                 filesystem_file=match,
                 status=status,
                 notes="" if match else "Not found in reference filesystem"
-            ))
+            )
+            self.mappings.append(mapping)
+            by_domain.setdefault(bf.domain, []).append(mapping)
+            if match:
+                by_fs_path.setdefault(match.normalized_path, mapping)
+
+        self._by_domain_count = len(self.mappings)
+
+        if progress_callback:
+            progress_callback(total, total, "Mapping complete")
 
         self.statistics.mapped_files = mapped
         self.statistics.not_found_files = not_found
@@ -203,7 +324,7 @@ class FilesystemMapper:
         # Count filesystem-only files
         fs_only = 0
         for rf in ref_files:
-            if rf.normalized_path not in matched_ref_paths:
+            if rf.normalized_path not in by_fs_path:
                 fs_only += 1
         self.statistics.filesystem_only_files = fs_only
 
@@ -218,42 +339,43 @@ class FilesystemMapper:
     def get_mapping_for_backup_file(self, backup_file) -> Optional[PathMapping]:
         """Get the mapping for a specific backup file."""
         for mapping in self.mappings:
-            if mapping.backup_file == backup_file:
+            if mapping.backup_file is backup_file:
                 return mapping
         return None
 
     def get_mapping_for_filesystem_file(self, fs_file: FilesystemFile) -> Optional[PathMapping]:
         """Get the mapping for a specific filesystem file (reverse lookup)."""
         for mapping in self.mappings:
-            if mapping.filesystem_file == fs_file:
+            if mapping.filesystem_file is fs_file:
                 return mapping
         return None
 
     def get_mappings_by_domain(self) -> Dict[str, List[PathMapping]]:
-        """Group mappings by domain."""
-        by_domain: Dict[str, List[PathMapping]] = {}
-        for mapping in self.mappings:
-            domain = mapping.backup_file.domain
-            if domain not in by_domain:
-                by_domain[domain] = []
-            by_domain[domain].append(mapping)
-        return by_domain
+        """Group mappings by domain.
+
+        Uses the grouping built by map_all(), regrouping if self.mappings has
+        since changed size. Returns a copy, so callers may modify it freely.
+        """
+        if self._by_domain_count != len(self.mappings):
+            by_domain: Dict[str, List[PathMapping]] = {}
+            for mapping in self.mappings:
+                by_domain.setdefault(mapping.backup_file.domain, []).append(mapping)
+            self._by_domain = by_domain
+            self._by_domain_count = len(self.mappings)
+        return {domain: list(mappings) for domain, mappings in self._by_domain.items()}
+
+    def get_mappings_by_status(self) -> Dict[MappingStatus, List[PathMapping]]:
+        """Group mappings by status, partitioning once per map_all() run."""
+        return self._status_index.by_status(self.mappings)
 
     def get_unmapped_backup_files(self) -> list:
-        """Get list of backup files that couldn't be mapped."""
-        return [
-            m.backup_file for m in self.mappings
-            if m.status in (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE)
-        ]
+        """Get list of backup files that couldn't be mapped, in mapping order."""
+        return self._status_index.unmapped_backup_files(self.mappings)
 
     def get_filesystem_files_not_in_backup(self) -> List[FilesystemFile]:
         """Get list of filesystem files that have no corresponding source file."""
-        matched_paths = {
-            m.filesystem_file.normalized_path
-            for m in self.mappings
-            if m.filesystem_file is not None
-        }
+        matched = self._by_fs_path  # built by map_all()
         return [
             f for f in self.filesystem.files
-            if not f.is_directory and f.normalized_path not in matched_paths
+            if not f.is_directory and f.normalized_path not in matched
         ]
@@ -0,0 +1,141 @@
+"""
+Hash Cache Module
+
+Persists SHA256 digests between sessions so that comparing the same file
+again does not re-read it. Entries are keyed by (path, mtime, size): any
+change to the file, or to the archive it lives in, gives a new key and so
+a fresh hash. The least recently used entries are pruned once the cache
+holds more than a set number of rows.
+
+The cache is best effort: if the database cannot be opened or written,
+lookups miss and stores are dropped, and hashing carries on as normal.
+"""
+
+import os
+import sqlite3
+from typing import Optional
+
+
+# Default location of the cache database
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mect', 'hash_cache.sqlite')
+
+# Rows kept before the least recently used are pruned
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class HashCache:
+    """SQLite-backed SHA256 cache keyed by (path, mtime, size).
+
+    A connection is opened on first use and is tied to the thread that
+    opened it, so use each instance from a single thread.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    # last_used is a use counter rather than a timestamp, so ordering holds
+    # even when several uses fall within one clock tick
+    _NEXT_USE = "SELECT COALESCE(MAX(last_used), 0) + 1 FROM cache"
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database and create the table, or disable the cache on failure."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "path TEXT, mtime INTEGER, size INTEGER, sha256 BLOB, last_used INTEGER, "
+                "PRIMARY KEY (path, mtime, size))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_last_used ON cache (last_used)")
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def get(self, path: str, mtime: int, size: int) -> Optional[str]:
+        """Return the cached hex digest for a key, or None on a miss."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT sha256 FROM cache WHERE path=? AND mtime=? AND size=?",
+                (path, mtime, size),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                f"UPDATE cache SET last_used=({self._NEXT_USE}) WHERE path=? AND mtime=? AND size=?",
+                (path, mtime, size),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            return None
+        return row[0].hex()
+
+    def put(self, path: str, mtime: int, size: int, sha256_hex: str):
+        """Store a hex digest for a key, pruning old entries past max_entries."""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (path, mtime, size, sha256, last_used) "
+                f"VALUES (?, ?, ?, ?, ({self._NEXT_USE}))",
+                (path, mtime, size, bytes.fromhex(sha256_hex)),
+            )
+            excess = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM cache WHERE rowid IN "
+                    "(SELECT rowid FROM cache ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """Close the database connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def cache_key(container: str, member: str, in_archive: Optional[bool] = None) -> Optional[tuple]:
+    """
+    Build the (path, mtime, size) key for a file inside a container.
+
+    Args:
+        container: Directory or archive the file comes from
+        member: Path of the file within the container
+        in_archive: Whether the member is stored inside the container file
+            rather than as a file under it. Defaults to whether the
+            container is not a directory.
+
+    Returns:
+        The key, or None if the file (or archive) cannot be stat'ed.
+        For a directory the file itself is stat'ed; for an archive the
+        archive is, so rewriting it invalidates all of its entries. A
+        member stored in an archive needs the archive file itself, since
+        a directory's mtime does not follow changes to its files.
+    """
+    container = os.path.abspath(container)
+    path = os.path.join(container, member.lstrip('/'))
+    if in_archive is None:
+        in_archive = not os.path.isdir(container)
+    if in_archive and not os.path.isfile(container):
+        return None
+    try:
+        st = os.stat(container if in_archive else path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
@@ -11,17 +11,174 @@ Supports:
 
 import os
 import io
+import sys
+import shutil
+import struct
 import sqlite3
 import plistlib
 import zipfile
 import tempfile
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import groupby
+from operator import attrgetter
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 
-@dataclass
+# Buffer size for streaming large members out of ZIP archives
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Threads listing hash-prefix directories; scandir/stat release the GIL
+SIZE_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# Report size verification progress every this many files
+SIZE_PROGRESS_INTERVAL = 1024
+
+_BPLIST_MAGIC = b'bplist00'
+
+
+def _load_plist(data: bytes):
+    """
+    Decode a plist blob, going straight to the binary parser for bplist00.
+
+    Manifest.db file blobs are almost always binary plists; naming the format
+    skips plistlib's per-call format sniffing. Other formats fall back to
+    plistlib's auto-detection.
+    """
+    if data[:8] == _BPLIST_MAGIC:
+        return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+    return plistlib.loads(data)
+
+
+# bplist00 trailer: offset int size, object ref size, object count,
+# top object, offset table position
+_BPLIST_TRAILER = struct.Struct('>6xBBQQQ')
+
+# Encoded ASCII string objects for the keys read from file blobs, mapped
+# to their slot in the (Size, Mode, LastModified, $objects) result
+_BLOB_KEYS = {b'\x54Size': 0, b'\x54Mode': 1, b'\x5cLastModified': 2, b'\x58$objects': 3}
+_BLOB_KEY_MARKERS = frozenset(key[0] for key in _BLOB_KEYS)
+
+# struct codes for big-endian unsigned ints by byte width
+_UINT_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def _bplist_refs(blob: bytes, pos: int, count: int, ref_size: int) -> Tuple[int, ...]:
+    """Unpack count object refs of ref_size bytes starting at pos."""
+    if ref_size == 1:
+        return tuple(blob[pos:pos + count])
+    return struct.unpack_from(f'>{count}{_UINT_CODES[ref_size]}', blob, pos)
+
+
+def _bplist_container(blob: bytes, pos: int, kind: int) -> Tuple[int, int]:
+    """Get (entry count, position of first object ref) of an array/dict."""
+    marker = blob[pos]
+    if marker >> 4 != kind:
+        raise ValueError("unexpected object type")
+    count = marker & 0x0F
+    pos += 1
+    if count == 0x0F:
+        int_size = 1 << (blob[pos] & 0x0F)
+        count = int.from_bytes(blob[pos + 1:pos + 1 + int_size], 'big')
+        pos += 1 + int_size
+    return count, pos
+
+
+def _read_file_blob_fast(blob: bytes) -> Optional[Tuple[int, int, Optional[int]]]:
+    """
+    Read (Size, Mode, LastModified) straight out of a bplist00 file blob.
+
+    File blobs are NSKeyedArchiver archives whose MBFile attributes live
+    in $objects[1]; a flat dict holding the attributes is accepted too.
+    Only the objects on the path to those three integers are decoded.
+    Returns None for anything this reader does not handle (other plist
+    formats, non-integer values, malformed data), in which case the
+    caller falls back to plistlib.
+    """
+    if not isinstance(blob, bytes) or blob[:8] != _BPLIST_MAGIC or len(blob) < 40:
+        return None
+    try:
+        offset_size, ref_size, num_objects, top, table = \
+            _BPLIST_TRAILER.unpack_from(blob, len(blob) - 32)
+        offsets = struct.unpack_from(f'>{num_objects}{_UINT_CODES[offset_size]}', blob, table)
+
+        found: List[Optional[int]] = [None, None, None, None]
+        count, pos = _bplist_container(blob, offsets[top], 0xD)
+        for depth in range(2):
+            refs = _bplist_refs(blob, pos, 2 * count, ref_size)
+            for i in range(count):
+                key_pos = offsets[refs[i]]
+                marker = blob[key_pos]
+                if marker in _BLOB_KEY_MARKERS:
+                    slot = _BLOB_KEYS.get(blob[key_pos:key_pos + 1 + (marker & 0x0F)])
+                    if slot is not None and found[slot] is None:
+                        found[slot] = refs[count + i]
+            if found[3] is None or depth:
+                break
+            # NSKeyedArchiver: the MBFile object is $objects[1]
+            count, pos = _bplist_container(blob, offsets[found[3]], 0xA)
+            if count < 2:
+                return 0, 0, None
+            attrs = _bplist_refs(blob, pos, 2, ref_size)[1]
+            found = [None, None, None, None]
+            count, pos = _bplist_container(blob, offsets[attrs], 0xD)
+
+        values: List[Optional[int]] = [None, None, None]
+        for slot in range(3):
+            ref = found[slot]
+            if ref is None:
+                continue
+            pos = offsets[ref]
+            marker = blob[pos]
+            if marker >> 4 != 0x1 or marker & 0x0F > 3:
+                return None  # Not an integer
+            int_size = 1 << (marker & 0x0F)
+            # Only 8-byte integers are signed in bplist00
+            values[slot] = int.from_bytes(blob[pos + 1:pos + 1 + int_size], 'big',
+                                          signed=int_size == 8)
+        return values[0] or 0, values[1] or 0, values[2]
+    except Exception:
+        return None  # Malformed or unexpected layout
+
+
+def _file_blob_attrs(plist) -> dict:
+    """Get the MBFile attribute dict from a decoded file blob."""
+    if not isinstance(plist, dict):
+        return {}
+    objects = plist.get('$objects')
+    if objects is None:
+        return plist
+    # Metadata is in $objects[1] (NSKeyedArchiver format)
+    if len(objects) > 1 and isinstance(objects[1], dict):
+        return objects[1]
+    return {}
+
+
+def _read_file_blob(blob: bytes) -> Tuple[int, int, Optional[float]]:
+    """Get (Size, Mode, LastModified) from a Manifest.db file blob."""
+    meta = _read_file_blob_fast(blob)
+    if meta is not None:
+        return meta
+    try:
+        attrs = _file_blob_attrs(_load_plist(blob))
+    except Exception:
+        return 0, 0, None
+    return attrs.get('Size', 0), attrs.get('Mode', 0), attrs.get('LastModified')
+
+
+def _file_blob_keys(blob: Optional[bytes]) -> Optional[Tuple[str, ...]]:
+    """Get the attribute names in a file blob, for debugging size=0 entries."""
+    if not blob:
+        return None
+    try:
+        return tuple(_file_blob_attrs(_load_plist(blob)))
+    except Exception:
+        return None
+
+
+@dataclass(slots=True)
 class ParsingLogEntry:
     """Single entry in the parsing log."""
     file_id: str
@@ -31,9 +188,24 @@ class ParsingLogEntry:
     details: str = ""
     manifest_size: int = 0
     actual_size: Optional[int] = None
-
-
-@dataclass
+    # Raw (flags, mode, plist_keys) for manifest rows, formatted on demand
+    detail_args: tuple = ()
+
+    def format_details(self) -> str:
+        """Get the details text, formatting manifest row values if deferred."""
+        if self.details or not self.detail_args:
+            return self.details
+        flags, mode, plist_keys = self.detail_args
+        if self.status == 'added_directory':
+            return f"flags={flags}, mode={oct(mode) if mode else 0}"
+        details = f"size={self.manifest_size}, flags={flags}"
+        # For files with size=0, log the plist keys to help debug
+        if self.manifest_size == 0 and plist_keys:
+            details += f", plist_keys={list(plist_keys)}"
+        return details
+
+
+@dataclass(slots=True)
 class ParsingLog:
     """Log of the manifest.db parsing process."""
     timestamp: str = ""
@@ -48,11 +220,34 @@ class ParsingLog:
     _entry_by_file_id: Dict[str, ParsingLogEntry] = field(default_factory=dict)
 
     def add_entry(self, file_id: str, domain: str, relative_path: str, status: str,
-                  details: str = "", manifest_size: int = 0):
-        entry = ParsingLogEntry(file_id, domain, relative_path, status, details, manifest_size)
+                  details: str = "", manifest_size: int = 0, detail_args: tuple = ()):
+        entry = ParsingLogEntry(file_id, domain, relative_path, status, details, manifest_size,
+                                detail_args=detail_args)
         self.entries.append(entry)
-        if file_id:
+        # Only files get their actual size checked by update_actual_size()
+        if file_id and status == 'added_file':
             self._entry_by_file_id[file_id] = entry
+        self.count(status)
+
+    def add_entries(self, rows: List[tuple]):
+        """Record many entries at once.
+
+        Each row is (file_id, domain, relative_path, status, details, manifest_size).
+        """
+        new_entries = [ParsingLogEntry(*row) for row in rows]
+        self.entries.extend(new_entries)
+        by_file_id = self._entry_by_file_id
+        for entry in new_entries:
+            status = entry.status
+            if status == 'added_file':
+                self.files_added += 1
+                if entry.file_id:
+                    by_file_id[entry.file_id] = entry
+            else:
+                self.count(status)
+
+    def count(self, status: str):
+        """Bump the summary counter for a status without recording an entry."""
         if status == 'added_file':
             self.files_added += 1
         elif status == 'added_directory':
@@ -67,11 +262,21 @@ class ParsingLog:
         if file_id in self._entry_by_file_id:
             entry = self._entry_by_file_id[file_id]
             entry.actual_size = actual_size
-            if actual_size is not None:
-                if entry.manifest_size != actual_size:
-                    self.size_mismatches += 1
-                    if entry.manifest_size == 0 and actual_size > 0:
-                        self.manifest_size_zero += 1
+            self.count_size(entry.manifest_size, actual_size)
+
+    def set_actual_size(self, file_id: str, actual_size: Optional[int]):
+        """Record the actual size on a file's entry, leaving the counters alone."""
+        entry = self._entry_by_file_id.get(file_id)
+        if entry is not None:
+            entry.actual_size = actual_size
+
+    def count_size(self, manifest_size: int, actual_size: Optional[int]):
+        """Bump the size verification counters for one file."""
+        if actual_size is not None:
+            if manifest_size != actual_size:
+                self.size_mismatches += 1
+                if manifest_size == 0 and actual_size > 0:
+                    self.manifest_size_zero += 1
 
     def to_text(self) -> str:
         """Generate a text report of the parsing log."""
@@ -98,8 +303,9 @@ class ParsingLog:
         for entry in self.entries:
             path = f"{entry.domain}/{entry.relative_path}" if entry.relative_path else entry.domain
             line = f"[{entry.status:20}] {path}"
-            if entry.details:
-                line += f" ({entry.details})"
+            details = entry.format_details()
+            if details:
+                line += f" ({details})"
 
             # Add size mismatch flag
             if entry.actual_size is not None and entry.status == 'added_file':
@@ -111,7 +317,7 @@ class ParsingLog:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupFile:
     """Represents a file from an iOS backup."""
     file_id: str  # The SHA1 hash filename in backup
@@ -122,20 +328,23 @@ class BackupFile:
     modified_time: Optional[float] = None
     flags: int = 0  # Backup flags: 1=file, 2=directory
     actual_file_size: Optional[int] = None  # Actual size of backup file on disk
+    _is_dir: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Decided once here; mode/flags/file_size are not changed after parsing
+        self._is_dir = (
+            # Check mode first (standard Unix directory mode)
+            (self.mode & 0o170000) == 0o040000
+            # Fallback: check flags (iOS backup specific: 2=directory)
+            or self.flags == 2
+            # Fallback: if mode is 0, size is 0, and no file_id, likely a directory
+            or (self.mode == 0 and self.file_size == 0 and not self.file_id)
+        )
 
     @property
     def is_directory(self) -> bool:
         """Check if this entry is a directory."""
-        # Check mode first (standard Unix directory mode)
-        if (self.mode & 0o170000) == 0o040000:
-            return True
-        # Fallback: check flags (iOS backup specific: 2=directory)
-        if self.flags == 2:
-            return True
-        # Fallback: if mode is 0, size is 0, and no file_id, likely a directory
-        if self.mode == 0 and self.file_size == 0 and not self.file_id:
-            return True
-        return False
+        return self._is_dir
 
     @property
     def full_domain_path(self) -> str:
@@ -143,7 +352,7 @@ class BackupFile:
         return f"{self.domain}/{self.relative_path}" if self.relative_path else self.domain
 
 
-@dataclass
+@dataclass(slots=True)
 class iOSBackup:
     """Container for parsed iOS backup data."""
     path: str
@@ -159,33 +368,118 @@ class iOSBackup:
     parsing_log: ParsingLog = field(default_factory=ParsingLog)  # Detailed parsing log
     _backup_handle: object = None  # iOSbackup library handle for encrypted backups
     _zip_handle: object = None  # ZipFile handle for zipped backups
+    _zip_prefix: str = ""  # Directory holding Manifest.db inside the ZIP
     _password: Optional[str] = None
 
     def get_files_by_domain(self) -> Dict[str, List[BackupFile]]:
         """Group files by their domain."""
         by_domain: Dict[str, List[BackupFile]] = {}
-        for f in self.files:
-            if f.domain not in by_domain:
-                by_domain[f.domain] = []
-            by_domain[f.domain].append(f)
+        # Files from one domain tend to sit together, so take each run of
+        # equal domains in one step rather than hashing every file's domain
+        for domain, run in groupby(self.files, key=attrgetter('domain')):
+            group = by_domain.get(domain)
+            if group is None:
+                by_domain[domain] = list(run)
+            else:
+                group.extend(run)
         return by_domain
 
 
+def _scan_dir_sizes(dir_path: str) -> Dict[str, int]:
+    """Map each entry name in a directory to its size, in one scandir pass."""
+    sizes: Dict[str, int] = {}
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass  # Missing bucket directory: none of its files are present
+    return sizes
+
+
+def _connect_manifest(db_path: str, immutable: bool = False):
+    """
+    Open an SQLite database read-only for a single scan.
+
+    Uses apsw when it is installed, which skips the sqlite3 module's
+    per-row conversion layer, and falls back to the stdlib sqlite3 module.
+
+    Args:
+        db_path: Path to the database file
+        immutable: The file cannot change while open (e.g. a private temp
+            copy), so SQLite may skip file locking and change detection
+    """
+    uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+    if immutable:
+        uri += '&immutable=1'
+    try:
+        import apsw
+    except ImportError:
+        return sqlite3.connect(uri, uri=True)
+    return apsw.Connection(uri, flags=apsw.SQLITE_OPEN_READONLY | apsw.SQLITE_OPEN_URI)
+
+
+def _decode_text(value: Optional[bytes]) -> str:
+    """Decode a TEXT column fetched as a BLOB."""
+    if not value:
+        return ''
+    return value.decode('utf-8', 'replace')
+
+
+def _find_zip_prefix(zip_file: zipfile.ZipFile) -> str:
+    """Get the prefix path inside a backup ZIP (if files are in a subdirectory)."""
+    # Check if Manifest.db is at root or in a subdirectory; iterate the
+    # archive's own name index rather than copying it with namelist()
+    for name in zip_file.NameToInfo:
+        if name == 'Manifest.db':
+            return ""
+        if name.endswith('/Manifest.db'):
+            return name[:-len('Manifest.db')]
+    return ""
+
+
+def member_path(backup: iOSBackup, backup_file: BackupFile) -> str:
+    """Path of a file's data within the backup, as get_file_stream() opens it.
+
+    For a ZIP backup this is the member name in the archive, including any
+    folder the backup is nested in; for a directory backup it is relative
+    to the backup directory.
+    """
+    file_id = backup_file.file_id
+    if file_id.startswith('magnet_fs:'):
+        # Magnet Filesystem/ entries are stored directly in the ZIP
+        return file_id[len('magnet_fs:'):]
+    # Files are stored as first two chars of hash / full hash
+    file_path = f"{file_id[:2]}/{file_id}"
+    if backup.is_zipped:
+        return backup._zip_prefix + file_path
+    return file_path
+
+
 class iOSBackupParser:
     """Parser for iOS backups (iTunes-style backups)."""
 
-    def __init__(self, backup_path: str, password: Optional[str] = None):
+    def __init__(self, backup_path: str, password: Optional[str] = None,
+                 log_entries: bool = True):
         """
         Initialize the parser.
 
         Args:
             backup_path: Path to the iOS backup (directory or ZIP file)
             password: Optional password for encrypted backups
+            log_entries: Record a parsing log entry per manifest row. When
+                False only the summary counters are kept; they come out
+                the same either way.
         """
         self.backup_path = backup_path
         self._password = password
+        self.log_entries = log_entries
         self._backup_lib_handle = None
         self._zip_file: Optional[zipfile.ZipFile] = None
+        self._zip_prefix = ""  # Directory holding Manifest.db inside the ZIP
         self._is_zipped = False
         self._manifest_db_row_count = 0  # Track rows in manifest.db
         self._parsing_log = ParsingLog()  # Detailed parsing log
@@ -232,45 +526,112 @@ class iOSBackupParser:
         if self._zip_file is None and zipfile.is_zipfile(self.backup_path):
             self._zip_file = zipfile.ZipFile(self.backup_path, 'r')
             self._is_zipped = True
+            self._zip_prefix = _find_zip_prefix(self._zip_file)
 
     def _close_zip(self):
         """Close the ZIP file if open."""
         if self._zip_file is not None:
             self._zip_file.close()
             self._zip_file = None
+            self._zip_prefix = ""
 
     def _get_zip_prefix(self) -> str:
         """Get the prefix path inside the ZIP (if files are in a subdirectory)."""
         if not self._zip_file:
             return ""
-
-        namelist = self._zip_file.namelist()
-
-        # Check if Manifest.db is at root or in a subdirectory
-        for name in namelist:
-            if name == 'Manifest.db':
-                return ""
-            if name.endswith('/Manifest.db'):
-                return name[:-len('Manifest.db')]
-
-        return ""
+        return self._zip_prefix
 
     def _read_file_from_zip(self, filename: str) -> Optional[bytes]:
         """Read a file from the ZIP archive."""
         if not self._zip_file:
             return None
 
-        prefix = self._get_zip_prefix()
-        full_path = prefix + filename
+        info = self._zip_member_info(filename)
+        if info is None:
+            return None
+        return self._zip_file.read(info)
+
+    def _zip_member_info(self, filename: str) -> Optional[zipfile.ZipInfo]:
+        """Resolve a backup-relative filename to its ZIP member."""
+        if not self._zip_file:
+            return None
 
+        # ZipFile keeps a name -> ZipInfo dict; try with the backup's
+        # prefix first, then at the archive root
+        name_to_info = self._zip_file.NameToInfo
+        return (name_to_info.get(self._zip_prefix + filename)
+                or name_to_info.get(filename))
+
+    def _open_manifest_db(self) -> Tuple[sqlite3.Connection, Optional[str]]:
+        """
+        Open Manifest.db read-only.
+
+        Directory backups are opened in place as immutable, so SQLite takes
+        no locks and creates no -shm/-wal files in the evidence directory.
+        A Manifest.db-wal beside the database may hold transactions not yet
+        written back to it, and replaying them needs a -shm file, so in that
+        case (and always for ZIP backups) the database and any WAL are
+        copied into a private temporary directory and opened there. ZIP
+        members are streamed without buffering the whole database in
+        memory. See _connect_manifest() for the connection type.
+
+        Returns:
+            Tuple of (connection, temp directory to remove when done or None)
+        """
+        tmp_dir = None
+        conn = None
         try:
-            return self._zip_file.read(full_path)
-        except KeyError:
-            # Try without prefix
-            try:
-                return self._zip_file.read(filename)
-            except KeyError:
-                return None
+            db_path = os.path.join(self.backup_path, 'Manifest.db')
+            if self._is_zipped or os.path.isfile(db_path + '-wal'):
+                tmp_dir = tempfile.mkdtemp(prefix='mect-manifest-')
+                db_path = os.path.join(tmp_dir, 'Manifest.db')
+                if not self._copy_backup_file('Manifest.db', db_path):
+                    raise RuntimeError("Cannot read Manifest.db")
+                immutable = not self._copy_backup_file('Manifest.db-wal', db_path + '-wal')
+            elif os.path.isfile(db_path):
+                immutable = True
+            else:
+                raise RuntimeError("Cannot read Manifest.db")
+
+            conn = _connect_manifest(db_path, immutable=immutable)
+
+            # Single read-only scan: skip syncing and on-disk temp storage
+            pragmas = ["synchronous=OFF", "temp_store=MEMORY",
+                       "cache_size=-65536"]  # 64 MiB page cache
+            if tmp_dir and immutable:
+                # A private copy with no WAL to replay needs no journal
+                # either; a WAL-mode database refuses this change
+                pragmas.append("journal_mode=OFF")
+            for pragma in pragmas:
+                conn.cursor().execute(f"PRAGMA {pragma}")
+        except Exception:
+            if conn is not None:
+                conn.close()
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        return conn, tmp_dir
+
+    def _copy_backup_file(self, filename: str, dest_path: str) -> bool:
+        """Copy a file from the backup (directory or ZIP) to dest_path.
+
+        Returns:
+            True if copied, False if the backup has no such file
+        """
+        if self._is_zipped:
+            info = self._zip_member_info(filename)
+            if info is None:
+                return False
+            with self._zip_file.open(info) as src, open(dest_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+            return True
+
+        src_path = os.path.join(self.backup_path, filename)
+        if not os.path.isfile(src_path):
+            return False
+        shutil.copyfile(src_path, dest_path)
+        return True
 
     def _read_file(self, filename: str) -> Optional[bytes]:
         """Read a file from the backup (directory or ZIP)."""
@@ -278,13 +639,11 @@ class iOSBackupParser:
             return self._read_file_from_zip(filename)
         else:
             full_path = os.path.join(self.backup_path, filename)
-            if os.path.exists(full_path):
-                try:
-                    with open(full_path, 'rb') as f:
-                        return f.read()
-                except Exception:
-                    return None
-        return None
+            try:
+                with open(full_path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                return None
 
     def _find_password(self) -> Optional[str]:
         """
@@ -354,62 +713,53 @@ class iOSBackupParser:
 
     def _parse_unencrypted(self) -> List[BackupFile]:
         """Parse an unencrypted backup from Manifest.db."""
-        files = []
-
         # Initialize parsing log
         self._parsing_log = ParsingLog()
         self._parsing_log.timestamp = datetime.datetime.now().isoformat()
 
-        # Read Manifest.db content
-        db_content = self._read_file('Manifest.db')
-        if not db_content:
-            raise RuntimeError("Cannot read Manifest.db")
-
-        # SQLite requires a file, so write to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp:
-            tmp.write(db_content)
-            tmp_path = tmp.name
+        conn, tmp_dir = self._open_manifest_db()
 
         try:
-            conn = sqlite3.connect(tmp_path)
-            cursor = conn.cursor()
-
-            # Query the Files table
-            cursor.execute("""
-                SELECT fileID, domain, relativePath, flags, file
+            # Size the result list up front instead of growing it row by row
+            row_count = next(iter(conn.cursor().execute("SELECT COUNT(*) FROM Files")))[0]
+            files: List[Optional[BackupFile]] = [None] * row_count
+            i = 0
+
+            # Query the Files table. TEXT columns are fetched as raw bytes
+            # and decoded here: domains repeat across rows so each distinct
+            # one is decoded only once, and malformed UTF-8 does not abort
+            # the whole query
+            cursor = conn.cursor().execute("""
+                SELECT CAST(fileID AS BLOB), CAST(domain AS BLOB),
+                       CAST(relativePath AS BLOB), flags, file
                 FROM Files
             """)
 
-            rows = cursor.fetchall()
-            self._manifest_db_row_count = len(rows)
-            self._parsing_log.total_rows = len(rows)
-
-            for row in rows:
-                file_id, domain, relative_path, flags, file_blob = row
+            log_entries = self.log_entries
+            domains: Dict[bytes, str] = {}
+
+            # Stream rows rather than materializing every blob up front
+            for row in cursor:
+                raw_id, raw_domain, raw_path, flags, file_blob = row
+                file_id = _decode_text(raw_id)
+                relative_path = _decode_text(raw_path)
+                # Every row carries its own copy of the domain string; share
+                # one object per distinct domain across files and log entries
+                domain = domains.get(raw_domain)
+                if domain is None:
+                    domain = sys.intern(_decode_text(raw_domain))
+                    domains[raw_domain] = domain
 
                 # Parse file blob to get metadata
-                file_size = 0
-                mode = 0
-                modified_time = None
-                plist_keys = []
-
                 if file_blob:
-                    try:
-                        # The file blob is a binary plist
-                        file_info = plistlib.loads(file_blob)
-                        file_size = file_info.get('Size', 0)
-                        mode = file_info.get('Mode', 0)
-                        modified_time = file_info.get('LastModified')
-                        # Track keys for debugging size=0 cases
-                        if isinstance(file_info, dict):
-                            plist_keys = list(file_info.keys())
-                    except Exception:
-                        pass
+                    file_size, mode, modified_time = _read_file_blob(file_blob)
+                else:
+                    file_size, mode, modified_time = 0, 0, None
 
                 backup_file = BackupFile(
-                    file_id=file_id or '',
-                    domain=domain or '',
-                    relative_path=relative_path or '',
+                    file_id=file_id,
+                    domain=domain,
+                    relative_path=relative_path,
                     file_size=file_size,
                     mode=mode,
                     modified_time=modified_time,
@@ -417,35 +767,38 @@ class iOSBackupParser:
                 )
 
                 # Determine status for logging
-                if backup_file.is_directory:
-                    status = 'added_directory'
-                    details = f"flags={flags}, mode={oct(mode) if mode else 0}"
-                else:
-                    status = 'added_file'
-                    details = f"size={file_size}, flags={flags}"
-                    # For files with size=0, log the plist keys to help debug
-                    if file_size == 0 and plist_keys:
-                        details += f", plist_keys={plist_keys}"
+                status = 'added_directory' if backup_file.is_directory else 'added_file'
 
-                self._parsing_log.add_entry(
-                    file_id=file_id or '',
-                    domain=domain or '',
-                    relative_path=relative_path or '',
-                    status=status,
-                    details=details,
-                    manifest_size=file_size
-                )
+                if log_entries:
+                    self._parsing_log.add_entry(
+                        file_id=file_id,
+                        domain=domain,
+                        relative_path=relative_path,
+                        status=status,
+                        manifest_size=file_size,
+                        # Plist keys are only reported for zero-size files;
+                        # copy just the keys so the decoded plist is not kept
+                        detail_args=(flags, mode, _file_blob_keys(file_blob)
+                                     if file_size == 0 else None)
+                    )
+                else:
+                    self._parsing_log.count(status)
 
-                files.append(backup_file)
+                if i < row_count:
+                    files[i] = backup_file
+                else:
+                    files.append(backup_file)
+                i += 1
 
-            conn.close()
+            del files[i:]
+            self._manifest_db_row_count = len(files)
+            self._parsing_log.total_rows = len(files)
 
         finally:
-            # Clean up temp file
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
+            conn.close()
+            # Clean up the private copy, if one was made
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
 
         return files
 
@@ -506,21 +859,11 @@ class iOSBackupParser:
                     modified_time = None
                     file_blob = file_info.get('file')
                     if file_blob:
-                        try:
-                            file_meta = plistlib.loads(file_blob)
-                            # Metadata is in $objects[1] (NSKeyedArchiver format)
-                            objects = file_meta.get('$objects', [])
-                            if len(objects) > 1 and isinstance(objects[1], dict):
-                                attrs = objects[1]
-                                file_size = attrs.get('Size', 0)
-                                mode = attrs.get('Mode', 0)
-                                modified_time = attrs.get('LastModified')
-                        except Exception:
-                            pass
+                        file_size, mode, modified_time = _read_file_blob(file_blob)
 
                     files.append(BackupFile(
                         file_id=file_id or '',
-                        domain=domain or '',
+                        domain=sys.intern(domain) if domain else '',
                         relative_path=relative_path or '',
                         file_size=file_size,
                         mode=mode,
@@ -547,31 +890,46 @@ class iOSBackupParser:
         if progress_callback:
             progress_callback(0, total, "Reading actual file sizes...")
 
+        # Backup files are stored as {file_id[:2]}/{file_id}
+        if self._is_zipped and self._zip_file:
+            # For ZIP files, take sizes from the archive's central directory
+            name_to_info = self._zip_file.NameToInfo
+            prefix = self._zip_prefix
+
+            def actual_size(bf: BackupFile) -> Optional[int]:
+                info = name_to_info.get(f"{prefix}{bf.file_id[:2]}/{bf.file_id}")
+                return info.file_size if info is not None else None
+        else:
+            # For directory backups, list each of the (at most 256) hash-prefix
+            # directories once instead of stat-ing every file path separately
+            buckets = list({bf.file_id[:2] for bf in files_to_check})
+            dirs = [os.path.join(self.backup_path, bucket) for bucket in buckets]
+            with ThreadPoolExecutor(max_workers=SIZE_SCAN_WORKERS) as pool:
+                bucket_sizes = dict(zip(buckets, pool.map(_scan_dir_sizes, dirs)))
+
+            def actual_size(bf: BackupFile) -> Optional[int]:
+                return bucket_sizes[bf.file_id[:2]].get(bf.file_id)
+
+        log_entries = self.log_entries
         for i, bf in enumerate(files_to_check):
-            if bf.file_id:
-                # Backup files are stored as {file_id[:2]}/{file_id}
-                if self._is_zipped and self._zip_file:
-                    # For ZIP files, check the size in the archive
-                    file_path = f"{bf.file_id[:2]}/{bf.file_id}"
-                    try:
-                        info = self._zip_file.getinfo(file_path)
-                        bf.actual_file_size = info.file_size
-                    except KeyError:
-                        bf.actual_file_size = None
-                else:
-                    # For directory backups, check actual file on disk
-                    file_path = os.path.join(self.backup_path, bf.file_id[:2], bf.file_id)
-                    if os.path.exists(file_path):
-                        bf.actual_file_size = os.path.getsize(file_path)
-                    else:
-                        bf.actual_file_size = None
+            bf.actual_file_size = actual_size(bf)
 
-                # Update parsing log with actual size
-                self._parsing_log.update_actual_size(bf.file_id, bf.actual_file_size)
+            # Show the actual size on the file's log entry
+            if log_entries:
+                self._parsing_log.set_actual_size(bf.file_id, bf.actual_file_size)
 
-            if progress_callback and (i % 100 == 0 or i == total - 1):
+            if progress_callback and (i % SIZE_PROGRESS_INTERVAL == 0 or i == total - 1):
                 progress_callback(i + 1, total, f"Reading file sizes: {i + 1}/{total}")
 
+        # Tally size verification in one pass over every checked file, so
+        # the totals do not depend on whether entries were recorded (an
+        # encrypted backup has none). A mismatch with manifest size 0
+        # always means actual size > 0
+        mismatched = [bf.file_size for bf in files_to_check
+                      if bf.actual_file_size is not None and bf.actual_file_size != bf.file_size]
+        self._parsing_log.size_mismatches += len(mismatched)
+        self._parsing_log.manifest_size_zero += mismatched.count(0)
+
     def parse(self, password_callback=None, progress_callback=None) -> iOSBackup:
         """
         Parse the iOS backup.
@@ -650,6 +1008,7 @@ class iOSBackupParser:
                 parsing_log=self._parsing_log,
                 _backup_handle=backup_handle,
                 _zip_handle=self._zip_file if self._is_zipped else None,
+                _zip_prefix=self._zip_prefix,
                 _password=password
             )
 
@@ -714,12 +1073,16 @@ class iOSBackupParser:
             seen.add(domain_path)
             added += 1
 
-            self._parsing_log.add_entry(
-                file_id=file_id, domain=domain, relative_path=relative_path,
-                status='added_directory' if is_dir else 'added_file',
-                details="from Magnet Filesystem/ (AFC capture)",
-                manifest_size=info.file_size if not is_dir else 0,
-            )
+            status = 'added_directory' if is_dir else 'added_file'
+            if self.log_entries:
+                self._parsing_log.add_entry(
+                    file_id=file_id, domain=domain, relative_path=relative_path,
+                    status=status,
+                    details="from Magnet Filesystem/ (AFC capture)",
+                    manifest_size=info.file_size if not is_dir else 0,
+                )
+            else:
+                self._parsing_log.count(status)
 
         if added:
             self._parsing_log.total_rows += added
@@ -729,7 +1092,9 @@ class iOSBackupParser:
         if live_entries:
             for name in live_entries:
                 rel = name[len('Live Data/'):]
-                if rel:
+                if not rel:
+                    continue
+                if self.log_entries:
                     self._parsing_log.add_entry(
                         file_id=f'magnet_live:{name}',
                         domain='Live Data',
@@ -737,6 +1102,8 @@ class iOSBackupParser:
                         status='skipped_no_content',
                         details="Magnet Live Data (not mappable, skipped)",
                     )
+                else:
+                    self._parsing_log.count('skipped_no_content')
 
         if progress_callback:
             msg = f"Added {added} Magnet Filesystem entries"
@@ -746,33 +1113,34 @@ class iOSBackupParser:
 
         return files
 
-    def get_file_content(self, backup: iOSBackup, backup_file: BackupFile) -> Optional[bytes]:
+    def get_file_stream(self, backup: iOSBackup, backup_file: BackupFile) -> Optional[BinaryIO]:
         """
-        Get the content of a file from the backup.
+        Open a file from the backup for streaming reads.
 
         Args:
             backup: Parsed backup object
             backup_file: The file to retrieve
 
         Returns:
-            File contents as bytes, or None if unable to read
+            Binary file object (caller closes it), or None if unable to open
         """
         if backup_file.is_directory:
             return None
 
         # Handle Magnet Filesystem/ entries (stored directly in ZIP)
         if backup_file.file_id.startswith('magnet_fs:'):
-            zip_entry = backup_file.file_id[len('magnet_fs:'):]
+            zip_entry = member_path(backup, backup_file)
             if backup._zip_handle:
                 try:
-                    return backup._zip_handle.read(zip_entry)
+                    return backup._zip_handle.open(zip_entry)
                 except KeyError:
                     return None
-            # Re-open ZIP if handle not available
+            # Re-open ZIP if handle not available; the member stream keeps
+            # the archive file open until it is closed itself
             if backup.is_zipped:
                 try:
                     with zipfile.ZipFile(backup.path, 'r') as zf:
-                        return zf.read(zip_entry)
+                        return zf.open(zip_entry)
                 except Exception:
                     return None
             return None
@@ -786,30 +1154,36 @@ class iOSBackupParser:
             except Exception:
                 return None
 
-        # Construct file path within backup
-        # File is stored as first two chars of hash / full hash
-        file_path = f"{backup_file.file_id[:2]}/{backup_file.file_id}"
+        file_path = member_path(backup, backup_file)
 
         if backup.is_zipped and backup._zip_handle:
             try:
-                prefix = ""
-                namelist = backup._zip_handle.namelist()
-                # Find prefix
-                for name in namelist:
-                    if name.endswith('/Manifest.db'):
-                        prefix = name[:-len('Manifest.db')]
-                        break
-
-                return backup._zip_handle.read(prefix + file_path)
+                return backup._zip_handle.open(file_path)
             except KeyError:
                 return None
         else:
             full_path = os.path.join(backup.path, file_path)
-            if os.path.exists(full_path):
-                try:
-                    with open(full_path, 'rb') as f:
-                        return f.read()
-                except Exception:
-                    return None
+            try:
+                return open(full_path, 'rb', buffering=COPY_BUFFER_SIZE)
+            except OSError:
+                return None
 
-        return None
+    def get_file_content(self, backup: iOSBackup, backup_file: BackupFile) -> Optional[bytes]:
+        """
+        Get the content of a file from the backup.
+
+        Args:
+            backup: Parsed backup object
+            backup_file: The file to retrieve
+
+        Returns:
+            File contents as bytes, or None if unable to read
+        """
+        stream = self.get_file_stream(backup, backup_file)
+        if stream is None:
+            return None
+        try:
+            with stream:
+                return stream.read()
+        except Exception:
+            return None
@@ -11,16 +11,22 @@ The adb-data.tar is a raw tar (no ANDROID BACKUP header or zlib wrapper).
 """
 
 import os
-import io
+import gzip
+import mmap
+import struct
 import tarfile
 import zipfile
 import datetime
+import zlib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from android_backup_parser import (
     AndroidBackup, AndroidBackupFile, parse_tar_path,
-    UNMAPPABLE_TOKENS,
+    UNMAPPABLE_TOKENS, _BufferReader,
 )
 from ios_backup_parser import ParsingLog
 
@@ -29,11 +35,316 @@ from ios_backup_parser import ParsingLog
 UNMAPPABLE_DOMAINS = {'Live Data'}
 
 
+class _TarEntry(NamedTuple):
+    """The tar header fields the parser uses, plus where the data starts."""
+    name: str
+    size: int
+    mode: int
+    mtime: int
+    is_dir: bool
+    is_file: bool
+    offset: int  # Offset of the member data within the tar
+
+
+_TAR_BLOCK = 512
+# Regular file type flags (REGTYPE, AREGTYPE, CONTTYPE)
+_TAR_FILE_TYPES = (b'0', b'\0', b'7')
+# Types whose headers _scan_ustar handles; anything else (sparse files,
+# vendor extensions) is left to tarfile
+_TAR_PLAIN_TYPES = frozenset((b'0', b'\0', b'7', b'1', b'2', b'3', b'4', b'5', b'6'))
+# name, mode, uid, gid, size, mtime, chksum, typeflag, linkname, magic+version,
+# uname, gname, devmajor, devminor, prefix
+_TAR_HEADER = struct.Struct('100s8s8s8s12s12s8sc100s8s32s32s8s8s155s12x')
+_TAR_ZERO_BLOCK = bytes(_TAR_BLOCK)
+# Read size used to skip forward through sdcard.tar.gz
+_GZIP_SKIP_CHUNK = 1 << 20
+
+_SDCARD_PREFIX = 'sdcard/'
+_SDCARD_PREFIX_LEN = len(_SDCARD_PREFIX)
+_DOT_SDCARD_PREFIX = './' + _SDCARD_PREFIX
+_DOT_SDCARD_PREFIX_LEN = len(_DOT_SDCARD_PREFIX)
+_LIVE_PREFIX = 'Live Data/'
+_LIVE_PREFIX_LEN = len(_LIVE_PREFIX)
+# sdcard.tar.gz members handed from the worker thread per queue item
+_SDCARD_BATCH = 1024
+
+
+def _tar_number(field: bytes) -> int:
+    """Decode a numeric tar header field (octal or GNU base-256)."""
+    if field[0] in (0o200, 0o377):
+        n = int.from_bytes(field[1:], 'big')
+        return n - (1 << (8 * (len(field) - 1))) if field[0] == 0o377 else n
+    return int(field.split(b'\0', 1)[0].strip() or b'0', 8)
+
+
+def _tar_octal(field: bytes) -> int:
+    """Decode a numeric tar header field, trying the plain octal form first."""
+    try:
+        return int(field.rstrip(b'\0'), 8)
+    except ValueError:
+        return _tar_number(field)
+
+
+def _tar_checksum_ok(header: bytes, chksum_field: bytes) -> bool:
+    """Verify a header's unsigned checksum without summing it in Python.
+
+    The checksum is the byte sum with its own field read as spaces. The
+    low half of zlib.adler32 is 1 + the byte sum mod 65521, computed in
+    C; the exact sum is only needed when it could reach 65521, which
+    takes over 250 non-NUL bytes.
+    """
+    stored = _tar_octal(chksum_field)
+    adjust = 8 * 32 - sum(chksum_field)
+    if stored % 65521 != ((zlib.adler32(header) & 0xFFFF) - 1 + adjust) % 65521:
+        return False
+    if stored < 65521 and 255 * (_TAR_BLOCK - header.count(0)) + adjust < 65521:
+        return True
+    return stored == sum(header) + adjust
+
+
+def _tar_string(field: bytes) -> str:
+    """Decode a NUL-terminated tar header string the way tarfile does."""
+    return field.split(b'\0', 1)[0].decode('utf-8', 'surrogateescape')
+
+
+def _scan_ustar(buf) -> List[_TarEntry]:
+    """Walk the 512-byte headers of an uncompressed tar held in memory.
+
+    Reads only the fields the parser needs instead of building TarInfo
+    objects. Handles ustar/GNU headers, GNU long names and per-file PAX
+    path/size/mtime records (which Android's backup writer uses for long
+    paths). Raises tarfile.ReadError for anything else so the caller can
+    fall back to tarfile.
+    """
+    entries: List[_TarEntry] = []
+    append = entries.append
+    unpack = _TAR_HEADER.unpack
+    pos = 0
+    end = len(buf)
+    long_name = None
+    pax: Dict[str, str] = {}
+    while pos + _TAR_BLOCK <= end:
+        header = bytes(buf[pos:pos + _TAR_BLOCK])
+        if header == _TAR_ZERO_BLOCK:
+            break  # End-of-archive marker
+        (name_field, mode_field, _, _, size_field, mtime_field, chksum_field, type_flag,
+         _, magic, _, _, _, _, prefix_field) = unpack(header)
+        try:
+            if not _tar_checksum_ok(header, chksum_field):
+                raise tarfile.ReadError("bad checksum")
+            size = _tar_octal(size_field)
+        except ValueError:
+            raise tarfile.ReadError("invalid header")
+        data = pos + _TAR_BLOCK
+        pos = data + -(-size // _TAR_BLOCK) * _TAR_BLOCK
+
+        if type_flag == b'L':
+            long_name = _tar_string(bytes(buf[data:data + size]))
+            continue
+        if type_flag == b'x':
+            records = bytes(buf[data:data + size])
+            try:
+                while records:
+                    length, _, rest = records.partition(b' ')
+                    record_len = int(length)
+                    if record_len <= len(length):
+                        raise ValueError("pax record length")
+                    record = rest[:record_len - len(length) - 2]
+                    key, _, value = record.partition(b'=')
+                    pax[key.decode('utf-8')] = value.decode('utf-8', 'surrogateescape')
+                    records = records[record_len:]
+            except ValueError:
+                raise tarfile.ReadError("invalid pax header")
+            continue
+        if type_flag == b'g':
+            continue  # Global defaults; only per-file records matter here
+        if type_flag not in _TAR_PLAIN_TYPES:
+            raise tarfile.ReadError(f"unsupported member type {type_flag!r}")
+
+        if long_name is not None:
+            name = long_name
+            long_name = None
+        else:
+            name = _tar_string(name_field)
+            if magic == b'ustar\x0000' and prefix_field[0]:
+                name = f"{_tar_string(prefix_field)}/{name}"
+        mtime = _tar_octal(mtime_field)
+        if pax:
+            name = pax.get('path', name)
+            if 'size' in pax:
+                size = int(pax['size'])
+                pos = data + -(-size // _TAR_BLOCK) * _TAR_BLOCK
+            if 'mtime' in pax:
+                mtime = float(pax['mtime'])
+            pax = {}
+
+        is_dir = type_flag == b'5' or (type_flag == b'\0' and name.endswith('/'))
+        is_file = not is_dir and type_flag in _TAR_FILE_TYPES
+        if not is_file:
+            # Only regular files carry data blocks
+            pos = data
+        if is_dir:
+            name = name.rstrip('/')
+        append(_TarEntry(name, size, _tar_octal(mode_field), mtime, is_dir, is_file, data))
+    return entries
+
+
+def _tar_entry(m: tarfile.TarInfo) -> _TarEntry:
+    """Convert a TarInfo, testing its type flag directly."""
+    t = m.type
+    return _TarEntry(m.name, m.size, m.mode, m.mtime, t == tarfile.DIRTYPE,
+                     t in tarfile.REGULAR_TYPES, m.offset_data)
+
+
+def _scan_tar(buf) -> List[_TarEntry]:
+    """List the members of an uncompressed tar in memory, with a tarfile fallback."""
+    try:
+        return _scan_ustar(buf)
+    except tarfile.ReadError:
+        pass
+    with tarfile.open(fileobj=_BufferReader(buf), mode='r:') as tar:
+        return [_tar_entry(m) for m in tar]
+
+
+def _gunzip_whole(zf: zipfile.ZipFile, name: str) -> Optional[bytes]:
+    """Decompress a gzip ZIP member in one call with libdeflate, if available.
+
+    Uses the optional ``deflate`` package (libdeflate bindings), which
+    inflates roughly twice as fast as zlib. Returns None when it is not
+    installed or cannot handle the data (e.g. multi-member gzip, or
+    output over 4 GiB where the stored size wraps), so the caller can
+    fall back to streaming through gzip.
+    """
+    try:
+        import deflate
+    except ImportError:
+        return None
+    data = zf.read(name)
+    try:
+        out = deflate.gzip_decompress(data)
+    except Exception:
+        return None
+    # The gzip trailer stores the uncompressed size mod 2**32
+    if len(out) != int.from_bytes(data[-4:], 'little'):
+        return None
+    return out
+
+
+def _gzip_seek(reader: gzip.GzipFile, offset: int):
+    """Position a gzip reader, skipping forward in 1 MiB reads.
+
+    GzipFile.seek() decompresses its way forward 8 KiB at a time, which
+    dominates reads from deep inside a large sdcard.tar.gz.
+    """
+    if offset < reader.tell():
+        reader.seek(0)
+    pos = reader.tell()
+    while pos < offset:
+        skipped = len(reader.read(min(_GZIP_SKIP_CHUNK, offset - pos)))
+        if not skipped:
+            break
+        pos += skipped
+
+
+def _iter_tar_gz(zf: zipfile.ZipFile, name: str) -> Iterator[_TarEntry]:
+    """Yield the members of a gzipped tar in the ZIP in one forward pass."""
+    with zf.open(name) as raw, tarfile.open(fileobj=raw, mode='r|gz') as tar:
+        for m in tar:
+            yield _tar_entry(m)
+            # Stream mode keeps every TarInfo it has read; nothing needs them
+            tar.members.clear()
+
+
+def _tar_gz_has_members(zf: zipfile.ZipFile, name: str) -> bool:
+    """Check whether a gzipped tar in the ZIP holds any members.
+
+    Only the first header block is decompressed: an empty archive starts
+    with its zeroed end-of-archive marker.
+    """
+    with zf.open(name) as raw, gzip.GzipFile(fileobj=raw) as gz:
+        head = gz.read(_TAR_BLOCK)
+    return len(head) == _TAR_BLOCK and bool(head.strip(b'\0'))
+
+
+def _read_sdcard_members(zip_path: str, batches: queue.SimpleQueue,
+                         cancel: threading.Event) -> Optional[bytes]:
+    """Index sdcard.tar.gz through its own ZIP handle.
+
+    Runs on a worker thread alongside the adb-data.tar pass (ZipFile
+    handles are not thread-safe). Members are put on ``batches`` in lists
+    as they are read, then None. Stops early, returning None, once
+    ``cancel`` is set. Returns the decompressed archive when libdeflate
+    could inflate it in one call, else None.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            data = _gunzip_whole(zf, 'sdcard.tar.gz')
+            members = _scan_tar(data) if data is not None else _iter_tar_gz(zf, 'sdcard.tar.gz')
+            batch = []
+            for member in members:
+                batch.append(member)
+                if len(batch) == _SDCARD_BATCH:
+                    if cancel.is_set():
+                        return None
+                    batches.put(batch)
+                    batch = []
+            batches.put(batch)
+            return data
+    finally:
+        batches.put(None)
+
+
+def _drain_batches(batches: queue.SimpleQueue) -> Iterator[_TarEntry]:
+    """Yield members from _read_sdcard_members as its batches arrive."""
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        yield from batch
+
+
+def _map_stored_member(zip_path: str, info: zipfile.ZipInfo) -> Optional[memoryview]:
+    """Map an uncompressed ZIP member's data straight from the archive file.
+
+    Returns None if the member is compressed or encrypted, or its local
+    header cannot be read; the caller then reads it through ZipFile.
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    try:
+        with open(zip_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    # Skip the 30-byte local file header plus its name and extra fields
+    header = mm[info.header_offset:info.header_offset + 30]
+    if len(header) < 30 or header[:4] != b'PK\x03\x04':
+        mm.close()
+        return None
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    start = info.header_offset + 30 + name_len + extra_len
+    if start + info.file_size > len(mm):
+        mm.close()
+        return None
+    return memoryview(mm)[start:start + info.file_size]
+
+
 class MagnetQuickImageParser:
     """Parser for Magnet Acquire Quick Image ZIP files."""
 
-    def __init__(self, zip_path: str):
+    def __init__(self, zip_path: str, keep_tar_data: bool = False):
+        """
+        Initialize the parser.
+
+        Args:
+            zip_path: Path to the Quick Image ZIP, or a directory holding it
+            keep_tar_data: Keep decompressed adb-data.tar / sdcard.tar.gz
+                buffers after parsing so content reads are plain slices.
+                When False they are dropped once indexed and content is
+                read back through the ZIP on demand.
+        """
         self.zip_path = zip_path
+        self.keep_tar_data = keep_tar_data
 
     @staticmethod
     def is_magnet_quick_image(path: str) -> bool:
@@ -91,157 +402,206 @@ class MagnetQuickImageParser:
         parsing_log.timestamp = datetime.datetime.now().isoformat()
 
         files = []
-        # Track seen paths to deduplicate sdcard vs shared/0
-        seen_domain_paths = set()
+        # Parsing log rows, recorded in one batch once all sources are read
+        log_rows = []
+        # Relative paths under shared/0, to deduplicate sdcard vs shared/0.
+        # sdcard entries only ever land in shared/0, so no other domain
+        # needs tracking
+        seen_shared_paths = set()
 
         # Source tracking for content extraction:
-        #   file_id -> ('adb_tar', TarInfo) or ('sdcard_tar', TarInfo) or ('zip', zip_entry_name)
+        #   file_id -> ('adb_tar' or 'sdcard_tar', (data offset, size)) or ('zip', ZipInfo)
         source_lookup = {}
 
-        # --- 1. Parse adb-data.tar ---
-        if progress_callback:
-            progress_callback(5, 100, "Reading adb-data.tar...")
-
-        adb_tar_data = zf.read('adb-data.tar')
-        adb_tar_stream = io.BytesIO(adb_tar_data)
-        adb_tar = tarfile.open(fileobj=adb_tar_stream, mode='r:')
-        adb_members = {m.name: m for m in adb_tar.getmembers()}
-
-        if progress_callback:
-            progress_callback(20, 100, f"Processing adb-data.tar ({len(adb_members)} entries)...")
-
-        android_version = ""
-        for i, (name, member) in enumerate(adb_members.items()):
-            if progress_callback and i % 500 == 0:
-                pct = 20 + (i / max(1, len(adb_members))) * 40
-                progress_callback(int(pct), 100, f"Processing adb-data: {i}/{len(adb_members)}")
-
-            domain, token, relative_path = parse_tar_path(name)
-
-            is_dir = member.isdir()
-            mode = member.mode
-            # Ensure directory type bit is set in mode for proper is_directory detection
-            if is_dir and not (mode & 0o170000):
-                mode |= 0o040000
-            bf = AndroidBackupFile(
-                file_id=name,
-                domain=domain,
-                relative_path=relative_path,
-                file_size=0 if is_dir else member.size,
-                mode=mode,
-                modified_time=member.mtime if member.mtime else None,
-                flags=2 if is_dir else 1,
-                actual_file_size=member.size if not is_dir else None,
-                token=token,
-            )
-            files.append(bf)
-            seen_domain_paths.add(bf.full_domain_path)
-            source_lookup[name] = ('adb_tar', member)
-
-            status = 'added_directory' if is_dir else 'added_file'
-            details = f"token={token}" if token else ""
-            if token in UNMAPPABLE_TOKENS:
-                details += " (no filesystem equivalent)"
-            parsing_log.add_entry(
-                file_id=name, domain=domain, relative_path=relative_path,
-                status=status, details=details,
-                manifest_size=member.size if not is_dir else 0,
-            )
+        # sdcard.tar.gz is inflated and indexed on a worker thread while
+        # adb-data.tar is processed; its entries are merged in afterwards.
+        # If anything below raises, the worker is told to stop and joined
+        # before the exception propagates
+        sdcard_info = zf.NameToInfo.get('sdcard.tar.gz')
+        sdcard_future = None
+        sdcard_cancel = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            if (sdcard_info is not None and sdcard_info.file_size > 29  # Skip empty archives
+                    and _tar_gz_has_members(zf, 'sdcard.tar.gz')):
+                sdcard_batches = queue.SimpleQueue()
+                sdcard_future = pool.submit(
+                    _read_sdcard_members, zip_path, sdcard_batches, sdcard_cancel)
+            try:
+                # --- 1. Parse adb-data.tar ---
+                if progress_callback:
+                    progress_callback(5, 100, "Reading adb-data.tar...")
+
+                # adb-data.tar is normally stored uncompressed: map it from the ZIP
+                # so only the pages actually touched are read into memory
+                adb_tar_data = _map_stored_member(zip_path, zf.getinfo('adb-data.tar'))
+                adb_tar_mapped = adb_tar_data is not None
+                if not adb_tar_mapped:
+                    adb_tar_data = zf.read('adb-data.tar')
+                # A repeated path supersedes the earlier copy, header and all, but
+                # keeps the position where the path first appeared
+                adb_entries = list(
+                    {member.name: member for member in _scan_tar(adb_tar_data)}.values())
 
-            # Extract Android version from first _manifest
-            if not android_version and name.endswith('/_manifest') and member.isfile():
-                try:
-                    f_obj = adb_tar.extractfile(member)
-                    if f_obj:
-                        text = f_obj.read().decode('utf-8', errors='replace')
-                        f_obj.close()
-                        lines = text.strip().split('\n')
-                        if len(lines) >= 4 and lines[3].strip().isdigit():
-                            android_version = f"SDK {lines[3].strip()}"
-                except Exception:
-                    pass
-
-        # --- 2. Parse sdcard.tar.gz (extra sdcard files not in shared/0) ---
-        sdcard_tar = None
-        sdcard_tar_data = None
-        sdcard_tar_stream = None
-        if 'sdcard.tar.gz' in zf.namelist():
-            if progress_callback:
-                progress_callback(60, 100, "Reading sdcard.tar.gz...")
-
-            sdcard_tar_data = zf.read('sdcard.tar.gz')
-            if len(sdcard_tar_data) > 29:  # Skip empty archives
-                sdcard_tar_stream = io.BytesIO(sdcard_tar_data)
-                sdcard_tar = tarfile.open(fileobj=sdcard_tar_stream, mode='r:gz')
-                sdcard_members = {m.name: m for m in sdcard_tar.getmembers()}
-
-                added = 0
-                for name, member in sdcard_members.items():
-                    # Strip "sdcard/" prefix and map to shared/0 domain
-                    stripped = name.lstrip('./')
-                    if stripped.startswith('sdcard/'):
-                        rel = stripped[len('sdcard/'):]
-                    elif stripped == 'sdcard':
-                        rel = ''
-                    else:
-                        rel = stripped
-
-                    domain = 'shared/0'
-                    domain_path = f"{domain}/{rel}" if rel else domain
-
-                    # Skip if already seen from adb-data.tar
-                    if domain_path in seen_domain_paths:
-                        continue
-
-                    is_dir = member.isdir()
-                    mode = member.mode
-                    if is_dir and not (mode & 0o170000):
-                        mode |= 0o040000
-                    file_id = f"sdcard_tar:{name}"
+                if progress_callback:
+                    progress_callback(
+                        20, 100, f"Processing adb-data.tar ({len(adb_entries)} entries)...")
+
+                # Content is later sliced straight out of adb_tar_data using the
+                # (offset, size) kept in source_lookup
+                android_version = ""
+                for i, member in enumerate(adb_entries):
+                    name = member.name
+                    if progress_callback and i % 500 == 0:
+                        pct = 20 + (i / max(1, len(adb_entries))) * 40
+                        progress_callback(
+                            int(pct), 100, f"Processing adb-data: {i}/{len(adb_entries)}")
+
+                    domain, token, relative_path = parse_tar_path(name)
+
+                    is_dir = member.is_dir
+                    size = 0 if is_dir else member.size
+                    # Ensure directory type bit is set in mode for proper is_directory detection
+                    mode = member.mode | 0o040000 * (is_dir and not member.mode & 0o170000)
                     bf = AndroidBackupFile(
-                        file_id=file_id,
+                        file_id=name,
                         domain=domain,
-                        relative_path=rel,
-                        file_size=0 if is_dir else member.size,
+                        relative_path=relative_path,
+                        file_size=size,
                         mode=mode,
-                        modified_time=member.mtime if member.mtime else None,
+                        modified_time=member.mtime or None,
                         flags=2 if is_dir else 1,
-                        actual_file_size=member.size if not is_dir else None,
-                        token='',
+                        actual_file_size=None if is_dir else size,
+                        token=token,
                     )
                     files.append(bf)
-                    seen_domain_paths.add(domain_path)
-                    source_lookup[file_id] = ('sdcard_tar', member)
-                    added += 1
-
-                    parsing_log.add_entry(
-                        file_id=file_id, domain=domain, relative_path=rel,
-                        status='added_directory' if is_dir else 'added_file',
-                        details="from sdcard.tar.gz",
-                        manifest_size=member.size if not is_dir else 0,
-                    )
-
-                if progress_callback:
-                    progress_callback(70, 100, f"Added {added} extra files from sdcard.tar.gz")
+                    if domain == 'shared/0':
+                        seen_shared_paths.add(relative_path)
+                    source_lookup[name] = ('adb_tar', (member.offset, member.size))
+
+                    status = 'added_directory' if is_dir else 'added_file'
+                    details = f"token={token}" if token else ""
+                    if token in UNMAPPABLE_TOKENS:
+                        details += " (no filesystem equivalent)"
+                    log_rows.append((name, domain, relative_path, status, details, size))
+
+                    # Extract Android version from first _manifest
+                    if not android_version and name.endswith('/_manifest') and member.is_file:
+                        try:
+                            # The SDK version is on the 4th line; the head is enough
+                            end = member.offset + min(member.size, 512)
+                            head = bytes(adb_tar_data[member.offset:end])
+                            lines = head.decode('utf-8', errors='replace').strip().split('\n', 4)
+                            if len(lines) >= 4 and lines[3].strip().isdigit():
+                                android_version = f"SDK {lines[3].strip()}"
+                        except Exception:
+                            pass
+
+                # --- 2. Parse sdcard.tar.gz (extra sdcard files not in shared/0) ---
+                sdcard_tar_data = None
+                if sdcard_info is not None:
+                    if progress_callback:
+                        progress_callback(60, 100, "Reading sdcard.tar.gz...")
+
+                    if sdcard_future is not None:
+                        # Merge members as the worker reads them, so the rest of the
+                        # decompression overlaps this loop
+                        added = 0
+                        # file_id -> (index in files, index in log_rows), so a later
+                        # copy of a path can replace the earlier one's records
+                        sdcard_slots = {}
+                        for member in _drain_batches(sdcard_batches):
+                            name = member.name
+                            file_id = f"sdcard_tar:{name}"
+                            slots = sdcard_slots.get(file_id)
+
+                            # Strip "sdcard/" prefix and map to shared/0 domain. The
+                            # usual spellings are sliced directly; otherwise only a
+                            # literal "./" is dropped so names like ".thumbnails" survive
+                            if name.startswith(_SDCARD_PREFIX):
+                                rel = name[_SDCARD_PREFIX_LEN:]
+                            elif name.startswith(_DOT_SDCARD_PREFIX):
+                                rel = name[_DOT_SDCARD_PREFIX_LEN:]
+                            else:
+                                rel = (name[2:] if name.startswith('./') else name).lstrip('/')
+                                if rel.startswith(_SDCARD_PREFIX):
+                                    rel = rel[_SDCARD_PREFIX_LEN:]
+                                elif rel == 'sdcard':
+                                    rel = ''
+
+                            domain = 'shared/0'
+
+                            # Skip if already seen from adb-data.tar
+                            if slots is None and rel in seen_shared_paths:
+                                continue
+
+                            is_dir = member.is_dir
+                            size = 0 if is_dir else member.size
+                            mode = member.mode | 0o040000 * (is_dir and not member.mode & 0o170000)
+                            bf = AndroidBackupFile(
+                                file_id=file_id,
+                                domain=domain,
+                                relative_path=rel,
+                                file_size=size,
+                                mode=mode,
+                                modified_time=member.mtime or None,
+                                flags=2 if is_dir else 1,
+                                actual_file_size=None if is_dir else size,
+                                token='',
+                            )
+                            log_row = (file_id, domain, rel,
+                                       'added_directory' if is_dir else 'added_file',
+                                       "from sdcard.tar.gz", size)
+                            source_lookup[file_id] = ('sdcard_tar', (member.offset, member.size))
+
+                            if slots is None:
+                                sdcard_slots[file_id] = (len(files), len(log_rows))
+                                files.append(bf)
+                                log_rows.append(log_row)
+                                seen_shared_paths.add(rel)
+                                added += 1
+                            else:
+                                # A later copy of the same path supersedes the earlier one
+                                files[slots[0]] = bf
+                                log_rows[slots[1]] = log_row
+
+                        # With libdeflate the archive comes back decompressed and
+                        # content is sliced from it; otherwise content is read later
+                        # through a lazily opened gzip reader
+                        sdcard_tar_data = sdcard_future.result()
+
+                        if progress_callback:
+                            progress_callback(
+                                70, 100, f"Added {added} extra files from sdcard.tar.gz")
+            finally:
+                sdcard_cancel.set()
+
+        if not self.keep_tar_data:
+            # Decompressed copies are only needed to index the archives; a
+            # mapped adb-data.tar is backed by the file, not the heap
+            if not adb_tar_mapped:
+                adb_tar_data = None
+            sdcard_tar_data = None
 
         # --- 3. Parse Live Data/ entries from ZIP ---
         if progress_callback:
             progress_callback(75, 100, "Processing Live Data...")
 
-        live_data_entries = [n for n in zf.namelist() if n.startswith('Live Data/')]
-        for name in live_data_entries:
-            info = zf.getinfo(name)
+        for info in zf.infolist():
+            name = info.filename
+            if not name.startswith(_LIVE_PREFIX):
+                continue
             # Strip "Live Data/" prefix for relative path
-            rel = name[len('Live Data/'):]
+            rel = name[_LIVE_PREFIX_LEN:]
             if not rel:
                 continue
 
             is_dir = name.endswith('/')
+            rel = rel.rstrip('/')
             file_id = f"zip:{name}"
             bf = AndroidBackupFile(
                 file_id=file_id,
                 domain='Live Data',
-                relative_path=rel.rstrip('/'),
+                relative_path=rel,
                 file_size=0 if is_dir else info.file_size,
                 mode=0o040755 if is_dir else 0o100644,
                 flags=2 if is_dir else 1,
@@ -249,13 +609,13 @@ class MagnetQuickImageParser:
                 token='',
             )
             files.append(bf)
-            source_lookup[file_id] = ('zip', name)
+            if not is_dir:
+                # Keep the ZipInfo so reading content needs no name lookup
+                source_lookup[file_id] = ('zip', info)
 
-            parsing_log.add_entry(
-                file_id=file_id, domain='Live Data', relative_path=rel.rstrip('/'),
-                status='added_directory' if is_dir else 'added_file',
-                details="Live Data (agent-captured, not mappable)",
-            )
+            log_rows.append((file_id, 'Live Data', rel,
+                             'added_directory' if is_dir else 'added_file',
+                             "Live Data (agent-captured, not mappable)", 0))
 
         # --- 4. Extract device info from image_info.txt ---
         device_name = "Magnet Quick Image"
@@ -272,6 +632,7 @@ class MagnetQuickImageParser:
             except Exception:
                 pass
 
+        parsing_log.add_entries(log_rows)
         parsing_log.total_rows = len(files)
 
         if progress_callback:
@@ -287,14 +648,16 @@ class MagnetQuickImageParser:
             format_version=0,
             android_version=android_version,
             backup_type='android',
-            _backup_handle=adb_tar,
+            _backup_handle=None,  # adb-data.tar content comes from _tar_data or the ZIP
             _tar_data=adb_tar_data,
             _member_lookup={},  # Not used directly; we use source_lookup instead
         )
 
         # Attach extra handles for content extraction
         backup._magnet_source_lookup = source_lookup
-        backup._magnet_sdcard_tar = sdcard_tar
+        backup._magnet_adb_tar = None  # ZIP member reader, opened on first use
+        backup._magnet_sdcard_tar = None  # gzip reader, opened on first use
+        backup._magnet_sdcard_raw = None  # ZIP member stream under the gzip reader
         backup._magnet_sdcard_tar_data = sdcard_tar_data
         backup._magnet_zip = zf
 
@@ -305,7 +668,15 @@ class MagnetQuickImageParser:
 
     @staticmethod
     def get_file_content(backup: AndroidBackup, backup_file: AndroidBackupFile) -> Optional[bytes]:
-        """Get file content from the appropriate source within the Magnet image."""
+        """Get file content from the appropriate source within the Magnet image.
+
+        The ZIP member readers opened here stay on the backup until
+        AndroidBackup.close(). Unless the parse kept the decompressed
+        sdcard.tar.gz, its members are read through one gzip stream, which
+        only moves forward cheaply: a member lying before the last one read
+        means inflating again from the start of the archive. Extracting
+        many sdcard files is therefore fastest in archive order.
+        """
         if backup_file.is_directory:
             return None
 
@@ -320,19 +691,29 @@ class MagnetQuickImageParser:
         source_type, source_ref = entry
         try:
             if source_type == 'adb_tar':
-                f_obj = backup._backup_handle.extractfile(source_ref)
-                if f_obj:
-                    data = f_obj.read()
-                    f_obj.close()
-                    return data
+                offset, size = source_ref
+                if backup._tar_data is not None:
+                    return bytes(backup._tar_data[offset:offset + size])
+                adb_tar = getattr(backup, '_magnet_adb_tar', None)
+                if adb_tar is None:
+                    adb_tar = backup._magnet_zip.open('adb-data.tar')
+                    backup._magnet_adb_tar = adb_tar
+                adb_tar.seek(offset)
+                return adb_tar.read(size)
             elif source_type == 'sdcard_tar':
+                offset, size = source_ref
+                sdcard_tar_data = getattr(backup, '_magnet_sdcard_tar_data', None)
+                if sdcard_tar_data is not None:
+                    return bytes(sdcard_tar_data[offset:offset + size])
                 sdcard_tar = getattr(backup, '_magnet_sdcard_tar', None)
-                if sdcard_tar:
-                    f_obj = sdcard_tar.extractfile(source_ref)
-                    if f_obj:
-                        data = f_obj.read()
-                        f_obj.close()
-                        return data
+                if sdcard_tar is None:
+                    # GzipFile does not close a stream it was handed, so the
+                    # ZIP member reader is kept for AndroidBackup.close()
+                    backup._magnet_sdcard_raw = backup._magnet_zip.open('sdcard.tar.gz')
+                    sdcard_tar = gzip.GzipFile(fileobj=backup._magnet_sdcard_raw)
+                    backup._magnet_sdcard_tar = sdcard_tar
+                _gzip_seek(sdcard_tar, offset)
+                return sdcard_tar.read(size)
             elif source_type == 'zip':
                 magnet_zip = getattr(backup, '_magnet_zip', None)
                 if magnet_zip:
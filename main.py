@@ -7,16 +7,24 @@ filesystem acquisitions, helping forensic analysts understand the mapping
 between backup structures and the actual device filesystem.
 """
 
+import io
 import os
 import sys
+import time
+import queue
 import hashlib
 import tkinter as tk
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import attrgetter, contains
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from ios_backup_parser import iOSBackupParser, iOSBackup, BackupFile
+from ios_backup_parser import iOSBackupParser, iOSBackup, BackupFile, member_path
 from android_backup_parser import AndroidBackupParser, AndroidBackup, AndroidBackupFile
 from magnet_parser import MagnetQuickImageParser
 from filesystem_loader import FilesystemLoader, FilesystemAcquisition, FilesystemFile
@@ -24,6 +32,7 @@ from path_mapper import PathMapper, PathMapping, MappingStatus, MappingStatistic
 from android_path_mapper import AndroidPathMapper
 from filesystem_mapper import FilesystemMapper, FilesystemAsBackup
 from alex_parser import ALEXParser
+from hash_cache import HashCache, cache_key
 
 
 class ToolTip:
@@ -160,32 +169,75 @@ class StatusBar(ttk.Frame):
         # Progress bar (hidden by default)
         self.progress = ttk.Progressbar(self, mode='determinate', length=200)
         self._progress_visible = False
+        self._last_flush = 0.0
+        # Last values handed to Tk, so repeats of them are not sent again
+        self._status_text = "Ready"
+        self._progress_value = 0
+        self._progress_maximum = 100
+        self._dirty = False  # Something changed since the last redraw
 
-    def set_status(self, text: str):
-        self.status_var.set(text)
-        self.update_idletasks()
+    # Minimum time between redraws forced by status/progress updates (~30 Hz)
+    _FLUSH_INTERVAL = 1 / 30
+
+    def _flush(self, force: bool = False):
+        """Redraw pending changes, at most once per _FLUSH_INTERVAL unless forced.
+
+        Without force, nothing is redrawn unless a value actually changed.
+        """
+        if not (force or self._dirty):
+            return
+        now = time.monotonic()
+        if force or now - self._last_flush >= self._FLUSH_INTERVAL:
+            self.update_idletasks()
+            self._last_flush = now
+            self._dirty = False
+
+    def _set_text(self, text: str):
+        if text != self._status_text:
+            self.status_var.set(text)
+            self._status_text = text
+            self._dirty = True
+
+    def _set_value(self, value, maximum=None):
+        changes = {}
+        if maximum is not None and maximum != self._progress_maximum:
+            changes['maximum'] = self._progress_maximum = maximum
+        if value != self._progress_value:
+            changes['value'] = self._progress_value = value
+        if changes:
+            self.progress.configure(**changes)
+            self._dirty = True
+
+    def set_status(self, text: str, force: bool = False):
+        self._set_text(text)
+        self._flush(force)
 
     def show_progress(self, maximum: int = 100):
         """Show the progress bar and set its maximum value."""
         if not self._progress_visible:
             self.progress.pack(side=tk.RIGHT, padx=5)
             self._progress_visible = True
-        self.progress.configure(maximum=maximum, value=0)
-        self.update_idletasks()
+        self._set_value(0, maximum)
+        self._flush(force=True)
 
-    def set_progress(self, value: int, maximum: int = None):
+    def set_progress(self, value: int, maximum: int = None, force: bool = False):
         """Update progress bar value."""
-        if maximum is not None:
-            self.progress.configure(maximum=maximum)
-        self.progress.configure(value=value)
-        self.update_idletasks()
+        self._set_value(value, maximum)
+        self._flush(force)
+
+    def report(self, text: str, value=None, maximum: int = None):
+        """Update the status text and progress value together, redrawing once."""
+        self._set_text(text)
+        if value is not None:
+            self._set_value(value, maximum)
+        self._flush()
 
     def hide_progress(self):
         """Hide the progress bar."""
         if self._progress_visible:
             self.progress.pack_forget()
             self._progress_visible = False
-            self.update_idletasks()
+            self._flush(force=True)
 
 
 class StatisticsPanel(ttk.LabelFrame):
@@ -196,6 +248,10 @@ class StatisticsPanel(ttk.LabelFrame):
         self.labels: Dict[str, ttk.Label] = {}
         self.on_view_parsing_log = on_view_parsing_log
         self._parsing_log = None
+        # Row labels of the grid currently shown, and the variables holding
+        # their values, so a re-map with the same rows only updates text
+        self._layout: Optional[tuple] = None
+        self._stat_vars: Dict[str, tk.StringVar] = {}
         self._create_widgets()
 
     def _create_widgets(self):
@@ -215,17 +271,7 @@ class StatisticsPanel(ttk.LabelFrame):
         """Update the statistics display with a compact two-column layout."""
         self._parsing_log = parsing_log
 
-        # Clear existing content
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
-
-        columns_frame = ttk.Frame(self.stats_frame)
-        columns_frame.pack(fill=tk.BOTH, expand=True)
-
         # --- Left column: Counts ---
-        left = ttk.Frame(columns_frame)
-        left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-
         left_data = [
             ("Manifest.db Rows:", str(stats.manifest_db_row_count)),
         ]
@@ -239,12 +285,7 @@ class StatisticsPanel(ttk.LabelFrame):
             ("Filesystem:", f"{stats.total_filesystem_files} files, {stats.total_filesystem_directories} dirs"),
         ])
 
-        self._fill_grid(left, left_data)
-
         # --- Right column: Mapping results ---
-        right = ttk.Frame(columns_frame)
-        right.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
-
         total = max(1, stats.total_backup_files)
         right_data = [
             ("Mapped:", f"{stats.mapped_files} ({stats.mapped_files / total * 100:.1f}%)",
@@ -262,6 +303,29 @@ class StatisticsPanel(ttk.LabelFrame):
              "Percentage of filesystem files that are represented in the backup (Mapped / Total Filesystem Files)."),
         ]
 
+        # Same rows as last time: just update the values in place
+        layout = (tuple(item[0] for item in left_data), tuple(item[0] for item in right_data))
+        if layout == self._layout:
+            for label_text, value_text, *_ in left_data + right_data:
+                if label_text:
+                    self._stat_vars[label_text].set(value_text)
+            return
+
+        # Clear existing content
+        for widget in self.stats_frame.winfo_children():
+            widget.destroy()
+        self._stat_vars.clear()
+        self._layout = layout
+
+        columns_frame = ttk.Frame(self.stats_frame)
+        columns_frame.pack(fill=tk.BOTH, expand=True)
+
+        left = ttk.Frame(columns_frame)
+        left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        self._fill_grid(left, left_data)
+
+        right = ttk.Frame(columns_frame)
+        right.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         self._fill_grid(right, right_data)
 
         # View Parsing Log button
@@ -271,8 +335,7 @@ class StatisticsPanel(ttk.LabelFrame):
                 command=self._show_parsing_log
             ).pack(anchor=tk.W, padx=5, pady=(5, 0))
 
-    @staticmethod
-    def _fill_grid(parent, data):
+    def _fill_grid(self, parent, data):
         """Populate a frame with label/value rows. Each item is (label, value) or (label, value, tooltip)."""
         for row, item in enumerate(data):
             label_text = item[0]
@@ -286,7 +349,9 @@ class StatisticsPanel(ttk.LabelFrame):
             else:
                 lbl = ttk.Label(parent, text=label_text)
                 lbl.grid(row=row, column=0, sticky='w', padx=(2, 5))
-                val = ttk.Label(parent, text=value_text)
+                var = tk.StringVar(value=value_text)
+                self._stat_vars[label_text] = var
+                val = ttk.Label(parent, textvariable=var)
                 val.grid(row=row, column=1, sticky='e', padx=(0, 2))
                 if tooltip_text:
                     ToolTip(lbl, tooltip_text)
@@ -301,6 +366,93 @@ class StatisticsPanel(ttk.LabelFrame):
             self.on_view_parsing_log(self._parsing_log)
 
 
+class TreeNodeCache:
+    """Keeps Treeview nodes alive across filter rebuilds.
+
+    Nodes are looked up by a caller-chosen key and only inserted the first
+    time they are needed. A rebuild describes which children each parent
+    should show, and show() relinks them with a single set_children call,
+    leaving hidden nodes detached for later reuse.
+    """
+
+    def __init__(self, tree: ttk.Treeview):
+        self.tree = tree
+        self.nodes: Dict[object, str] = {}  # key -> node_id
+        self._shown: Dict[str, List[str]] = {}  # parent -> children currently shown
+        self._detached: set = set()  # Top nodes of detached subtrees
+        self._options: Dict[str, dict] = {}  # node_id -> last configured options
+        self._next_iid: int = 0  # Counter for the node ids handed to Tk
+        self._parents: Dict[str, str] = {}  # node_id -> parent node_id
+        self._root_held: bool = False  # New top-level nodes start detached
+
+    def node(self, key, parent: str, text: str, **options) -> str:
+        """Return the node for key, inserting it under parent if it is new."""
+        node_id = self.nodes.get(key)
+        if node_id is None:
+            # Passing our own iid spares Tk generating and checking a unique name
+            node_id = self.tree.insert(parent, 'end', iid=f"n{self._next_iid}", text=text, **options)
+            self._next_iid += 1
+            self.nodes[key] = node_id
+            self._parents[node_id] = parent
+            if parent == '' and self._root_held:
+                self.tree.detach(node_id)
+                self._detached.add(node_id)
+            else:
+                self._shown.setdefault(parent, []).append(node_id)
+            if options:
+                self._options[node_id] = dict(options, text=text)
+        return node_id
+
+    def configure(self, node_id: str, **options):
+        """Update a node's options, skipping the call if nothing changed."""
+        last = self._options.setdefault(node_id, {})
+        if any(name not in last or last[name] != value for name, value in options.items()):
+            self.tree.item(node_id, **options)
+            last.update(options)
+
+    def open_ancestors(self, node_id: str):
+        """Open every ancestor of a node, without asking Tk for its parents."""
+        parent = self._parents.get(node_id)
+        while parent:
+            self.configure(parent, open=True)
+            parent = self._parents.get(parent)
+
+    def hold_root(self):
+        """Hide the whole tree until the next show('', ...).
+
+        Top-level nodes inserted meanwhile start out detached too, so a
+        build that redraws part way through, to report progress, does not
+        have Tk lay out the growing tree on every redraw.
+        """
+        self.show('', ())
+        self._root_held = True
+
+    def show(self, parent: str, children):
+        """Make children (in order) the only visible children of parent."""
+        if parent == '':
+            self._root_held = False
+        children = list(children)
+        shown = self._shown.get(parent, [])
+        if children == shown:
+            return
+        self.tree.set_children(parent, *children)
+        self._shown[parent] = children
+        self._detached.difference_update(children)
+        self._detached.update(set(shown).difference(children))
+
+    def reset(self):
+        """Delete every node, attached or not."""
+        doomed = self.tree.get_children() + tuple(self._detached)
+        if doomed:
+            self.tree.delete(*doomed)
+        self.nodes.clear()
+        self._parents.clear()
+        self._shown.clear()
+        self._detached.clear()
+        self._options.clear()
+        self._root_held = False
+
+
 class BackupTreeView(ttk.Frame):
     """Tree view for iOS backup files organized by domain."""
 
@@ -310,9 +462,26 @@ class BackupTreeView(ttk.Frame):
         self.on_extract_callback = on_extract_callback
         self.backup: Optional[iOSBackup] = None
         self.file_nodes: Dict[str, BackupFile] = {}  # node_id -> BackupFile
-        self._all_items: List[Tuple[str, str, BackupFile]] = []  # (node_id, display_path, BackupFile)
-        self._unmapped_files: set = set()  # Set of BackupFile objects that are unmapped
-        self._programmatic_selection: bool = False  # Flag to prevent callback during programmatic selection
+        self._bf_to_node: Dict[int, str] = {}  # id(BackupFile) -> node_id, visible files only
+        self._all_items: List[BackupFile] = []  # All non-directory files for filtering
+        self._lower_paths: List[str] = []  # Lowercased display paths, aligned with _all_items
+        self._path_parts: List[List[str]] = []  # Split relative paths, aligned with _all_items
+        self._file_index: Dict[int, int] = {}  # id(BackupFile) -> position in _all_items
+        self._unmapped_mask: bytearray = bytearray()  # 1 per _all_items position that is unmapped
+        self._extra_mask: bytearray = bytearray()  # 1 per _all_items position from an extra source
+        # The filter index is built on a worker thread and handed back through
+        # _load_queue; until it arrives, unmapped files are held in _pending_unmapped
+        self._load_queue: queue.Queue = queue.Queue()
+        self._load_after_id: Optional[str] = None
+        self._indexed_backup = None  # Backup whose index is installed
+        self._pending_unmapped: Optional[List[BackupFile]] = None
+        # Collapsed domain nodes whose children are inserted on first open:
+        # node_id -> files, and (is_extra, domain) -> node_id
+        self._pending_domains: Dict[str, List[BackupFile]] = {}
+        self._domain_nodes: Dict[Tuple[bool, str], str] = {}
+        self._filter_after_id: Optional[str] = None  # Pending debounced filter rebuild
+        # Node selected from code; its queued <<TreeviewSelect>> skips the callback
+        self._programmatic_node: Optional[str] = None
         self._create_widgets()
 
     def _create_widgets(self):
@@ -341,7 +510,7 @@ class BackupTreeView(ttk.Frame):
         self.unmapped_checkbox = ttk.Checkbutton(
             filter_frame, text="Unmapped only",
             variable=self.unmapped_only_var,
-            command=self._on_filter_change
+            command=self._apply_filter
         )
         self.unmapped_checkbox.pack(side=tk.LEFT, padx=5)
 
@@ -355,6 +524,7 @@ class BackupTreeView(ttk.Frame):
         self.tree = ttk.Treeview(tree_frame, selectmode='browse')
         self.tree.heading('#0', text='Backup Files', anchor='w')
         self.tree.tag_configure('separator', foreground='gray')
+        self._node_cache = TreeNodeCache(self.tree)
 
         vsb = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
@@ -367,8 +537,9 @@ class BackupTreeView(ttk.Frame):
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
 
-        # Bind selection event
+        # Bind selection and expansion events
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_open)
 
         # Action buttons frame
         action_frame = ttk.Frame(self)
@@ -387,19 +558,36 @@ class BackupTreeView(ttk.Frame):
         if selected and self.on_extract_callback:
             self.on_extract_callback(selected)
 
+    def _on_open(self, event):
+        """Fill in a domain's files the first time it is expanded."""
+        node_id = self.tree.focus()
+        if node_id in self._pending_domains:
+            self._populate_domain(node_id)
+
+    # Delay before a filter edit rebuilds the tree, so typing only rebuilds once
+    _FILTER_DELAY_MS = 250
+
     def _on_filter_change(self, *args):
-        """Handle filter text changes."""
-        self._apply_filter()
+        """Handle filter text changes, rebuilding once typing pauses."""
+        self._cancel_filter_rebuild()
+        self._filter_after_id = self.after(self._FILTER_DELAY_MS, self._apply_filter)
+
+    def _cancel_filter_rebuild(self):
+        """Drop a pending debounced filter rebuild."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
 
     def _on_select(self, event):
         selection = self.tree.selection()
+        programmatic_node, self._programmatic_node = self._programmatic_node, None
         if selection:
             node_id = selection[0]
             backup_file = self.file_nodes.get(node_id)
             if backup_file:
                 self.extract_btn.configure(state='normal')
                 # Only call callback if this is a user-initiated selection
-                if self.on_select_callback and not self._programmatic_selection:
+                if self.on_select_callback and node_id != programmatic_node:
                     self.on_select_callback(backup_file)
             else:
                 self.extract_btn.configure(state='disabled')
@@ -410,12 +598,21 @@ class BackupTreeView(ttk.Frame):
         """Load and display a backup in the tree."""
         self.backup = backup
         self.file_nodes.clear()
-        self._all_items.clear()
+        self._bf_to_node.clear()
+        self._pending_domains.clear()
+        self._domain_nodes.clear()
+        self._all_items = []
+        self._lower_paths = []
+        self._path_parts = []
+        self._file_index = {}
+        self._unmapped_mask = bytearray()
+        self._extra_mask = bytearray()
+        self._indexed_backup = None
+        self._pending_unmapped = None
         self.filter_var.set("")  # Clear filter
 
         # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._node_cache.reset()
 
         # Update header based on backup type
         bt = getattr(backup, 'backup_type', None)
@@ -442,21 +639,69 @@ class BackupTreeView(ttk.Frame):
             info_text += " [Encrypted]"
         self.info_var.set(info_text)
 
-        # Store all files for filtering
+        # Index all files for filtering in the background; the tree is
+        # built once the index comes back
+        self._cancel_filter_rebuild()
+        self.filter_count_var.set("Indexing files...")
+        threading.Thread(target=self._index_worker, args=(backup,), daemon=True).start()
+        if self._load_after_id is None:
+            self._load_after_id = self.after(self._LOAD_POLL_MS, self._drain_load_queue)
+
+    # Interval between checks for a finished background index
+    _LOAD_POLL_MS = 50
+
+    def _index_worker(self, backup):
+        """Build the filter index for a backup off the Tk thread."""
+        all_items = []
+        lower_paths = []
+        path_parts = []
+        file_index = {}
+        extra_mask = bytearray()
         for bf in backup.files:
             if not bf.is_directory:
-                display_path = bf.full_domain_path
-                self._all_items.append((None, display_path, bf))
+                file_index[id(bf)] = len(all_items)
+                all_items.append(bf)
+                lower_paths.append(bf.full_domain_path.lower())
+                path_parts.append(bf.relative_path.split('/') if bf.relative_path else [])
+                extra_mask.append(self._is_extra_source(bf))
+        self._load_queue.put((backup, all_items, lower_paths, path_parts, file_index, extra_mask))
+
+    def _drain_load_queue(self):
+        """Install a finished filter index and build the tree from it."""
+        self._load_after_id = None
+        while True:
+            try:
+                backup, all_items, lower_paths, path_parts, file_index, extra_mask = self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if backup is not self.backup:
+                continue  # Superseded by a later load or a clear
+            self._all_items = all_items
+            self._lower_paths = lower_paths
+            self._path_parts = path_parts
+            self._file_index = file_index
+            self._extra_mask = extra_mask
+            self._unmapped_mask = bytearray(len(all_items))
+            self._indexed_backup = backup
+            if self._pending_unmapped is not None:
+                self.set_unmapped_files(self._pending_unmapped)
+                self._pending_unmapped = None
+            self._apply_filter()
+            return
 
-        # Build the tree
-        self._build_tree(backup.files)
-
-        # Update filter count
-        self.filter_count_var.set(f"{len(self._all_items)} files")
+        if self.backup is not None and self._indexed_backup is not self.backup:
+            self._load_after_id = self.after(self._LOAD_POLL_MS, self._drain_load_queue)
 
     def set_unmapped_files(self, unmapped_files: List[BackupFile]):
         """Set the list of unmapped files for filtering."""
-        self._unmapped_files = set(id(bf) for bf in unmapped_files)
+        if self._indexed_backup is not self.backup:
+            self._pending_unmapped = unmapped_files
+            return
+        self._unmapped_mask = bytearray(len(self._all_items))
+        for bf in unmapped_files:
+            index = self._file_index.get(id(bf))
+            if index is not None:
+                self._unmapped_mask[index] = 1
 
     # File ID prefixes that indicate extra (non-core-backup) sources
     _EXTRA_PREFIXES = ('magnet_fs:', 'sdcard_tar:', 'zip:')
@@ -487,84 +732,129 @@ class BackupTreeView(ttk.Frame):
         return ""
 
     def _build_domain_nodes(self, domain_files_map: Dict[str, list], filter_lower: str,
-                            annotate_source: bool = False):
-        """Build domain nodes with directory structure for a group of files."""
+                            annotate_source: bool = False) -> List[str]:
+        """Build domain nodes for a group of files and return them in order.
+
+        Unfiltered domains start collapsed with a placeholder child and get
+        their directory structure when first opened; filtered results are
+        shown expanded, so they are filled in straight away.
+        """
+        cache = self._node_cache
+        open_domain = bool(filter_lower)
+        domain_nodes = []
         for domain in sorted(domain_files_map.keys()):
             domain_files = domain_files_map[domain]
 
             # Create domain node label
             suffix = self._source_suffix(domain_files) if annotate_source else ""
             label = f"{domain}{suffix} ({len(domain_files)} files)"
-            domain_node = self.tree.insert('', 'end', text=label, open=bool(filter_lower))
+            domain_node = cache.node((annotate_source, domain), '', label, open=open_domain)
+            cache.configure(domain_node, text=label, open=open_domain)
+            self._domain_nodes[(annotate_source, domain)] = domain_node
+            self._pending_domains[domain_node] = domain_files
+            domain_nodes.append(domain_node)
+
+            if filter_lower:
+                self._populate_domain(domain_node)
+            else:
+                placeholder = cache.node(('placeholder', domain_node), domain_node, "\u2026")
+                cache.show(domain_node, (placeholder,))
+        return domain_nodes
 
-            # Build directory structure within domain
-            dir_tree: Dict[str, str] = {}  # path -> node_id
+    def _populate_domain(self, domain_node: str):
+        """Show the directory structure and files under a domain node."""
+        domain_files = self._pending_domains.pop(domain_node)
+        open_dirs = bool(self.filter_var.get())
+        cache = self._node_cache
 
-            for bf in sorted(domain_files, key=lambda f: f.relative_path):
-                path_parts = bf.relative_path.split('/') if bf.relative_path else []
+        # parent node_id -> its visible children, in insertion order
+        layout: Dict[str, Dict[str, None]] = {domain_node: {}}
 
-                # Create intermediate directories
-                current_path = ""
-                parent_node = domain_node
+        for bf in sorted(domain_files, key=attrgetter('relative_path')):
+            path_parts = self._path_parts[self._file_index[id(bf)]]
 
-                for i, part in enumerate(path_parts[:-1]):
-                    current_path = f"{current_path}/{part}" if current_path else part
-                    if current_path not in dir_tree:
-                        dir_node = self.tree.insert(parent_node, 'end', text=part + "/", open=bool(filter_lower))
-                        dir_tree[current_path] = dir_node
-                    parent_node = dir_tree[current_path]
+            # Create intermediate directories
+            current_path = ""
+            parent_node = domain_node
 
-                # Add file node
-                filename = path_parts[-1] if path_parts else bf.relative_path or "(root)"
-                file_node = self.tree.insert(parent_node, 'end', text=filename)
-                self.file_nodes[file_node] = bf
+            for i, part in enumerate(path_parts[:-1]):
+                current_path = f"{current_path}/{part}" if current_path else part
+                dir_node = cache.node((domain_node, current_path), parent_node, part + "/", open=open_dirs)
+                if dir_node not in layout:
+                    layout[dir_node] = {}
+                    layout[parent_node][dir_node] = None
+                    cache.configure(dir_node, open=open_dirs)
+                parent_node = dir_node
 
-    def _build_tree(self, files: List[BackupFile], filter_text: str = ""):
-        """Build or rebuild the tree, optionally filtered."""
-        self.file_nodes.clear()
+            # Add file node
+            filename = path_parts[-1] if path_parts else bf.relative_path or "(root)"
+            file_node = cache.node(id(bf), parent_node, filename)
+            layout[parent_node][file_node] = None
+            self.file_nodes[file_node] = bf
+            self._bf_to_node[id(bf)] = file_node
 
-        # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        for parent_node, children in layout.items():
+            cache.show(parent_node, children)
+
+    def populate_all(self):
+        """Fill in every domain that has not been expanded yet."""
+        for domain_node in list(self._pending_domains):
+            self._populate_domain(domain_node)
+
+    def _build_tree(self, filter_text: str = ""):
+        """Build or rebuild the tree, optionally filtered.
+
+        Nodes from earlier builds are kept in _node_cache and relinked, so a
+        filter change only inserts nodes that have not been shown before.
+        """
+        self.file_nodes.clear()
+        self._bf_to_node.clear()
+        self._pending_domains.clear()
+        self._domain_nodes.clear()
 
         if not self.backup:
+            self._node_cache.show('', ())
             return
 
         # Filter files if needed
         filter_lower = filter_text.lower()
         unmapped_only = self.unmapped_only_var.get()
 
-        filtered_files = []
-        for bf in files:
-            if bf.is_directory:
-                continue
-            # Apply text filter
-            if filter_lower and filter_lower not in bf.full_domain_path.lower():
-                continue
-            # Apply unmapped filter
-            if unmapped_only and id(bf) not in self._unmapped_files:
-                continue
-            filtered_files.append(bf)
+        # Narrow the aligned file and path lists with compress(), so the
+        # per-file tests run in C rather than in a Python loop; each file
+        # travels with its extra-source flag
+        files = zip(self._all_items, self._extra_mask)
+        lower_paths = self._lower_paths
+        if unmapped_only:
+            files = compress(files, self._unmapped_mask)
+            lower_paths = compress(lower_paths, self._unmapped_mask)
+        if filter_lower:
+            files = compress(files, map(contains, lower_paths, repeat(filter_lower)))
+        filtered_files = list(files)
 
         # Split into standard backup files and extra sources
-        standard_by_domain: Dict[str, list] = {}
-        extra_by_domain: Dict[str, list] = {}
+        standard_by_domain: Dict[str, list] = defaultdict(list)
+        extra_by_domain: Dict[str, list] = defaultdict(list)
 
-        for bf in filtered_files:
-            target = extra_by_domain if self._is_extra_source(bf) else standard_by_domain
-            if bf.domain not in target:
-                target[bf.domain] = []
+        for bf, is_extra in filtered_files:
+            target = extra_by_domain if is_extra else standard_by_domain
             target[bf.domain].append(bf)
 
         # When extras exist, add section headers to both groups
+        cache = self._node_cache
+        top_nodes = []
         if extra_by_domain:
-            self.tree.insert('', 'end', text='\u2500\u2500 Backup Content \u2500\u2500', tags=('separator',))
+            top_nodes.append(cache.node('backup-content', '', '\u2500\u2500 Backup Content \u2500\u2500',
+                                        tags=('separator',)))
 
-        self._build_domain_nodes(standard_by_domain, filter_lower)
+        top_nodes += self._build_domain_nodes(standard_by_domain, filter_lower)
 
         if extra_by_domain:
-            self.tree.insert('', 'end', text='\u2500\u2500 Additional Sources \u2500\u2500', tags=('separator',))
-            self._build_domain_nodes(extra_by_domain, filter_lower, annotate_source=True)
+            top_nodes.append(cache.node('additional-sources', '', '\u2500\u2500 Additional Sources \u2500\u2500',
+                                        tags=('separator',)))
+            top_nodes += self._build_domain_nodes(extra_by_domain, filter_lower, annotate_source=True)
+
+        cache.show('', top_nodes)
 
         # Update filter count
         if filter_lower:
@@ -574,10 +864,11 @@ class BackupTreeView(ttk.Frame):
 
     def _apply_filter(self):
         """Apply the current filter to the tree."""
-        if not self.backup:
+        self._cancel_filter_rebuild()
+        if not self.backup or self._indexed_backup is not self.backup:
             return
         filter_text = self.filter_var.get()
-        self._build_tree(self.backup.files, filter_text)
+        self._build_tree(filter_text)
 
     def get_selected_file(self) -> Optional[BackupFile]:
         """Get the currently selected backup file."""
@@ -596,30 +887,36 @@ class BackupTreeView(ttk.Frame):
         Returns:
             True if file was found and selected, False otherwise
         """
+        # Make sure the file's domain has been filled in
+        domain_node = self._domain_nodes.get((self._is_extra_source(backup_file), backup_file.domain))
+        if domain_node in self._pending_domains:
+            self._populate_domain(domain_node)
+
         # Find the node for this backup file
-        for node_id, bf in self.file_nodes.items():
-            if bf == backup_file:
-                # Expand parents
-                parent = self.tree.parent(node_id)
-                while parent:
-                    self.tree.item(parent, open=True)
-                    parent = self.tree.parent(parent)
-                # Unbind event to prevent callback loop, rebind after events processed
-                self.tree.unbind('<<TreeviewSelect>>')
-                self.tree.selection_set(node_id)
-                self.tree.see(node_id)
-                # Rebind after pending events are processed (not immediately!)
-                self.after(10, lambda: self.tree.bind('<<TreeviewSelect>>', self._on_select))
-                self.extract_btn.configure(state='normal')
-                return True
-        return False
+        node_id = self._bf_to_node.get(id(backup_file))
+        if node_id is None:
+            return False
+
+        # Expand parents
+        self._node_cache.open_ancestors(node_id)
+        # <<TreeviewSelect>> is queued, not sent during selection_set, so
+        # mark the node for _on_select rather than toggling a flag around it
+        self._programmatic_node = node_id
+        self.tree.selection_set(node_id)
+        self.tree.see(node_id)
+        self.extract_btn.configure(state='normal')
+        return True
 
     def clear(self):
         """Clear the tree view."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._node_cache.reset()
         self.file_nodes.clear()
+        self._bf_to_node.clear()
+        self._pending_domains.clear()
+        self._domain_nodes.clear()
         self.backup = None
+        self._indexed_backup = None
+        self._pending_unmapped = None
         self.info_var.set("No backup loaded")
 
 
@@ -632,10 +929,19 @@ class FilesystemTreeView(ttk.Frame):
         self.on_extract_callback = on_extract_callback
         self.filesystem: Optional[FilesystemAcquisition] = None
         self.file_nodes: Dict[str, FilesystemFile] = {}  # node_id -> FilesystemFile
-        self.path_to_node: Dict[str, str] = {}  # normalized_path -> node_id
+        self._ff_to_node: Dict[int, str] = {}  # id(FilesystemFile) -> node_id, filled-in files only
+        self._path_index: Dict[str, FilesystemFile] = {}  # normalized_path (and /private variant) -> file
+        # Collapsed directory nodes whose contents are inserted on first open:
+        # node_id -> (depth, (file, path parts) pairs below it)
+        self._pending_dirs: Dict[str, Tuple[int, list]] = {}
         self._all_files: List[FilesystemFile] = []  # All non-directory files for filtering
+        self._lower_paths: List[str] = []  # Lowercased paths, aligned with _all_files
+        self._path_parts: List[List[str]] = []  # Split normalized paths, aligned with _all_files
+        self._highlighted_nodes: List[str] = []  # Nodes currently carrying a highlight tag
         self._total_file_count: int = 0
-        self._programmatic_selection: bool = False  # Flag to prevent callback during programmatic selection
+        self._filter_after_id: Optional[str] = None  # Pending debounced filter rebuild
+        # Node selected from code; its queued <<TreeviewSelect>> skips the callback
+        self._programmatic_node: Optional[str] = None
         self._create_widgets()
 
     def _create_widgets(self):
@@ -667,6 +973,7 @@ class FilesystemTreeView(ttk.Frame):
 
         self.tree = ttk.Treeview(tree_frame, selectmode='browse')
         self.tree.heading('#0', text='Filesystem Files', anchor='w')
+        self._node_cache = TreeNodeCache(self.tree)
 
         vsb = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
@@ -683,8 +990,9 @@ class FilesystemTreeView(ttk.Frame):
         self.tree.tag_configure('highlight', background='#90EE90')  # Light green
         self.tree.tag_configure('not_found', background='#FFB6C1')  # Light red
 
-        # Bind selection event
+        # Bind selection and expansion events
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_open)
 
         # Action buttons frame
         action_frame = ttk.Frame(self)
@@ -699,11 +1007,13 @@ class FilesystemTreeView(ttk.Frame):
 
     def _on_select(self, event):
         """Handle selection in the tree."""
-        selected = self.get_selected_file()
+        selection = self.tree.selection()
+        programmatic_node, self._programmatic_node = self._programmatic_node, None
+        selected = self.file_nodes.get(selection[0]) if selection else None
         if selected:
             self.extract_btn.configure(state='normal')
             # Only call callback if this is a user-initiated selection
-            if self.on_select_callback and not self._programmatic_selection:
+            if self.on_select_callback and selection[0] != programmatic_node:
                 self.on_select_callback(selected)
         else:
             self.extract_btn.configure(state='disabled')
@@ -714,6 +1024,12 @@ class FilesystemTreeView(ttk.Frame):
         if selected and self.on_extract_callback:
             self.on_extract_callback(selected)
 
+    def _on_open(self, event):
+        """Fill in a directory's contents the first time it is expanded."""
+        node_id = self.tree.focus()
+        if node_id in self._pending_dirs:
+            self._populate_pending(node_id)
+
     def get_selected_file(self) -> Optional[FilesystemFile]:
         """Get the currently selected filesystem file."""
         selection = self.tree.selection()
@@ -721,83 +1037,111 @@ class FilesystemTreeView(ttk.Frame):
             return self.file_nodes.get(selection[0])
         return None
 
-    def load_filesystem(self, filesystem: FilesystemAcquisition):
-        """Load and display a filesystem acquisition in the tree."""
+    def load_filesystem(self, filesystem: FilesystemAcquisition, progress_callback=None):
+        """Load and display a filesystem acquisition in the tree.
+
+        progress_callback(current, total, message), if given, is called every
+        few thousand files while the tree is indexed, so the caller can redraw.
+        """
         self.filesystem = filesystem
         self.file_nodes.clear()
-        self.path_to_node.clear()
-        self._all_files = [f for f in filesystem.files if not f.is_directory]
+        self._ff_to_node.clear()
+        self._pending_dirs.clear()
+        self._node_cache.reset()
+        self._highlighted_nodes.clear()
+        # Kept in path order so filtered subsets come out already sorted
+        self._all_files = sorted((f for f in filesystem.files if not f.is_directory),
+                                 key=attrgetter('path'))
+        self._lower_paths = [f.path.lower() for f in self._all_files]
+        self._path_parts = [[p for p in f.normalized_path.split('/') if p] for f in self._all_files]
         self._total_file_count = len(self._all_files)
         self.filter_var.set("")
 
+        if progress_callback:
+            # Progress reports redraw the window; keep the tree out of
+            # sight until it is complete so each redraw stays cheap
+            self._node_cache.hold_root()
+
+        # Index every file once, whatever the filter later shows
+        path_index: Dict[str, FilesystemFile] = {}
+        self._path_index = path_index
+        total = self._total_file_count
+        for i, ff in enumerate(self._all_files):
+            if progress_callback and i % self._PROGRESS_EVERY == 0:
+                progress_callback(i, total, f"Indexing file tree ({i}/{total})...")
+
+            path = ff.normalized_path
+            path_index[path] = ff
+
+            # Also index the path with /private added or stripped, so
+            # lookup() needs only one probe; a real path always wins
+            if path.startswith('/private/'):
+                path_index.setdefault(path[8:], ff)
+            else:
+                path_index.setdefault('/private' + path, ff)
+
         # Update info label
         self.info_var.set(f"{filesystem.format.upper()} - {self._total_file_count} files")
 
         # Build the tree
+        self._cancel_filter_rebuild()
         self._build_tree()
 
         # Update filter count
         self.filter_count_var.set(f"{self._total_file_count} files")
 
     def _on_filter_change(self, *args):
-        """Handle filter text changes."""
+        """Handle filter text changes, rebuilding once typing pauses."""
+        self._cancel_filter_rebuild()
+        self._filter_after_id = self.after(BackupTreeView._FILTER_DELAY_MS, self._apply_filter)
+
+    def _cancel_filter_rebuild(self):
+        """Drop a pending debounced filter rebuild."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+    def _apply_filter(self):
+        """Apply the current filter to the tree."""
+        self._cancel_filter_rebuild()
         self._build_tree()
 
+    # Files indexed between progress reports
+    _PROGRESS_EVERY = 2000
+
+    def lookup(self, path: str) -> Optional[FilesystemFile]:
+        """Return the loaded file at a normalized path, with or without /private."""
+        return self._path_index.get(path)
+
     def _build_tree(self, filter_text: str = None):
-        """Build or rebuild the tree, optionally filtered."""
+        """Build or rebuild the tree, optionally filtered.
+
+        Nodes from earlier builds are kept in _node_cache and relinked, so a
+        filter change only inserts nodes that have not been shown before.
+        """
         if filter_text is None:
             filter_text = self.filter_var.get()
 
         self.file_nodes.clear()
-        self.path_to_node.clear()
-
-        # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._ff_to_node.clear()
+        self._pending_dirs.clear()
 
         if not self.filesystem:
+            self._node_cache.show('', ())
             return
 
         # Filter files if needed
         filter_lower = filter_text.strip().lower()
+        # _all_files is in path order, so the filtered files already are too
+        filtered_files = zip(self._all_files, self._path_parts)
         if filter_lower:
-            filtered_files = [f for f in self._all_files if filter_lower in f.path.lower()]
-        else:
-            filtered_files = self._all_files
-
-        # Build directory tree structure
-        dir_nodes: Dict[str, str] = {}  # path -> node_id
-
-        # Sort files by path for hierarchical display
-        sorted_files = sorted(filtered_files, key=lambda f: f.path)
-
-        for ff in sorted_files:
-            path = ff.normalized_path
-            path_parts = [p for p in path.split('/') if p]
-
-            # Create intermediate directories
-            current_path = ""
-            parent_node = ''
-
-            for i, part in enumerate(path_parts[:-1]):
-                current_path = f"/{'/'.join(path_parts[:i+1])}"
-
-                if current_path not in dir_nodes:
-                    dir_node = self.tree.insert(parent_node, 'end', text=part + "/", open=bool(filter_lower))
-                    dir_nodes[current_path] = dir_node
-
-                parent_node = dir_nodes[current_path]
+            filtered_files = compress(filtered_files,
+                                      map(contains, self._lower_paths, repeat(filter_lower)))
+        filtered_files = list(filtered_files)
 
-            # Add file node
-            filename = path_parts[-1] if path_parts else path
-            file_node = self.tree.insert(parent_node, 'end', text=filename)
-            self.file_nodes[file_node] = ff
-            self.path_to_node[ff.normalized_path] = file_node
-
-            # Also index alternate paths
-            if ff.normalized_path.startswith('/private/'):
-                alt_path = ff.normalized_path[8:]
-                self.path_to_node[alt_path] = file_node
+        # Filtered results are shown expanded, so fill in every directory;
+        # otherwise only the top level, and the rest as it is opened
+        self._populate_dir('', filtered_files, 0, open_dirs=bool(filter_lower))
 
         # Update filter count
         if filter_lower:
@@ -805,6 +1149,76 @@ class FilesystemTreeView(ttk.Frame):
         else:
             self.filter_count_var.set(f"{self._total_file_count} files")
 
+    def _populate_dir(self, dir_node: str, entries: list, depth: int, open_dirs: bool = False):
+        """Show the subdirectories and files directly under a directory node.
+
+        entries are the (file, path parts) pairs below the directory, whose
+        first depth parts are the directory's own path. Subdirectories start
+        collapsed with a placeholder child and are filled in when first
+        opened, unless open_dirs is set.
+        """
+        cache = self._node_cache
+        children: Dict[str, None] = {}
+        subdirs: Dict[str, list] = {}  # subdirectory node_id -> entries below it
+        last_part = below = None
+
+        for entry in entries:
+            ff, path_parts = entry
+            if len(path_parts) > depth + 1:
+                # Entries arrive in path order, so runs share a subdirectory
+                part = path_parts[depth]
+                if part != last_part:
+                    last_part = part
+                    sub_node = cache.node((dir_node, part), dir_node, part + "/", open=open_dirs)
+                    below = subdirs.get(sub_node)
+                    if below is None:
+                        below = subdirs[sub_node] = []
+                        children[sub_node] = None
+                        cache.configure(sub_node, open=open_dirs)
+                below.append(entry)
+            else:
+                filename = path_parts[-1] if path_parts else ff.normalized_path
+                file_node = cache.node(id(ff), dir_node, filename)
+                children[file_node] = None
+                self.file_nodes[file_node] = ff
+                self._ff_to_node[id(ff)] = file_node
+                last_part = None
+
+        cache.show(dir_node, children)
+
+        for sub_node, below in subdirs.items():
+            if open_dirs:
+                self._populate_dir(sub_node, below, depth + 1, open_dirs)
+            else:
+                self._pending_dirs[sub_node] = (depth + 1, below)
+                placeholder = cache.node(('placeholder', sub_node), sub_node, "\u2026")
+                cache.show(sub_node, (placeholder,))
+
+    def _populate_pending(self, dir_node: str):
+        """Fill in a collapsed directory node."""
+        depth, entries = self._pending_dirs.pop(dir_node)
+        self._populate_dir(dir_node, entries, depth)
+
+    def populate_all(self):
+        """Fill in every directory that has not been expanded yet."""
+        while self._pending_dirs:
+            self._populate_pending(next(iter(self._pending_dirs)))
+
+    def _node_for_file(self, ff: FilesystemFile) -> Optional[str]:
+        """Return a file's node, filling in any collapsed directories above it."""
+        node_id = self._ff_to_node.get(id(ff))
+        if node_id is not None:
+            return node_id
+
+        parent_node = ''
+        for part in [p for p in ff.normalized_path.split('/') if p][:-1]:
+            parent_node = self._node_cache.nodes.get((parent_node, part))
+            if parent_node is None:
+                return None
+            if parent_node in self._pending_dirs:
+                self._populate_pending(parent_node)
+        return self._ff_to_node.get(id(ff))
+
     def highlight_path(self, path: Optional[str], mapping_status: MappingStatus = MappingStatus.MAPPED):
         """
         Highlight a path in the filesystem tree.
@@ -813,21 +1227,17 @@ class FilesystemTreeView(ttk.Frame):
             path: The filesystem path to highlight
             mapping_status: The mapping status to determine highlighting style
         """
-        # Clear all highlights first
-        for node_id in self.file_nodes.keys():
+        # Clear the previous highlight first
+        for node_id in self._highlighted_nodes:
             self.tree.item(node_id, tags=())
+        self._highlighted_nodes.clear()
 
         if path is None:
             return
 
-        # Find the node for this path
-        node_id = self.path_to_node.get(path)
-
-        if node_id is None:
-            # Try with /private prefix
-            if not path.startswith('/private/'):
-                alt_path = '/private' + path if path.startswith('/') else '/private/' + path
-                node_id = self.path_to_node.get(alt_path)
+        # Find the node for this path; a file hidden by the filter has none
+        ff = self.lookup(path)
+        node_id = self._node_for_file(ff) if ff else None
 
         if node_id:
             # Apply highlight tag
@@ -835,34 +1245,35 @@ class FilesystemTreeView(ttk.Frame):
                 self.tree.item(node_id, tags=('highlight',))
             else:
                 self.tree.item(node_id, tags=('not_found',))
+            self._highlighted_nodes.append(node_id)
 
             # Expand parents and scroll to node
             self._expand_to_node(node_id)
             self.tree.see(node_id)
-            # Unbind event to prevent callback loop, rebind after events processed
-            self.tree.unbind('<<TreeviewSelect>>')
+            # Mark the node so the queued <<TreeviewSelect>> skips the callback
+            self._programmatic_node = node_id
             self.tree.selection_set(node_id)
-            # Rebind after pending events are processed (not immediately!)
-            self.after(10, lambda: self.tree.bind('<<TreeviewSelect>>', self._on_select))
 
     def _expand_to_node(self, node_id: str):
         """Expand all parent nodes to make a node visible."""
-        parent = self.tree.parent(node_id)
-        while parent:
-            self.tree.item(parent, open=True)
-            parent = self.tree.parent(parent)
+        self._node_cache.open_ancestors(node_id)
 
     def clear(self):
         """Clear the tree view."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._node_cache.reset()
+        self._highlighted_nodes.clear()
         self.file_nodes.clear()
-        self.path_to_node.clear()
+        self._ff_to_node.clear()
+        self._path_index = {}
+        self._pending_dirs.clear()
         self._all_files = []
+        self._lower_paths = []
+        self._path_parts = []
         self._total_file_count = 0
         self.filesystem = None
         self.info_var.set("No filesystem loaded")
         self.filter_var.set("")
+        self._cancel_filter_rebuild()
         self.filter_count_var.set("")
 
 
@@ -917,15 +1328,32 @@ class MappingInfoPanel(ttk.LabelFrame):
         if self.on_compare_hashes and self.current_mapping:
             self.on_compare_hashes(self.current_mapping)
 
-    def _format_size(self, size: int) -> str:
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_size(size: int) -> str:
         """Format file size in human-readable format."""
-        if size == 0:
-            return "0 B"
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}" if unit != 'B' else f"{size} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        if size < 1024:
+            return f"{size} B"
+        # Each unit covers ten more bits of the size
+        unit = min((size.bit_length() - 1) // 10, 4)
+        return f"{size / (1 << (10 * unit)):.1f} {MappingInfoPanel._SIZE_UNITS[unit]}"
+
+    # Mapping status -> (status color, Compare Hashes state, status text)
+    _STATUS_DISPLAY = {
+        MappingStatus.MAPPED: ('green', 'normal', "Mapped"),
+        MappingStatus.NOT_FOUND: ('orange', 'disabled', "Not Found"),
+        MappingStatus.UNMAPPABLE: ('red', 'disabled', "Unmappable"),
+        MappingStatus.DIRECTORY: ('red', 'disabled', "Directory"),
+    }
+
+    # Size comparison (True/False, or None without a filesystem file) -> (color, suffix)
+    _SIZE_DISPLAY = {
+        True: ('green', " ✓"),
+        False: ('orange', " ⚠️ MISMATCH"),
+        None: ('black', ""),
+    }
 
     def update_mapping(self, mapping: Optional[PathMapping]):
         """Update the display with mapping information."""
@@ -944,7 +1372,8 @@ class MappingInfoPanel(ttk.LabelFrame):
 
         self.backup_path_var.set(mapping.backup_file.full_domain_path)
         self.fs_path_var.set(mapping.filesystem_path or "N/A")
-        self.status_var.set(mapping.status.value.replace('_', ' ').title())
+        status_color, compare_state, status_text = self._STATUS_DISPLAY[mapping.status]
+        self.status_var.set(status_text)
         self.notes_var.set(mapping.notes or "")
 
         # Display file sizes - prefer actual_file_size over manifest size
@@ -963,33 +1392,22 @@ class MappingInfoPanel(ttk.LabelFrame):
             backup_text = f"Backup: {self._format_size(backup_size_to_compare)}"
 
         if fs_size is not None:
-            size_text = f"{backup_text} | Filesystem: {self._format_size(fs_size)}"
-            if backup_size_to_compare == fs_size:
-                self.size_label.configure(foreground='green')
-                size_text += " ✓"
-            elif actual_backup_size is not None and actual_backup_size == fs_size:
-                # Actual matches filesystem even if manifest was wrong
-                self.size_label.configure(foreground='green')
-                size_text += " ✓"
-            else:
-                self.size_label.configure(foreground='orange')
-                size_text += " ⚠️ MISMATCH"
+            # Actual size matching the filesystem counts even if the manifest was wrong
+            sizes_match = backup_size_to_compare == fs_size or (
+                actual_backup_size is not None and actual_backup_size == fs_size)
+            size_color, size_suffix = self._SIZE_DISPLAY[sizes_match]
+            # Built in one go, suffix included, rather than appended to
+            size_text = f"{backup_text} | Filesystem: {self._format_size(fs_size)}{size_suffix}"
         else:
+            size_color, _ = self._SIZE_DISPLAY[None]
             size_text = backup_text
-            self.size_label.configure(foreground='black')
 
+        self.size_label.configure(foreground=size_color)
         self.size_var.set(size_text)
 
         # Color code status
-        if mapping.status == MappingStatus.MAPPED:
-            self.status_label.configure(foreground='green')
-            self.compare_btn.configure(state='normal')
-        elif mapping.status == MappingStatus.NOT_FOUND:
-            self.status_label.configure(foreground='orange')
-            self.compare_btn.configure(state='disabled')
-        else:
-            self.status_label.configure(foreground='red')
-            self.compare_btn.configure(state='disabled')
+        self.status_label.configure(foreground=status_color)
+        self.compare_btn.configure(state=compare_state)
 
     def set_hash_result(self, result: str, match: Optional[bool] = None):
         """Set the hash comparison result."""
@@ -1019,11 +1437,20 @@ class MainApplication(tk.Tk):
         self.filesystem: Optional[FilesystemAcquisition] = None
         self.mapper = None  # PathMapper, AndroidPathMapper, or FilesystemMapper
         self._selecting: bool = False  # Flag to prevent recursive selection
+        self._hash_cache = HashCache()  # SHA256 digests kept between sessions
 
         self._create_menu()
         self._create_widgets()
         self._configure_layout()
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Release the hash cache and backup handles and close the window."""
+        self._hash_cache.close()
+        self._close_backup(self.backup)
+        self.destroy()
+
     def _create_menu(self):
         """Create the menu bar."""
         menubar = tk.Menu(self)
@@ -1046,7 +1473,7 @@ class MainApplication(tk.Tk):
         fs_menu.add_command(label="From File...", command=self._load_filesystem_file)
 
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
 
         # Export menu
         export_menu = tk.Menu(menubar, tearoff=0)
@@ -1141,6 +1568,25 @@ class MainApplication(tk.Tk):
 
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
 
+    # Minimum time between progress reports reaching the GUI (~30 Hz)
+    _PROGRESS_INTERVAL = 1 / 30
+
+    def _throttled_progress(self, callback):
+        """Wrap a progress callback so it runs at most about 30 times a second.
+
+        Reports that start a phase (current == 0) or finish one
+        (current >= total) always go through, so phase messages are not lost.
+        """
+        last = float('-inf')
+
+        def throttled(current, total, message):
+            nonlocal last
+            now = time.monotonic()
+            if current == 0 or current >= total or now - last >= self._PROGRESS_INTERVAL:
+                last = now
+                callback(current, total, message)
+        return throttled
+
     def _load_backup_folder(self):
         """Load an iOS backup from a folder."""
         path = filedialog.askdirectory(title="Select iOS Backup Directory")
@@ -1164,6 +1610,7 @@ class MainApplication(tk.Tk):
 
     def _load_backup_from_path(self, path: str):
         """Load a backup from the given path (auto-detects iOS vs Android vs Magnet vs filesystem)."""
+        previous = self.backup
         if iOSBackupParser.is_ios_backup(path):
             self.backup_type = 'ios'
             self._load_ios_backup(path)
@@ -1193,13 +1640,21 @@ class MainApplication(tk.Tk):
                     "- Plain archive (ZIP, TAR, TAR.GZ) or directory"
                 )
 
+        # A replaced backup's archive handles are no longer needed
+        if self.backup is not previous:
+            self._close_backup(previous)
+
+    @staticmethod
+    def _close_backup(backup):
+        """Close the archive handles a backup keeps open, if it has any."""
+        close = getattr(backup, 'close', None)
+        if close is not None:
+            close()
+
     def _load_android_backup(self, path: str):
         """Load an Android backup from the given path."""
         self.status_bar.set_status(f"Loading Android backup from {path}...")
-        self.status_bar.progress.configure(mode='determinate')
         self.status_bar.show_progress()
-        self.status_bar.progress['value'] = 0
-        self.update_idletasks()
 
         try:
             parser = AndroidBackupParser(path)
@@ -1208,11 +1663,9 @@ class MainApplication(tk.Tk):
                 dialog = PasswordDialog(self, "Enter Backup Password")
                 return dialog.password
 
+            @self._throttled_progress
             def progress_callback(current, total, message):
-                if total > 0:
-                    self.status_bar.progress['value'] = current
-                self.status_bar.set_status(message)
-                self.update_idletasks()
+                self.status_bar.report(message, current if total > 0 else None)
 
             self.backup = parser.parse(
                 password_callback=password_callback,
@@ -1221,13 +1674,11 @@ class MainApplication(tk.Tk):
             self._backup_parser = parser
 
             self.status_bar.set_status("Building backup tree...")
-            self.status_bar.progress['value'] = 95
-            self.update_idletasks()
+            self.status_bar.set_progress(95, force=True)
 
             self.backup_tree.load_backup(self.backup)
 
-            file_count = len([f for f in self.backup.files if not f.is_directory])
-            self.status_bar.progress['value'] = 100
+            file_count = sum(1 for f in self.backup.files if not f.is_directory)
             self.status_bar.hide_progress()
             self.status_bar.set_status(f"Loaded Android backup: {file_count} files")
 
@@ -1235,7 +1686,6 @@ class MainApplication(tk.Tk):
                 self._run_mapping()
 
         except Exception as e:
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", f"Failed to load Android backup: {e}")
             self.status_bar.set_status("Failed to load backup")
@@ -1243,31 +1693,24 @@ class MainApplication(tk.Tk):
     def _load_magnet_backup(self, path: str):
         """Load a Magnet Acquire Quick Image from the given path."""
         self.status_bar.set_status(f"Loading Magnet Quick Image from {path}...")
-        self.status_bar.progress.configure(mode='determinate')
         self.status_bar.show_progress()
-        self.status_bar.progress['value'] = 0
-        self.update_idletasks()
 
         try:
             parser = MagnetQuickImageParser(path)
 
+            @self._throttled_progress
             def progress_callback(current, total, message):
-                if total > 0:
-                    self.status_bar.progress['value'] = current
-                self.status_bar.set_status(message)
-                self.update_idletasks()
+                self.status_bar.report(message, current if total > 0 else None)
 
             self.backup = parser.parse(progress_callback=progress_callback)
             self._backup_parser = parser
 
             self.status_bar.set_status("Building backup tree...")
-            self.status_bar.progress['value'] = 95
-            self.update_idletasks()
+            self.status_bar.set_progress(95, force=True)
 
             self.backup_tree.load_backup(self.backup)
 
-            file_count = len([f for f in self.backup.files if not f.is_directory])
-            self.status_bar.progress['value'] = 100
+            file_count = sum(1 for f in self.backup.files if not f.is_directory)
             self.status_bar.hide_progress()
             self.status_bar.set_status(f"Loaded Magnet Quick Image: {file_count} files")
 
@@ -1275,7 +1718,6 @@ class MainApplication(tk.Tk):
                 self._run_mapping()
 
         except Exception as e:
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", f"Failed to load Magnet Quick Image: {e}")
             self.status_bar.set_status("Failed to load backup")
@@ -1283,10 +1725,7 @@ class MainApplication(tk.Tk):
     def _load_alex_backup(self, path: str):
         """Load an ALEX UFED-style extraction from the given path."""
         self.status_bar.set_status(f"Loading ALEX extraction from {path}...")
-        self.status_bar.progress.configure(mode='determinate')
         self.status_bar.show_progress()
-        self.status_bar.progress['value'] = 0
-        self.update_idletasks()
 
         try:
             parser = ALEXParser(path, password=None)
@@ -1295,11 +1734,9 @@ class MainApplication(tk.Tk):
                 dialog = PasswordDialog(self, "Enter Backup Password")
                 return dialog.password
 
+            @self._throttled_progress
             def progress_callback(current, total, message):
-                if total > 0:
-                    self.status_bar.progress['value'] = current
-                self.status_bar.set_status(message)
-                self.update_idletasks()
+                self.status_bar.report(message, current if total > 0 else None)
 
             self.backup = parser.parse(
                 password_callback=password_callback,
@@ -1308,13 +1745,11 @@ class MainApplication(tk.Tk):
             self._backup_parser = parser
 
             self.status_bar.set_status("Building backup tree...")
-            self.status_bar.progress['value'] = 95
-            self.update_idletasks()
+            self.status_bar.set_progress(95, force=True)
 
             self.backup_tree.load_backup(self.backup)
 
-            file_count = len([f for f in self.backup.files if not f.is_directory])
-            self.status_bar.progress['value'] = 100
+            file_count = sum(1 for f in self.backup.files if not f.is_directory)
             self.status_bar.hide_progress()
             self.status_bar.set_status(f"Loaded ALEX extraction: {file_count} files")
 
@@ -1322,7 +1757,6 @@ class MainApplication(tk.Tk):
                 self._run_mapping()
 
         except Exception as e:
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", f"Failed to load ALEX extraction: {e}")
             self.status_bar.set_status("Failed to load backup")
@@ -1331,15 +1765,16 @@ class MainApplication(tk.Tk):
         """Load a plain archive or directory as a backup source for comparison."""
         self.status_bar.set_status(f"Loading archive as source from {path}...")
         self.status_bar.show_progress(100)
-        self.update_idletasks()
 
         dialog = ProgressDialog(self, title="Loading Source Archive")
         dialog.log(f"Source: {path}")
 
+        @self._throttled_progress
         def progress_callback(current, total, message):
-            self.status_bar.set_status(message)
             if total > 0:
-                self.status_bar.set_progress(current, total)
+                self.status_bar.report(message, current, total)
+            else:
+                self.status_bar.report(message)
             dialog.update_progress(current, total, message)
 
         try:
@@ -1356,7 +1791,7 @@ class MainApplication(tk.Tk):
             self.status_bar.set_status("Building source tree...")
             self.backup_tree.load_backup(self.backup)
 
-            file_count = len([f for f in self.backup.files if not f.is_directory])
+            file_count = sum(1 for f in self.backup.files if not f.is_directory)
             self.status_bar.hide_progress()
             summary = f"Loaded source archive: {file_count} files ({acquisition.platform})"
             self.status_bar.set_status(summary)
@@ -1374,34 +1809,31 @@ class MainApplication(tk.Tk):
     def _load_ios_backup(self, path: str):
         """Load an iOS backup from the given path."""
         self.status_bar.set_status(f"Loading backup from {path}...")
-        self.status_bar.progress.configure(mode='determinate')
         self.status_bar.show_progress()
-        self.status_bar.progress['value'] = 0
-        self.update_idletasks()
 
         try:
-            parser = iOSBackupParser(path)
+            parser = iOSBackupParser(path, log_entries=True)
             self._backup_parser = parser
 
             def password_callback():
                 dialog = PasswordDialog(self, "Enter Backup Password")
                 return dialog.password
 
+            @self._throttled_progress
             def progress_callback(current, total, message):
                 # Scale progress: manifest parsing 0-30%, file sizes 30-90%, tree building 90-100%
+                pct = None
                 if "manifest" in message.lower():
-                    self.status_bar.progress['value'] = 10
+                    pct = 10
                 elif "file sizes" in message.lower() or "Reading" in message:
                     # Scale the file size reading progress (30-90%)
                     if total > 0:
                         pct = 30 + (current / total) * 60
                     else:
                         pct = 30
-                    self.status_bar.progress['value'] = pct
                 elif "complete" in message.lower():
-                    self.status_bar.progress['value'] = 90
-                self.status_bar.set_status(message)
-                self.update_idletasks()
+                    pct = 90
+                self.status_bar.report(message, pct)
 
             self.backup = parser.parse(
                 password_callback=password_callback,
@@ -1409,12 +1841,10 @@ class MainApplication(tk.Tk):
             )
 
             self.status_bar.set_status("Building backup tree...")
-            self.status_bar.progress['value'] = 95
-            self.update_idletasks()
+            self.status_bar.set_progress(95, force=True)
 
             self.backup_tree.load_backup(self.backup)
 
-            self.status_bar.progress['value'] = 100
             self.status_bar.hide_progress()
             self.status_bar.set_status(f"Loaded backup: {len(self.backup.files)} files")
 
@@ -1423,14 +1853,10 @@ class MainApplication(tk.Tk):
                 self._run_mapping()
 
         except ValueError as e:
-            self.status_bar.progress.stop()
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", str(e))
             self.status_bar.set_status("Failed to load backup")
         except Exception as e:
-            self.status_bar.progress.stop()
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", f"Failed to load backup: {e}")
             self.status_bar.set_status("Failed to load backup")
@@ -1459,15 +1885,16 @@ class MainApplication(tk.Tk):
         """Load a filesystem acquisition from the given path."""
         self.status_bar.set_status(f"Loading filesystem from {path}...")
         self.status_bar.show_progress(100)
-        self.update_idletasks()
 
         dialog = ProgressDialog(self, title="Loading Filesystem")
         dialog.log(f"Source: {path}")
 
+        @self._throttled_progress
         def progress_callback(current, total, message):
-            self.status_bar.set_status(message)
             if total > 0:
-                self.status_bar.set_progress(current, total)
+                self.status_bar.report(message, current, total)
+            else:
+                self.status_bar.report(message)
             dialog.update_progress(current, total, message)
 
         try:
@@ -1475,7 +1902,7 @@ class MainApplication(tk.Tk):
             dialog.log(f"Detected format: {loader._format}")
             self.filesystem = loader.load()
 
-            file_count = len([f for f in self.filesystem.files if not f.is_directory])
+            file_count = sum(1 for f in self.filesystem.files if not f.is_directory)
             dir_count = len(self.filesystem.files) - file_count
             dialog.log(f"Found {file_count} files and {dir_count} directories")
             dialog.log(f"Platform detected: {self.filesystem.platform}")
@@ -1483,7 +1910,7 @@ class MainApplication(tk.Tk):
             dialog.update_progress(0, 100, "Building file tree...")
             self.status_bar.set_status("Building file tree...")
             self.status_bar.set_progress(0, 100)
-            self.fs_tree.load_filesystem(self.filesystem)
+            self.fs_tree.load_filesystem(self.filesystem, progress_callback=progress_callback)
 
             # Build summary
             summary = f"Loaded filesystem: {file_count} files"
@@ -1510,10 +1937,13 @@ class MainApplication(tk.Tk):
             return
 
         self.status_bar.set_status("Running path mapping...")
-        self.status_bar.progress.configure(mode='indeterminate')
         self.status_bar.show_progress()
-        self.status_bar.progress.start(10)
-        self.update_idletasks()
+
+        # Mapping runs on this thread, so an indeterminate bar would never
+        # get to animate; report real progress from the mapper instead
+        @self._throttled_progress
+        def progress_callback(current, total, message):
+            self.status_bar.report(message, current, max(total, 1))
 
         try:
             if self.backup_type == 'filesystem':
@@ -1522,7 +1952,7 @@ class MainApplication(tk.Tk):
                 self.mapper = AndroidPathMapper(self.backup, self.filesystem)
             else:
                 self.mapper = PathMapper(self.backup, self.filesystem)
-            self.mapper.map_all()
+            self.mapper.map_all(progress_callback=progress_callback)
 
             # Update statistics (include parsing log if available)
             parsing_log = self.backup.parsing_log if self.backup else None
@@ -1532,8 +1962,6 @@ class MainApplication(tk.Tk):
             unmapped = self.mapper.get_unmapped_backup_files()
             self.backup_tree.set_unmapped_files(unmapped)
 
-            self.status_bar.progress.stop()
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             self.status_bar.set_status(
                 f"Mapping complete: {self.mapper.statistics.mapped_files} mapped, "
@@ -1542,8 +1970,6 @@ class MainApplication(tk.Tk):
             )
 
         except Exception as e:
-            self.status_bar.progress.stop()
-            self.status_bar.progress.configure(mode='determinate')
             self.status_bar.hide_progress()
             messagebox.showerror("Error", f"Mapping failed: {e}")
             self.status_bar.set_status("Mapping failed")
@@ -1594,11 +2020,9 @@ class MainApplication(tk.Tk):
             else:
                 # File exists in filesystem but not in backup
                 self.mapping_info.update_mapping(None)
-                # Clear any selection highlighting in backup tree (unbind to prevent any event issues)
-                self.backup_tree.tree.unbind('<<TreeviewSelect>>')
-                self.backup_tree.tree.selection_set()
-                # Rebind after pending events are processed
-                self.after(10, lambda: self.backup_tree.tree.bind('<<TreeviewSelect>>', self.backup_tree._on_select))
+                # Clear any selection in the backup tree; an empty selection
+                # never reaches the select callback
+                self.backup_tree.tree.selection_set(())
         finally:
             self._selecting = False
 
@@ -1663,59 +2087,65 @@ class MainApplication(tk.Tk):
             return
 
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                stats = self.mapper.statistics
-
-                f.write("iOS Backup to Filesystem Comparison Statistics\n")
-                f.write("=" * 50 + "\n\n")
-
-                f.write("MANIFEST.DB PARSING\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"Manifest.db Rows: {stats.manifest_db_row_count}\n")
-                if self.backup and self.backup.parsing_log:
-                    log = self.backup.parsing_log
-                    f.write(f"  Files: {log.files_added}\n")
-                    f.write(f"  Directories: {log.directories_added}\n")
-                f.write("\n")
-
-                f.write("SUMMARY\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"Backup Files: {stats.total_backup_files}\n")
-                f.write(f"Backup Directories: {stats.total_backup_directories}\n")
-                f.write(f"Filesystem Files: {stats.total_filesystem_files}\n")
-                f.write(f"Filesystem Directories: {stats.total_filesystem_directories}\n\n")
-
-                f.write(f"Successfully Mapped: {stats.mapped_files}\n")
-                f.write(f"Not Found in Filesystem: {stats.not_found_files}\n")
-                f.write(f"Unmappable: {stats.unmappable_files}\n\n")
-
-                f.write(f"Files only in Backup: {stats.backup_only_files}\n")
-                f.write(f"Files only in Filesystem: {stats.filesystem_only_files}\n\n")
-
-                f.write("BY DOMAIN\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"{'Domain':<30} {'Total':>8} {'Mapped':>8} {'Not Found':>10} {'Unmappable':>12}\n")
-
-                by_domain = self.mapper.get_mappings_by_domain()
-                for domain in sorted(by_domain.keys()):
-                    domain_mappings = by_domain[domain]
-                    total = len(domain_mappings)
-                    mapped = sum(1 for m in domain_mappings if m.status == MappingStatus.MAPPED)
-                    not_found = sum(1 for m in domain_mappings if m.status == MappingStatus.NOT_FOUND)
-                    unmappable = sum(1 for m in domain_mappings if m.status == MappingStatus.UNMAPPABLE)
-                    f.write(
-                        f"{domain:<30} {total:>8} {mapped:>8} "
-                        f"{not_found:>10} {unmappable:>12}\n"
-                    )
+            # Build the report in memory and write it in one call
+            stats = self.mapper.statistics
+            parts = []
+            write = parts.append
+
+            write("iOS Backup to Filesystem Comparison Statistics\n")
+            write("=" * 50 + "\n\n")
+
+            write("MANIFEST.DB PARSING\n")
+            write("-" * 30 + "\n")
+            write(f"Manifest.db Rows: {stats.manifest_db_row_count}\n")
+            if self.backup and self.backup.parsing_log:
+                log = self.backup.parsing_log
+                write(f"  Files: {log.files_added}\n")
+                write(f"  Directories: {log.directories_added}\n")
+            write("\n")
+
+            write("SUMMARY\n")
+            write("-" * 30 + "\n")
+            write(f"Backup Files: {stats.total_backup_files}\n")
+            write(f"Backup Directories: {stats.total_backup_directories}\n")
+            write(f"Filesystem Files: {stats.total_filesystem_files}\n")
+            write(f"Filesystem Directories: {stats.total_filesystem_directories}\n\n")
+
+            write(f"Successfully Mapped: {stats.mapped_files}\n")
+            write(f"Not Found in Filesystem: {stats.not_found_files}\n")
+            write(f"Unmappable: {stats.unmappable_files}\n\n")
+
+            write(f"Files only in Backup: {stats.backup_only_files}\n")
+            write(f"Files only in Filesystem: {stats.filesystem_only_files}\n\n")
+
+            write("BY DOMAIN\n")
+            write("-" * 30 + "\n")
+            write(f"{'Domain':<30} {'Total':>8} {'Mapped':>8} {'Not Found':>10} {'Unmappable':>12}\n")
+
+            by_domain = self.mapper.get_mappings_by_domain()
+            for domain in sorted(by_domain.keys()):
+                domain_mappings = by_domain[domain]
+                total = len(domain_mappings)
+                # One counting pass per domain instead of one per status
+                status_counts = Counter(map(attrgetter('status'), domain_mappings))
+                mapped = status_counts[MappingStatus.MAPPED]
+                not_found = status_counts[MappingStatus.NOT_FOUND]
+                unmappable = status_counts[MappingStatus.UNMAPPABLE]
+                write(
+                    f"{domain:<30} {total:>8} {mapped:>8} "
+                    f"{not_found:>10} {unmappable:>12}\n"
+                )
+
+            # Write unmapped files if any
+            if stats.not_found_files > 0:
+                write("\n\nFILES NOT FOUND IN FILESYSTEM\n")
+                write("-" * 30 + "\n")
+                for m in self.mapper.get_mappings_by_status()[MappingStatus.NOT_FOUND]:
+                    write(f"Backup: {m.backup_file.full_domain_path}\n"
+                          f"  Expected: {m.filesystem_path}\n\n")
 
-                # Write unmapped files if any
-                if stats.not_found_files > 0:
-                    f.write("\n\nFILES NOT FOUND IN FILESYSTEM\n")
-                    f.write("-" * 30 + "\n")
-                    for m in self.mapper.mappings:
-                        if m.status == MappingStatus.NOT_FOUND:
-                            f.write(f"Backup: {m.backup_file.full_domain_path}\n")
-                            f.write(f"  Expected: {m.filesystem_path}\n\n")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
 
             self.status_bar.set_status(f"Statistics exported to {path}")
 
@@ -1746,39 +2176,36 @@ class MainApplication(tk.Tk):
             return
 
         try:
+            # Build the list in memory and write it in one call
+            parts = []
+            write = parts.append
+            write("Unmapped Backup Files\n")
+            write("=" * 50 + "\n\n")
+            write(f"Total unmapped files: {len(unmapped)}\n\n")
+
+            # Already grouped by status on the mapper
+            by_status = self.mapper.get_mappings_by_status()
+            not_found = by_status[MappingStatus.NOT_FOUND]
+            unmappable = by_status[MappingStatus.UNMAPPABLE]
+
+            if not_found:
+                write("FILES NOT FOUND IN FILESYSTEM\n")
+                write("-" * 40 + "\n")
+                for m in not_found:
+                    expected = f"  Expected path: {m.filesystem_path}\n" if m.filesystem_path else ""
+                    notes = f"  Notes: {m.notes}\n" if m.notes else ""
+                    write(f"{m.backup_file.full_domain_path}\n{expected}{notes}")
+                write("\n")
+
+            if unmappable:
+                write("UNMAPPABLE FILES (unknown domain)\n")
+                write("-" * 40 + "\n")
+                for m in unmappable:
+                    notes = f"  Notes: {m.notes}\n" if m.notes else ""
+                    write(f"{m.backup_file.full_domain_path}\n{notes}")
+
             with open(path, 'w', encoding='utf-8') as f:
-                f.write("Unmapped Backup Files\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Total unmapped files: {len(unmapped)}\n\n")
-
-                # Group by status
-                not_found = []
-                unmappable = []
-
-                for m in self.mapper.mappings:
-                    if m.status == MappingStatus.NOT_FOUND:
-                        not_found.append(m)
-                    elif m.status == MappingStatus.UNMAPPABLE:
-                        unmappable.append(m)
-
-                if not_found:
-                    f.write("FILES NOT FOUND IN FILESYSTEM\n")
-                    f.write("-" * 40 + "\n")
-                    for m in not_found:
-                        f.write(f"{m.backup_file.full_domain_path}\n")
-                        if m.filesystem_path:
-                            f.write(f"  Expected path: {m.filesystem_path}\n")
-                        if m.notes:
-                            f.write(f"  Notes: {m.notes}\n")
-                    f.write("\n")
-
-                if unmappable:
-                    f.write("UNMAPPABLE FILES (unknown domain)\n")
-                    f.write("-" * 40 + "\n")
-                    for m in unmappable:
-                        f.write(f"{m.backup_file.full_domain_path}\n")
-                        if m.notes:
-                            f.write(f"  Notes: {m.notes}\n")
+                f.write(''.join(parts))
 
             self.status_bar.set_status(f"Unmapped files list exported to {path}")
 
@@ -1806,7 +2233,8 @@ class MainApplication(tk.Tk):
         try:
             import csv
 
-            with open(path, 'w', newline='', encoding='utf-8') as f:
+            # A large buffer turns the many small row writes into few syscalls
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
 
                 # Header
@@ -1821,9 +2249,9 @@ class MainApplication(tk.Tk):
                     "Backup Modified Time"
                 ])
 
-                # Data rows
-                for m in self.mapper.mappings:
-                    writer.writerow([
+                # Data rows, handed over in one writerows() call
+                writer.writerows(
+                    (
                         m.backup_file.domain,
                         m.backup_file.relative_path,
                         m.backup_file.full_domain_path,
@@ -1832,7 +2260,9 @@ class MainApplication(tk.Tk):
                         m.notes or "",
                         m.backup_file.file_size,
                         m.backup_file.modified_time or ""
-                    ])
+                    )
+                    for m in self.mapper.mappings
+                )
 
             self.status_bar.set_status(f"Full mapping report exported to {path}")
 
@@ -1848,40 +2278,68 @@ class MainApplication(tk.Tk):
             self.mapping_info.set_hash_result("No filesystem file to compare", None)
             return
 
-        self.status_bar.set_status("Computing file hashes...")
-        self.update_idletasks()
+        self.status_bar.set_status("Computing file hashes...", force=True)
 
         try:
-            # Get backup file content
+            # Openers for streams over the two copies of the file
             if self.backup_type == 'filesystem':
-                loader = FilesystemLoader(self.backup._acquisition.path)
-                backup_content = loader.get_file_content(
-                    self.backup._acquisition, mapping.backup_file._fs_file
-                )
+                backup_loader = FilesystemLoader(self.backup._acquisition.path)
+                backup_key = cache_key(self.backup._acquisition.path, mapping.backup_file._fs_file.path)
+
+                def open_backup():
+                    return backup_loader.get_file_stream(
+                        self.backup._acquisition, mapping.backup_file._fs_file
+                    )
             elif self.backup_type == 'android':
-                backup_content = self._backup_parser.get_file_content(self.backup, mapping.backup_file)
+                # Every Android parser reads members out of the archive at
+                # backup.path (a folder is resolved to it), so key on that
+                backup_key = cache_key(self.backup.path, mapping.backup_file.file_id,
+                                       in_archive=True)
+
+                def open_backup():
+                    content = self._backup_parser.get_file_content(self.backup, mapping.backup_file)
+                    return io.BytesIO(content) if content is not None else None
             else:
-                parser = iOSBackupParser(self.backup.path)
-                backup_content = parser.get_file_content(self.backup, mapping.backup_file)
-
-            if backup_content is None:
+                backup_parser = iOSBackupParser(self.backup.path)
+                backup_key = cache_key(self.backup.path, member_path(self.backup, mapping.backup_file))
+
+                def open_backup():
+                    return backup_parser.get_file_stream(self.backup, mapping.backup_file)
+
+            fs_loader = FilesystemLoader(self.filesystem.path)
+            fs_key = cache_key(self.filesystem.path, mapping.filesystem_file.path)
+
+            def open_filesystem():
+                return fs_loader.get_file_stream(self.filesystem, mapping.filesystem_file)
+
+            # Reuse digests from earlier sessions where the file is unchanged
+            backup_hash = self._hash_cache.get(*backup_key) if backup_key else None
+            fs_hash = self._hash_cache.get(*fs_key) if fs_key else None
+
+            # Read and hash both copies at once; file I/O and hashlib both
+            # release the GIL, so this takes about as long as the slower one
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                backup_future = executor.submit(self._sha256_of, open_backup) if backup_hash is None else None
+                fs_future = executor.submit(self._sha256_of, open_filesystem) if fs_hash is None else None
+                if backup_future is not None:
+                    backup_hash = backup_future.result()
+                    if backup_hash is not None and backup_key:
+                        self._hash_cache.put(*backup_key, backup_hash)
+                if fs_future is not None:
+                    fs_hash = fs_future.result()
+                    if fs_hash is not None and fs_key:
+                        self._hash_cache.put(*fs_key, fs_hash)
+
+            if backup_hash is None:
                 self.mapping_info.set_hash_result("Could not read backup file", None)
                 self.status_bar.set_status("Hash comparison failed")
                 return
 
-            # Get filesystem file content
-            loader = FilesystemLoader(self.filesystem.path)
-            fs_content = loader.get_file_content(self.filesystem, mapping.filesystem_file)
-
-            if fs_content is None:
+            if fs_hash is None:
                 self.mapping_info.set_hash_result("Could not read filesystem file", None)
                 self.status_bar.set_status("Hash comparison failed")
                 return
 
-            # Compute SHA256 hashes
-            backup_hash = hashlib.sha256(backup_content).hexdigest()
-            fs_hash = hashlib.sha256(fs_content).hexdigest()
-
             if backup_hash == fs_hash:
                 self.mapping_info.set_hash_result(
                     f"MATCH - SHA256: {backup_hash[:16]}...",
@@ -1899,6 +2357,29 @@ class MainApplication(tk.Tk):
             self.mapping_info.set_hash_result(f"Error: {e}", None)
             self.status_bar.set_status("Hash comparison failed")
 
+    # Block size for streaming files through the hash
+    _HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+    @classmethod
+    def _sha256_of(cls, open_stream) -> Optional[str]:
+        """Hex SHA256 of the stream returned by open_stream, or None if it returned None.
+
+        The stream is hashed in large blocks read into one reused buffer, so
+        whole files are never held in memory.
+        """
+        stream = open_stream()
+        if stream is None:
+            return None
+        digest = hashlib.sha256()
+        block = memoryview(bytearray(cls._HASH_BLOCK_SIZE))
+        with stream:
+            while True:
+                n = stream.readinto(block)
+                if not n:
+                    break
+                digest.update(block[:n])
+        return digest.hexdigest()
+
     def _extract_backup_file(self, backup_file: BackupFile):
         """Extract a file from the backup."""
         if not backup_file or not self.backup:
@@ -2074,6 +2555,7 @@ class MainApplication(tk.Tk):
 
     def _expand_backup_tree(self):
         """Expand all nodes in backup tree."""
+        self.backup_tree.populate_all()
         self._expand_tree(self.backup_tree.tree)
 
     def _collapse_backup_tree(self):
@@ -2082,6 +2564,7 @@ class MainApplication(tk.Tk):
 
     def _expand_fs_tree(self):
         """Expand all nodes in filesystem tree."""
+        self.fs_tree.populate_all()
         self._expand_tree(self.fs_tree.tree)
 
     def _collapse_fs_tree(self):
@@ -14,6 +14,10 @@ from ios_backup_parser import BackupFile, iOSBackup
 from filesystem_loader import FilesystemAcquisition, FilesystemFile
 
 
+# Files mapped between progress reports
+MAPPING_PROGRESS_INTERVAL = 1000
+
+
 class MappingStatus(Enum):
     """Status of a path mapping."""
     MAPPED = "mapped"  # Successfully mapped to filesystem path
@@ -32,6 +36,47 @@ class PathMapping:
     notes: str = ""
 
 
+class MappingStatusIndex:
+    """Cached partition of a mapper's mappings by status.
+
+    Rebuilt whenever the mappings list is replaced or changes length. The
+    accessors return copies, so callers cannot disturb the cache.
+    """
+
+    UNMAPPED_STATUSES = (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE)
+
+    def __init__(self):
+        self._source: Optional[List[PathMapping]] = None
+        self._count = 0
+        self._by_status: Dict[MappingStatus, List[PathMapping]] = {}
+        self._unmapped: list = []
+
+    def _refresh(self, mappings: List[PathMapping]):
+        if mappings is self._source and len(mappings) == self._count:
+            return
+        by_status: Dict[MappingStatus, List[PathMapping]] = {s: [] for s in MappingStatus}
+        unmapped = []
+        unmapped_statuses = self.UNMAPPED_STATUSES
+        for mapping in mappings:
+            by_status[mapping.status].append(mapping)
+            if mapping.status in unmapped_statuses:
+                unmapped.append(mapping.backup_file)
+        self._source = mappings
+        self._count = len(mappings)
+        self._by_status = by_status
+        self._unmapped = unmapped
+
+    def by_status(self, mappings: List[PathMapping]) -> Dict[MappingStatus, List[PathMapping]]:
+        """Mappings grouped by status, each group in mapping order."""
+        self._refresh(mappings)
+        return {status: list(group) for status, group in self._by_status.items()}
+
+    def unmapped_backup_files(self, mappings: List[PathMapping]) -> list:
+        """Backup files that are NOT_FOUND or UNMAPPABLE, in mapping order."""
+        self._refresh(mappings)
+        return list(self._unmapped)
+
+
 @dataclass
 class MappingStatistics:
     """Statistics about the mapping process."""
@@ -93,6 +138,7 @@ class PathMapper:
         self.filesystem = filesystem
         self.mappings: List[PathMapping] = []
         self.statistics = MappingStatistics()
+        self._status_index = MappingStatusIndex()
 
     def _parse_domain(self, domain: str) -> Tuple[str, Optional[str]]:
         """
@@ -224,10 +270,13 @@ class PathMapper:
         # Unknown domain
         return None, f"Unknown domain: {backup_file.domain}"
 
-    def map_all(self) -> List[PathMapping]:
+    def map_all(self, progress_callback=None) -> List[PathMapping]:
         """
         Map all backup files to filesystem paths.
 
+        Args:
+            progress_callback: Optional callback(current, total, message) for progress updates
+
         Returns:
             List of PathMapping results
         """
@@ -262,11 +311,21 @@ class PathMapper:
                 self.statistics.total_filesystem_files += 1
 
         # Map each backup file
+        total = self.statistics.total_backup_files
+        done = 0
+        # Statuses bound once, not looked up on the enum for every file
+        status_mapped = MappingStatus.MAPPED
+        status_not_found = MappingStatus.NOT_FOUND
+        status_unmappable = MappingStatus.UNMAPPABLE
         for backup_file in self.backup.files:
             # Skip directories for mapping
             if backup_file.is_directory:
                 continue
 
+            if progress_callback and done % MAPPING_PROGRESS_INTERVAL == 0:
+                progress_callback(done, total, f"Mapping files: {done}/{total}")
+            done += 1
+
             # Map the path
             fs_path, notes = self._map_domain_path(backup_file)
 
@@ -276,7 +335,7 @@ class PathMapper:
                     backup_file=backup_file,
                     filesystem_path=None,
                     filesystem_file=None,
-                    status=MappingStatus.UNMAPPABLE,
+                    status=status_unmappable,
                     notes=notes
                 )
                 self.statistics.unmappable_files += 1
@@ -289,7 +348,7 @@ class PathMapper:
                         backup_file=backup_file,
                         filesystem_path=fs_path,
                         filesystem_file=fs_file,
-                        status=MappingStatus.MAPPED,
+                        status=status_mapped,
                         notes=notes
                     )
                     self.statistics.mapped_files += 1
@@ -299,13 +358,16 @@ class PathMapper:
                         backup_file=backup_file,
                         filesystem_path=fs_path,
                         filesystem_file=None,
-                        status=MappingStatus.NOT_FOUND,
+                        status=status_not_found,
                         notes=notes
                     )
                     self.statistics.not_found_files += 1
 
             self.mappings.append(mapping)
 
+        if progress_callback:
+            progress_callback(total, total, "Mapping complete")
+
         # Calculate files unique to each side
         self.statistics.backup_only_files = (
             self.statistics.not_found_files + self.statistics.unmappable_files
@@ -369,12 +431,13 @@ class PathMapper:
             by_domain[base_domain].append(mapping)
         return by_domain
 
+    def get_mappings_by_status(self) -> Dict[MappingStatus, List[PathMapping]]:
+        """Group mappings by status, partitioning once per map_all() run."""
+        return self._status_index.by_status(self.mappings)
+
     def get_unmapped_backup_files(self) -> List[BackupFile]:
-        """Get list of backup files that couldn't be mapped."""
-        return [
-            m.backup_file for m in self.mappings
-            if m.status in (MappingStatus.NOT_FOUND, MappingStatus.UNMAPPABLE)
-        ]
+        """Get list of backup files that couldn't be mapped, in mapping order."""
+        return self._status_index.unmapped_backup_files(self.mappings)
 
     def get_filesystem_files_not_in_backup(self) -> List[FilesystemFile]:
         """Get list of filesystem files that have no corresponding backup file."""
@@ -1,8 +1,12 @@
 """Tests for android_backup_parser module."""
 
+import io
+import tarfile
+
 import pytest
 
 from android_backup_parser import (
+    _BufferReader,
     parse_tar_path,
     AndroidBackupFile,
     AndroidBackup,
@@ -94,6 +98,24 @@ class TestParseTarPath:
         assert token == ""
         assert rel == ""
 
+    def test_shared_top_level_file(self):
+        domain, token, rel = parse_tar_path("shared/0/notes.txt")
+        assert domain == "shared/0"
+        assert token == ""
+        assert rel == "notes.txt"
+
+    def test_siblings_share_directory_parse(self):
+        """Entries in one directory all resolve the same domain and token."""
+        first = parse_tar_path("apps/com.example/f/sub/a.txt")
+        second = parse_tar_path("apps/com.example/f/sub/b.txt")
+        assert first == ("com.example", "f", "f/sub/a.txt")
+        assert second == ("com.example", "f", "f/sub/b.txt")
+
+    def test_empty_path_segment_kept(self):
+        domain, token, rel = parse_tar_path("shared/0//DCIM/photo.jpg")
+        assert domain == "shared/0"
+        assert rel == "/DCIM/photo.jpg"
+
     def test_leading_dot_slash(self):
         """Leading ./ should be stripped."""
         domain, token, rel = parse_tar_path("./apps/com.example/db/data.db")
@@ -200,6 +222,38 @@ class TestAndroidBackupGetFilesByDomain:
         assert backup.get_files_by_domain() == {}
 
 
+class TestBufferReader:
+    """Tests for the _BufferReader zero-copy file object."""
+
+    def test_read_seek_tell(self):
+        reader = _BufferReader(b"0123456789")
+        assert reader.read(3) == b"012"
+        assert reader.tell() == 3
+        reader.seek(-2, io.SEEK_END)
+        assert reader.read() == b"89"
+        reader.seek(1)
+        reader.seek(2, io.SEEK_CUR)
+        assert reader.read(2) == b"34"
+
+    def test_readinto_stops_at_end(self):
+        reader = _BufferReader(b"abc")
+        buf = bytearray(5)
+        assert reader.readinto(buf) == 3
+        assert bytes(buf[:3]) == b"abc"
+        assert reader.readinto(buf) == 0
+
+    def test_opens_as_tar(self):
+        out = io.BytesIO()
+        with tarfile.open(fileobj=out, mode='w') as tar:
+            info = tarfile.TarInfo("apps/com.example/f/a.txt")
+            info.size = 5
+            tar.addfile(info, io.BytesIO(b"hello"))
+
+        with tarfile.open(fileobj=_BufferReader(out.getvalue()), mode='r:') as tar:
+            member = tar.getmember("apps/com.example/f/a.txt")
+            assert tar.extractfile(member).read() == b"hello"
+
+
 class TestUnmappableTokens:
     """Tests for token constants."""
 
@@ -326,6 +326,64 @@ class TestMappingsByDomain:
         unmapped = mapper.get_unmapped_backup_files()
         assert len(unmapped) == 2
 
+    def test_get_unmapped_backup_files_keeps_mapping_order(self):
+        """NOT_FOUND and UNMAPPABLE files should stay interleaved in backup order."""
+        files = [
+            _file("com.missing", "r", "a.txt"),
+            _file("com.example", "_manifest", ""),
+            _file("com.missing", "r", "b.txt"),
+        ]
+        mapper = _make_mapper(files)
+        mapper.map_all()
+
+        assert mapper.get_unmapped_backup_files() == files
+
+    def test_get_mappings_by_status(self):
+        files = [
+            _file("com.example", "_manifest", ""),
+            _file("com.missing", "r", "file.txt"),
+        ]
+        mapper = _make_mapper(files)
+        mapper.map_all()
+
+        by_status = mapper.get_mappings_by_status()
+        assert len(by_status[MappingStatus.UNMAPPABLE]) == 1
+        assert len(by_status[MappingStatus.NOT_FOUND]) == 1
+        assert by_status[MappingStatus.MAPPED] == []
+
+        # Re-mapping discards the old partition
+        mapper.backup.files = []
+        mapper.map_all()
+        assert mapper.get_mappings_by_status()[MappingStatus.NOT_FOUND] == []
+
+    def test_get_mappings_by_status_returns_copy(self):
+        """Modifying the returned groups should not affect later results."""
+        files = [_file("com.missing", "r", "file.txt")]
+        mapper = _make_mapper(files)
+        mapper.map_all()
+
+        mapper.get_mappings_by_status()[MappingStatus.NOT_FOUND].clear()
+        mapper.get_unmapped_backup_files().clear()
+
+        assert mapper.get_mappings_by_status()[MappingStatus.NOT_FOUND] == mapper.mappings
+        assert mapper.get_unmapped_backup_files() == files
+
+    def test_get_mappings_by_status_follows_mappings(self):
+        """Mappings replaced after map_all() should be regrouped."""
+        files = [
+            _file("com.missing", "r", "file.txt"),
+            _file("com.example", "_manifest", ""),
+        ]
+        mapper = _make_mapper(files)
+        mapper.map_all()
+        mapper.get_mappings_by_status()
+        mapper.mappings = mapper.mappings[1:]
+
+        by_status = mapper.get_mappings_by_status()
+        assert by_status[MappingStatus.NOT_FOUND] == []
+        assert by_status[MappingStatus.UNMAPPABLE] == mapper.mappings
+        assert mapper.get_unmapped_backup_files() == files[1:]
+
     def test_get_filesystem_files_not_in_backup(self):
         fs_files = [
             FilesystemFile("/data/data/com.other/databases/other.db", 500, False, platform="android"),
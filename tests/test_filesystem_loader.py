@@ -1,8 +1,12 @@
 """Tests for filesystem_loader module."""
 
+import io
+import tarfile
+import zipfile
+
 import pytest
 
-from filesystem_loader import FilesystemFile, FilesystemAcquisition
+from filesystem_loader import FilesystemFile, FilesystemAcquisition, FilesystemLoader
 
 
 class TestFilesystemFileNormalizedPathIOS:
@@ -200,3 +204,43 @@ class TestFilesystemAcquisitionFindFilesInDirectory:
         acq = FilesystemAcquisition(path="/fake", format="tar", platform="android", files=[])
         acq.build_index()
         assert acq.find_files_in_directory("/nonexistent") == []
+
+
+class TestFilesystemLoaderGetFileStream:
+    """Tests for FilesystemLoader.get_file_stream()."""
+
+    def _read(self, path, fs_path):
+        loader = FilesystemLoader(str(path))
+        acq = FilesystemAcquisition(path=str(path), format=loader._format)
+        stream = loader.get_file_stream(acq, FilesystemFile(fs_path, 0, False))
+        if stream is None:
+            return None
+        with stream:
+            return stream.read()
+
+    def test_directory(self, tmp_path):
+        (tmp_path / "private" / "var").mkdir(parents=True)
+        (tmp_path / "private" / "var" / "a.db").write_bytes(b"dir data")
+        assert self._read(tmp_path, "/private/var/a.db") == b"dir data"
+        assert self._read(tmp_path, "/private/var/missing.db") is None
+
+    def test_zip(self, tmp_path):
+        zip_path = tmp_path / "fs.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("./private/var/a.db", b"zip data")
+        assert self._read(zip_path, "/private/var/a.db") == b"zip data"
+        assert self._read(zip_path, "/private/var/missing.db") is None
+
+    def test_tar(self, tmp_path):
+        tar_path = tmp_path / "fs.tar"
+        with tarfile.open(tar_path, 'w') as tar:
+            info = tarfile.TarInfo("private/var/a.db")
+            info.size = 8
+            tar.addfile(info, io.BytesIO(b"tar data"))
+        assert self._read(tar_path, "/private/var/a.db") == b"tar data"
+        assert self._read(tar_path, "/private/var/missing.db") is None
+
+    def test_directory_entry(self, tmp_path):
+        loader = FilesystemLoader(str(tmp_path))
+        acq = FilesystemAcquisition(path=str(tmp_path), format='directory')
+        assert loader.get_file_stream(acq, FilesystemFile("/private", 0, True)) is None
@@ -2,6 +2,7 @@
 
 import pytest
 
+import filesystem_mapper
 from filesystem_loader import FilesystemFile, FilesystemAcquisition
 from filesystem_mapper import (
     extract_domain_from_path,
@@ -147,6 +148,22 @@ class TestExtractDomainFromPath:
         assert domain == 'etc'
         assert rel == ''
 
+    def test_android_bare_data_directory(self):
+        domain, rel = extract_domain_from_path('/data', 'android')
+        assert domain == 'data'
+        assert rel == ''
+
+    def test_prefix_must_end_on_component_boundary(self):
+        domain, rel = extract_domain_from_path('/sdcardX/file.txt', 'android')
+        assert domain == 'sdcardX'
+        assert rel == 'file.txt'
+
+    def test_domain_strings_interned(self):
+        """Files in the same package should share a single domain object."""
+        d1, _ = extract_domain_from_path('/data/data/com.example/a.db', 'android')
+        d2, _ = extract_domain_from_path('/data/data/com.example/b.db', 'android')
+        assert d1 is d2
+
 
 # ---------------------------------------------------------------------------
 # FilesystemAsBackupFile
@@ -206,6 +223,26 @@ class TestFilesystemAsBackup:
         assert len(backup.files) == 1
         assert backup.files[0].domain == 'com.example'
 
+    def test_device_name_windows_path(self):
+        acq = FilesystemAcquisition(
+            path="C:\\cases\\extraction.zip",
+            format="zip",
+            platform="android",
+            files=[],
+        )
+        assert FilesystemAsBackup(acq).device_name == 'extraction.zip'
+
+    def test_wrappers_shared_across_instances(self):
+        acq = FilesystemAcquisition(
+            path="/path/to/extraction.zip",
+            format="zip",
+            platform="android",
+            files=[_fs_file('/data/data/com.example/db.sqlite')],
+        )
+        first = FilesystemAsBackup(acq)
+        second = FilesystemAsBackup(acq)
+        assert first.files[0] is second.files[0]
+
     def test_ios_platform(self):
         acq = FilesystemAcquisition(
             path="/path/to/device.tar",
@@ -296,6 +333,22 @@ class TestFilesystemMapper:
 
         assert mapper.statistics.mapped_files == 1
 
+    def test_aliased_sources_match_single_reference(self):
+        """Two aliased source paths hitting one reference file count it once."""
+        source = [
+            _fs_file('/data/data/com.example/db.sqlite'),
+            _fs_file('/data/user/0/com.example/db.sqlite'),
+        ]
+        ref = [
+            _fs_file('/data/data/com.example/db.sqlite'),
+            _fs_file('/data/data/com.example/other.db'),
+        ]
+        mapper = _make_mapper(source, ref)
+        mapper.map_all()
+
+        assert mapper.statistics.mapped_files == 2
+        assert mapper.statistics.filesystem_only_files == 1
+
     def test_coverage_percent(self):
         """Coverage should be mapped / total reference files * 100."""
         source = [_fs_file('/data/data/com.example/a.db')]
@@ -321,6 +374,15 @@ class TestFilesystemMapper:
         assert len(unmapped) == 1
         assert unmapped[0].domain == 'com.b'
 
+    def test_map_all_reports_progress(self):
+        source = [_fs_file('/data/data/com.a/x.db'), _fs_file('/data/data/com.b/y.db')]
+        mapper = _make_mapper(source, [_fs_file('/data/data/com.a/x.db')])
+        reports = []
+        mapper.map_all(progress_callback=lambda current, total, message: reports.append((current, total)))
+
+        assert reports[0] == (0, 2)
+        assert reports[-1] == (2, 2)
+
     def test_get_filesystem_files_not_in_backup(self):
         source = [_fs_file('/data/data/com.a/x.db')]
         ref = [
@@ -352,6 +414,87 @@ class TestFilesystemMapper:
         assert len(by_domain['com.a']) == 1
         assert len(by_domain['com.b']) == 1
 
+    def test_get_mappings_by_domain_returns_copy(self):
+        """Modifying the returned grouping should not affect later calls."""
+        mapper = _make_mapper([_fs_file('/data/data/com.a/x.db')], [])
+        mapper.map_all()
+
+        by_domain = mapper.get_mappings_by_domain()
+        by_domain['com.a'].clear()
+        by_domain['com.z'] = []
+
+        assert mapper.get_mappings_by_domain() == {'com.a': mapper.mappings}
+
+    def test_get_mappings_by_domain_follows_mappings(self):
+        """Mappings replaced after map_all() should be regrouped."""
+        mapper = _make_mapper(
+            [_fs_file('/data/data/com.a/x.db'), _fs_file('/data/data/com.b/y.db')], [],
+        )
+        mapper.map_all()
+        mapper.mappings = mapper.mappings[1:]
+
+        assert mapper.get_mappings_by_domain() == {'com.b': mapper.mappings}
+
+    def test_get_mapping_for_filesystem_file_uses_identity(self):
+        """An equal-valued but distinct file object should not match."""
+        source = [_fs_file('/data/data/com.a/x.db')]
+        ref = [_fs_file('/data/data/com.a/x.db')]
+        mapper = _make_mapper(source, ref)
+        mapper.map_all()
+
+        assert mapper.get_mapping_for_filesystem_file(ref[0]) is mapper.mappings[0]
+        lookalike = _fs_file('/data/data/com.a/x.db')
+        assert mapper.get_mapping_for_filesystem_file(lookalike) is None
+
+    def test_parallel_lookup_matches_serial(self, monkeypatch):
+        """The thread-pool lookup path should produce the same mappings."""
+        monkeypatch.setattr(filesystem_mapper, 'PARALLEL_LOOKUP_MIN_FILES', 1)
+        monkeypatch.setattr(filesystem_mapper, '_gil_disabled', lambda: True)
+        source = [
+            _fs_file('/data/data/com.a/x.db'),
+            _fs_file('/data/data/com.b/y.db'),
+        ]
+        ref = [_fs_file('/data/data/com.a/x.db')]
+        mapper = _make_mapper(source, ref)
+        mapper.map_all()
+
+        assert [m.status for m in mapper.mappings] == [
+            MappingStatus.MAPPED, MappingStatus.NOT_FOUND,
+        ]
+        assert mapper.mappings[0].backup_file is mapper.backup.files[0]
+
+    def test_parallel_lookup_keeps_order_across_batches(self, monkeypatch):
+        """Results from several lookup batches should line up with the source files."""
+        monkeypatch.setattr(filesystem_mapper, 'PARALLEL_LOOKUP_MIN_FILES', 1)
+        monkeypatch.setattr(filesystem_mapper, 'PARALLEL_LOOKUP_BATCH', 2)
+        monkeypatch.setattr(filesystem_mapper, '_gil_disabled', lambda: True)
+        source = [_fs_file(f'/data/data/com.a/f{i}.db') for i in range(5)]
+        ref = [_fs_file('/data/data/com.a/f1.db'), _fs_file('/data/data/com.a/f4.db')]
+        mapper = _make_mapper(source, ref)
+        mapper.map_all()
+
+        assert [m.backup_file for m in mapper.mappings] == mapper.backup.files
+        assert [m.status for m in mapper.mappings] == [
+            MappingStatus.NOT_FOUND, MappingStatus.MAPPED, MappingStatus.NOT_FOUND,
+            MappingStatus.NOT_FOUND, MappingStatus.MAPPED,
+        ]
+
+    def test_lookups_go_through_find_file(self):
+        """The mapper resolves paths with the acquisition's public find_file()."""
+        source = [_fs_file('/data/data/com.a/x.db')]
+        ref = [_fs_file('/data/data/com.a/y.db')]
+        mapper = _make_mapper(source, ref)
+        looked_up = []
+
+        def find_file(path):
+            looked_up.append(path)
+            return ref[0]
+        mapper.filesystem.find_file = find_file
+        mapper.map_all()
+
+        assert looked_up == ['/data/data/com.a/x.db']
+        assert mapper.mappings[0].filesystem_file is ref[0]
+
     def test_empty_source(self):
         """Empty source should produce no mappings."""
         mapper = _make_mapper([], [_fs_file('/data/data/com.a/x.db')])
@@ -0,0 +1,111 @@
+"""Tests for hash_cache module."""
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from hash_cache import HashCache, cache_key
+from magnet_parser import MagnetQuickImageParser
+
+
+DIGEST = "ab" * 32
+
+
+class TestHashCache:
+    """Tests for HashCache get/put/prune."""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = HashCache(str(tmp_path / "cache" / "hashes.sqlite"))
+        assert cache.get("/a", 1, 2) is None
+        cache.put("/a", 1, 2, DIGEST)
+        assert cache.get("/a", 1, 2) == DIGEST
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        db = str(tmp_path / "hashes.sqlite")
+        first = HashCache(db)
+        first.put("/a", 1, 2, DIGEST)
+        first.close()
+        assert HashCache(db).get("/a", 1, 2) == DIGEST
+
+    def test_changed_mtime_or_size_misses(self, tmp_path):
+        cache = HashCache(str(tmp_path / "hashes.sqlite"))
+        cache.put("/a", 1, 2, DIGEST)
+        assert cache.get("/a", 9, 2) is None
+        assert cache.get("/a", 1, 9) is None
+
+    def test_prunes_least_recently_used(self, tmp_path):
+        cache = HashCache(str(tmp_path / "hashes.sqlite"), max_entries=2)
+        cache.put("/a", 1, 1, DIGEST)
+        cache.put("/b", 1, 1, DIGEST)
+        assert cache.get("/a", 1, 1) == DIGEST  # /b is now the oldest
+        cache.put("/c", 1, 1, DIGEST)
+        assert cache.get("/b", 1, 1) is None
+        assert cache.get("/a", 1, 1) == DIGEST
+        assert cache.get("/c", 1, 1) == DIGEST
+
+    def test_unusable_location_disables_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = HashCache(str(blocker / "hashes.sqlite"))
+        cache.put("/a", 1, 2, DIGEST)
+        assert cache.get("/a", 1, 2) is None
+
+
+class TestCacheKey:
+    """Tests for cache_key()."""
+
+    def test_directory_stats_the_file(self, tmp_path):
+        (tmp_path / "var").mkdir()
+        target = tmp_path / "var" / "a.db"
+        target.write_bytes(b"12345")
+        path, mtime, size = cache_key(str(tmp_path), "/var/a.db")
+        assert path == str(target)
+        assert mtime == os.stat(target).st_mtime_ns
+        assert size == 5
+
+    def test_archive_stats_the_archive(self, tmp_path):
+        archive = tmp_path / "fs.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("var/a.db", b"12345")
+        path, mtime, size = cache_key(str(archive), "var/a.db")
+        assert path == os.path.join(str(archive), "var/a.db")
+        assert size == os.path.getsize(archive)
+
+    def test_missing_file(self, tmp_path):
+        assert cache_key(str(tmp_path), "missing.db") is None
+
+    def test_member_in_archive_stats_the_archive(self, tmp_path):
+        archive = tmp_path / "backup.ab"
+        archive.write_bytes(b"12345")
+        path, _, size = cache_key(str(archive), "apps/com.a/f/x", in_archive=True)
+        assert path == os.path.join(str(archive), "apps/com.a/f/x")
+        assert size == 5
+
+    def test_member_in_archive_needs_a_file(self, tmp_path):
+        (tmp_path / "apps").mkdir()
+        assert cache_key(str(tmp_path), "apps", in_archive=True) is None
+
+    def test_android_backup_loaded_from_folder_hits(self, tmp_path):
+        """A Magnet image opened from its folder is keyed on the ZIP inside it."""
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w:') as tf:
+            info = tarfile.TarInfo("apps/com.a/f/x.txt")
+            info.size = 5
+            tf.addfile(info, io.BytesIO(b"12345"))
+        zip_path = tmp_path / "Quick Image.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("adb-data.tar", buf.getvalue())
+        backup = MagnetQuickImageParser(str(tmp_path)).parse()
+        bf = next(f for f in backup.files if f.relative_path == "f/x.txt")
+
+        key = cache_key(backup.path, bf.file_id, in_archive=True)
+        assert key is not None
+        assert key[2] == os.path.getsize(zip_path)
+        cache = HashCache(str(tmp_path / "hashes.sqlite"))
+        cache.put(*key, DIGEST)
+        assert cache.get(*cache_key(backup.path, bf.file_id, in_archive=True)) == DIGEST
+        cache.close()
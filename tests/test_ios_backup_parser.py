@@ -8,7 +8,10 @@ import zipfile
 
 import pytest
 
-from ios_backup_parser import BackupFile, ParsingLog, ParsingLogEntry, iOSBackupParser
+from ios_backup_parser import (
+    BackupFile, ParsingLog, ParsingLogEntry, iOSBackup, iOSBackupParser,
+    _read_file_blob, _read_file_blob_fast, member_path,
+)
 
 
 class TestBackupFileIsDirectory:
@@ -47,6 +50,24 @@ class TestBackupFileIsDirectory:
         assert f.is_directory is False
 
 
+class TestGetFilesByDomain:
+    """Tests for iOSBackup.get_files_by_domain()."""
+
+    def test_groups_interleaved_domains_in_order(self, make_ios_file):
+        a1 = make_ios_file(file_id="a1", domain="HomeDomain")
+        a2 = make_ios_file(file_id="a2", domain="HomeDomain")
+        b1 = make_ios_file(file_id="b1", domain="MediaDomain")
+        a3 = make_ios_file(file_id="a3", domain="HomeDomain")
+        backup = iOSBackup(path="/fake", files=[a1, a2, b1, a3])
+
+        by_domain = backup.get_files_by_domain()
+
+        assert by_domain == {"HomeDomain": [a1, a2, a3], "MediaDomain": [b1]}
+
+    def test_empty(self):
+        assert iOSBackup(path="/fake").get_files_by_domain() == {}
+
+
 class TestParsingLogAddEntry:
     """Tests for ParsingLog.add_entry() counter logic."""
 
@@ -91,6 +112,27 @@ class TestParsingLogAddEntry:
         log.add_entry("unique_id", "Dom", "path", "added_file")
         assert "unique_id" in log._entry_by_file_id
 
+    def test_directory_entry_not_indexed(self):
+        log = ParsingLog()
+        log.add_entry("dir_id", "Dom", "path", "added_directory")
+        assert "dir_id" not in log._entry_by_file_id
+        assert len(log.entries) == 1
+
+    def test_add_entries_matches_add_entry(self):
+        rows = [
+            ("f1", "Dom", "a.txt", "added_file", "", 10),
+            ("d1", "Dom", "dir", "added_directory", "", 0),
+            ("e1", "Dom", "bad", "error", "parse failed", 0),
+        ]
+        bulk = ParsingLog()
+        bulk.add_entries(rows)
+        single = ParsingLog()
+        for row in rows:
+            single.add_entry(*row)
+        assert bulk.entries == single.entries
+        assert (bulk.files_added, bulk.directories_added, bulk.errors) == (1, 1, 1)
+        assert bulk._entry_by_file_id.keys() == {"f1"}
+
 
 class TestParsingLogUpdateActualSize:
     """Tests for ParsingLog.update_actual_size() — size mismatch detection."""
@@ -155,6 +197,46 @@ class TestParsingLogToText:
         assert "actual=200" in text
 
 
+def _mbfile_blob(attrs):
+    """Encode MBFile attributes the way Manifest.db stores them."""
+    return plistlib.dumps({
+        '$archiver': 'NSKeyedArchiver',
+        '$objects': ['$null', dict(attrs, RelativePath=plistlib.UID(2)), 'Library/a.db'],
+        '$top': {'root': plistlib.UID(1)},
+        '$version': 100000,
+    }, fmt=plistlib.FMT_BINARY)
+
+
+class TestReadFileBlob:
+    """Tests for decoding Size/Mode/LastModified from Manifest.db file blobs."""
+
+    def test_keyed_archive(self):
+        blob = _mbfile_blob({'Size': 70000, 'Mode': 0o100644, 'LastModified': 1600000000,
+                             'InodeNumber': 2 ** 40, 'UserID': 501})
+        assert _read_file_blob_fast(blob) == (70000, 0o100644, 1600000000)
+
+    def test_flat_dict(self):
+        blob = plistlib.dumps({'Size': 5, 'Mode': 0o040755}, fmt=plistlib.FMT_BINARY)
+        assert _read_file_blob_fast(blob) == (5, 0o040755, None)
+
+    def test_missing_keys_default(self):
+        assert _read_file_blob(_mbfile_blob({'UserID': 501})) == (0, 0, None)
+
+    def test_xml_plist_falls_back_to_plistlib(self):
+        blob = plistlib.dumps({'$objects': ['$null', {'Size': 12, 'Mode': 0o100600}]},
+                              fmt=plistlib.FMT_XML)
+        assert _read_file_blob_fast(blob) is None
+        assert _read_file_blob(blob) == (12, 0o100600, None)
+
+    def test_non_integer_value_falls_back_to_plistlib(self):
+        blob = _mbfile_blob({'Size': 1.5})
+        assert _read_file_blob_fast(blob) is None
+        assert _read_file_blob(blob) == (1.5, 0, None)
+
+    def test_garbage(self):
+        assert _read_file_blob(b'bplist00' + b'\xff' * 40) == (0, 0, None)
+
+
 def _make_ios_magnet_zip(tmpdir, fs_entries=None, live_entries=None, backup_files=None):
     """Create a synthetic iOS Magnet Quick Image ZIP.
 
@@ -353,6 +435,36 @@ class TestMagnetIOSGetFileContent:
         content = parser.get_file_content(backup, std_file)
         assert content == b"sms data"
 
+    def test_get_content_from_nested_backup(self, tmp_path):
+        """Backups stored under a subdirectory of the ZIP should resolve."""
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        flat_path = _make_ios_magnet_zip(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        nested_path = os.path.join(str(tmp_path), "nested.zip")
+        with zipfile.ZipFile(flat_path) as src, zipfile.ZipFile(nested_path, 'w') as dst:
+            for info in src.infolist():
+                dst.writestr('00008030-TESTUDID/' + info.filename, src.read(info))
+
+        parser = iOSBackupParser(nested_path)
+        backup = parser.parse()
+
+        std_file = next(f for f in backup.files if f.file_id == sha1)
+        assert std_file.file_size == len(b"sms data")
+        assert std_file.actual_file_size == len(b"sms data")
+        assert parser.get_file_content(backup, std_file) == b"sms data"
+        member = f"00008030-TESTUDID/{sha1[:2]}/{sha1}"
+        assert member_path(backup, std_file) == member
+        assert backup._zip_handle.read(member) == b"sms data"
+
+    def test_member_path_of_filesystem_entry(self, tmp_path):
+        zip_path = _make_ios_magnet_zip(tmp_path, fs_entries=[("test.txt", b"test content")])
+        backup = iOSBackupParser(zip_path).parse()
+
+        magnet_file = next(f for f in backup.files if f.file_id.startswith("magnet_fs:"))
+        assert backup._zip_handle.read(member_path(backup, magnet_file)) == b"test content"
+
     def test_get_content_reopens_zip(self, tmp_path):
         """Content extraction should work even with a fresh parser instance."""
         zip_path = _make_ios_magnet_zip(
@@ -368,3 +480,205 @@ class TestMagnetIOSGetFileContent:
         fresh_parser = iOSBackupParser(zip_path)
         content = fresh_parser.get_file_content(backup, magnet_file)
         assert content == b"test content"
+
+
+def _make_ios_backup_dir(tmpdir, backup_files=None):
+    """Create a synthetic unencrypted iOS backup directory.
+
+    Args:
+        tmpdir: directory to create the backup in
+        backup_files: list of (sha1_id, domain, relative_path, content_bytes)
+    """
+    backup_dir = os.path.join(str(tmpdir), "00008030-TESTUDID")
+    os.makedirs(backup_dir)
+
+    conn = sqlite3.connect(os.path.join(backup_dir, "Manifest.db"))
+    conn.execute("""CREATE TABLE Files (
+        fileID TEXT, domain TEXT, relativePath TEXT, flags INTEGER, file BLOB
+    )""")
+    for sha1, domain, rel, content in backup_files or []:
+        meta = plistlib.dumps({'Size': len(content), 'Mode': 0o100644},
+                              fmt=plistlib.FMT_BINARY)
+        conn.execute("INSERT INTO Files VALUES (?, ?, ?, ?, ?)",
+                     (sha1, domain, rel, 1, meta))
+        os.makedirs(os.path.join(backup_dir, sha1[:2]), exist_ok=True)
+        with open(os.path.join(backup_dir, sha1[:2], sha1), 'wb') as f:
+            f.write(content)
+    conn.commit()
+    conn.close()
+
+    with open(os.path.join(backup_dir, "Manifest.plist"), 'wb') as f:
+        f.write(plistlib.dumps({'IsEncrypted': False}))
+
+    return backup_dir
+
+
+class TestDirectoryBackup:
+    """Tests for parsing directory-based (unzipped) backups."""
+
+    def test_parse_reads_manifest_in_place(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        manifest = os.path.join(backup_dir, "Manifest.db")
+        before = os.stat(manifest).st_mtime_ns
+
+        backup = iOSBackupParser(backup_dir).parse()
+
+        assert os.stat(manifest).st_mtime_ns == before
+        bf = next(f for f in backup.files if f.file_id == sha1)
+        assert bf.file_size == len(b"sms data")
+        assert bf.actual_file_size == len(b"sms data")
+        assert backup.manifest_db_row_count == 1
+
+    def test_wal_mode_manifest(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        conn = sqlite3.connect(os.path.join(backup_dir, "Manifest.db"))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.close()
+        before = sorted(os.listdir(backup_dir))
+
+        backup = iOSBackupParser(backup_dir).parse()
+
+        assert backup.manifest_db_row_count == 1
+        assert sorted(os.listdir(backup_dir)) == before
+
+    def test_wal_mode_manifest_with_pending_wal(self, tmp_path):
+        """Rows still only in Manifest.db-wal are read, and no -shm is created."""
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[("aa" + "0" * 38, "HomeDomain", "Library/a.db", b"a")],
+        )
+        writer = sqlite3.connect(os.path.join(backup_dir, "Manifest.db"))
+        try:
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+            writer.execute("INSERT INTO Files SELECT 'bb' || substr(fileID, 3), domain, "
+                           "'Library/b.db', flags, file FROM Files")
+            writer.commit()
+            os.unlink(os.path.join(backup_dir, "Manifest.db-shm"))
+            before = sorted(os.listdir(backup_dir))
+
+            backup = iOSBackupParser(backup_dir).parse()
+
+            assert sorted(f.relative_path for f in backup.files) == ["Library/a.db", "Library/b.db"]
+            assert sorted(os.listdir(backup_dir)) == before
+        finally:
+            writer.close()
+
+    def test_missing_backup_file_has_no_actual_size(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        os.unlink(os.path.join(backup_dir, sha1[:2], sha1))
+
+        backup = iOSBackupParser(backup_dir).parse()
+
+        bf = next(f for f in backup.files if f.file_id == sha1)
+        assert bf.actual_file_size is None
+
+    def test_actual_sizes_read_across_buckets(self, tmp_path):
+        files = [
+            ("aa" + "0" * 38, "HomeDomain", "Library/a.db", b"a"),
+            ("bb" + "0" * 38, "HomeDomain", "Library/b.db", b"bb"),
+            ("cc" + "0" * 38, "MediaDomain", "Media/c.jpg", b"ccc"),
+        ]
+        backup_dir = _make_ios_backup_dir(tmp_path, backup_files=files)
+
+        backup = iOSBackupParser(backup_dir).parse()
+
+        sizes = {f.file_id[:2]: f.actual_file_size for f in backup.files}
+        assert sizes == {"aa": 1, "bb": 2, "cc": 3}
+
+    def test_malformed_utf8_path_is_decoded_with_replacement(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/placeholder", b"x")],
+        )
+        conn = sqlite3.connect(os.path.join(backup_dir, "Manifest.db"))
+        conn.execute("UPDATE Files SET relativePath = CAST(? AS TEXT)",
+                     (b"Library/caf\xe9",))
+        conn.commit()
+        conn.close()
+
+        backup = iOSBackupParser(backup_dir).parse()
+
+        assert backup.files[0].relative_path == "Library/caf�"
+        assert backup.files[0].domain == "HomeDomain"
+
+    def test_get_file_stream_reads_backup_file(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        parser = iOSBackupParser(backup_dir)
+        backup = parser.parse()
+
+        with parser.get_file_stream(backup, backup.files[0]) as stream:
+            assert stream.read() == b"sms data"
+        assert parser.get_file_content(backup, backup.files[0]) == b"sms data"
+        member = member_path(backup, backup.files[0])
+        assert member == f"{sha1[:2]}/{sha1}"
+        with open(os.path.join(backup_dir, member), 'rb') as f:
+            assert f.read() == b"sms data"
+
+
+class TestParsingLogEntries:
+    """Tests for the log_entries switch on iOSBackupParser."""
+
+    def _backup_dir(self, tmp_path):
+        sha1 = "abcdef1234567890abcdef1234567890abcdef12"
+        backup_dir = _make_ios_backup_dir(
+            tmp_path,
+            backup_files=[(sha1, "HomeDomain", "Library/SMS/sms.db", b"sms data")],
+        )
+        # Grow the file on disk so the manifest size no longer matches
+        with open(os.path.join(backup_dir, sha1[:2], sha1), 'ab') as f:
+            f.write(b"more")
+        return backup_dir
+
+    def test_counters_kept_without_entries(self, tmp_path):
+        backup = iOSBackupParser(self._backup_dir(tmp_path), log_entries=False).parse()
+        log = backup.parsing_log
+        assert log.entries == []
+        assert log.files_added == 1
+        assert log.size_mismatches == 1
+
+    def test_entries_recorded_by_default(self, tmp_path):
+        backup = iOSBackupParser(self._backup_dir(tmp_path)).parse()
+        log = backup.parsing_log
+        assert [e.status for e in log.entries] == ['added_file']
+        assert log.entries[0].format_details() == "size=8, flags=1"
+        assert log.entries[0].actual_size == 12
+        assert log.files_added == 1
+        assert log.size_mismatches == 1
+
+    @staticmethod
+    def _counters(log):
+        return (log.total_rows, log.files_added, log.directories_added,
+                log.skipped_no_content, log.errors, log.size_mismatches,
+                log.manifest_size_zero)
+
+    def test_counters_match_with_and_without_entries(self, tmp_path):
+        backup_dir = self._backup_dir(tmp_path / "dir")
+        zip_path = _make_ios_magnet_zip(
+            tmp_path,
+            fs_entries=[("DCIM", None), ("DCIM/photo.jpg", b"jpeg")],
+            live_entries=[("device_properties.txt", b"props")],
+            backup_files=[("ab" + "0" * 38, "HomeDomain", "Library/a.db", b"a")],
+        )
+        for path in (backup_dir, zip_path):
+            with_entries = iOSBackupParser(path, log_entries=True).parse().parsing_log
+            without = iOSBackupParser(path, log_entries=False).parse().parsing_log
+            assert self._counters(with_entries) == self._counters(without)
+            assert without.entries == []
@@ -3,13 +3,15 @@
 import io
 import gzip
 import os
+import queue
 import tarfile
 import tempfile
+import threading
 import zipfile
 
 import pytest
 
-from magnet_parser import MagnetQuickImageParser
+from magnet_parser import MagnetQuickImageParser, _read_sdcard_members, _scan_tar, _scan_ustar
 from android_backup_parser import AndroidBackupFile
 
 
@@ -200,6 +202,24 @@ class TestMagnetParse:
         paths = [f.relative_path for f in shared_files]
         assert "Download/file.pdf" in paths
 
+    def test_sdcard_name_prefixes(self, tmp_path):
+        """sdcard/ is stripped however it is spelled, but dot names are kept."""
+        adb = [("shared/0/", None)]
+        sdcard = [
+            ("./sdcard/.nomedia", b""),
+            ("./.thumbnails", b"thumbs"),
+            ("/sdcard/Music/song.mp3", b"mp3"),
+            ("sdcard/Movies/clip.mp4", b"mp4"),
+        ]
+        zip_path = _make_magnet_zip(str(tmp_path), adb_members=adb, sdcard_members=sdcard)
+        backup = MagnetQuickImageParser(zip_path).parse()
+
+        paths = {f.relative_path for f in backup.files if f.domain == "shared/0"}
+        assert ".nomedia" in paths
+        assert ".thumbnails" in paths
+        assert "Music/song.mp3" in paths
+        assert "Movies/clip.mp4" in paths
+
     def test_live_data_entries(self, tmp_path):
         live = [
             ("dumpsys_battery.txt", b"battery info"),
@@ -222,6 +242,70 @@ class TestMagnetParse:
         backup = parser.parse()
         assert len(backup.files) > 0
 
+    def test_empty_sdcard_tar_not_read(self, tmp_path, monkeypatch):
+        """An sdcard.tar.gz with no members is skipped after a header peek."""
+        def fail(zip_path, batches, cancel):
+            raise AssertionError("empty sdcard.tar.gz should not be read")
+        monkeypatch.setattr("magnet_parser._read_sdcard_members", fail)
+        zip_path = _make_magnet_zip(str(tmp_path), sdcard_members=[])
+        backup = MagnetQuickImageParser(zip_path).parse()
+        assert not any(f.file_id.startswith("sdcard_tar:") for f in backup.files)
+
+    def test_sdcard_worker_joined_when_parse_fails(self, tmp_path, monkeypatch):
+        """A failure during the adb pass stops and joins the sdcard worker."""
+        finished = []
+
+        def worker(zip_path, batches, cancel):
+            finished.append(cancel.wait(5))
+            batches.put(None)
+        monkeypatch.setattr("magnet_parser._read_sdcard_members", worker)
+        zip_path = os.path.join(str(tmp_path), "Quick Image.zip")
+        with zipfile.ZipFile(zip_path, 'w') as zf:  # No adb-data.tar
+            zf.writestr("sdcard.tar.gz", _make_tar_bytes([("sdcard/a.txt", b"a")], mode='w:gz'))
+
+        with pytest.raises(KeyError):
+            MagnetQuickImageParser(zip_path).parse()
+        assert finished == [True]
+
+    def test_sdcard_reader_stops_when_cancelled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("magnet_parser._SDCARD_BATCH", 1)
+        zip_path = _make_magnet_zip(
+            str(tmp_path), sdcard_members=[(f"sdcard/{i}.txt", b"x") for i in range(3)])
+        batches = queue.SimpleQueue()
+        cancel = threading.Event()
+        cancel.set()
+
+        assert _read_sdcard_members(zip_path, batches, cancel) is None
+        assert batches.get_nowait() is None
+        assert batches.empty()
+
+    def test_adb_tar_mapped_from_stored_zip(self, tmp_path):
+        zip_path = _make_magnet_zip(str(tmp_path))
+        backup = MagnetQuickImageParser(zip_path).parse()
+        assert isinstance(backup._tar_data, memoryview)
+
+    def test_deflated_adb_tar(self, tmp_path):
+        zip_path = os.path.join(str(tmp_path), "Quick Image.zip")
+        adb_tar = _make_tar_bytes([("apps/com.example/f/a.txt", b"alpha")])
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("adb-data.tar", adb_tar)
+        backup = MagnetQuickImageParser(zip_path).parse()
+
+        assert backup._tar_data is None  # Dropped once indexed
+        bf = next(f for f in backup.files if f.relative_path == "f/a.txt")
+        assert MagnetQuickImageParser.get_file_content(backup, bf) == b"alpha"
+
+    def test_keep_tar_data(self, tmp_path):
+        zip_path = os.path.join(str(tmp_path), "Quick Image.zip")
+        adb_tar = _make_tar_bytes([("apps/com.example/f/a.txt", b"alpha")])
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("adb-data.tar", adb_tar)
+        backup = MagnetQuickImageParser(zip_path, keep_tar_data=True).parse()
+
+        assert backup._tar_data == adb_tar
+        bf = next(f for f in backup.files if f.relative_path == "f/a.txt")
+        assert MagnetQuickImageParser.get_file_content(backup, bf) == b"alpha"
+
     def test_progress_callback(self, tmp_path):
         zip_path = _make_magnet_zip(str(tmp_path))
         parser = MagnetQuickImageParser(zip_path)
@@ -232,6 +316,58 @@ class TestMagnetParse:
         assert calls[-1][0] == 100
 
 
+class TestScanAdbTar:
+    """Tests for the direct adb-data.tar header scan."""
+
+    @pytest.mark.parametrize("fmt", [tarfile.USTAR_FORMAT, tarfile.GNU_FORMAT, tarfile.PAX_FORMAT])
+    def test_matches_tarfile(self, fmt):
+        long_name = "apps/com.example/f/" + "deep/" * 30 + "file.txt"
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w', format=fmt) as tf:
+            for name, content in [("apps/com.example/", None),
+                                  ("apps/com.example/db/data.db", b"db"),
+                                  (long_name if fmt != tarfile.USTAR_FORMAT else "apps/x", b"long")]:
+                info = tarfile.TarInfo(name)
+                if content is None:
+                    info.type = tarfile.DIRTYPE
+                    tf.addfile(info)
+                else:
+                    info.size = len(content)
+                    tf.addfile(info, io.BytesIO(content))
+        data = buf.getvalue()
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as tf:
+            expected = [(m.name, m.size, m.isdir(), m.offset_data) for m in tf]
+        scanned = [(e.name, e.size, e.is_dir, e.offset) for e in _scan_ustar(data)]
+        assert scanned == expected
+
+    def test_unsupported_member_falls_back_to_tarfile(self):
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w', format=tarfile.GNU_FORMAT) as tf:
+            info = tarfile.TarInfo("apps/com.example/f/link")
+            info.type = tarfile.SYMTYPE
+            info.linkname = "t" * 150  # Needs a GNU long link ('K') header
+            tf.addfile(info)
+        entries = _scan_tar(buf.getvalue())
+        assert [e.name for e in entries] == ["apps/com.example/f/link"]
+
+    def test_bad_checksum_rejected(self):
+        data = bytearray(_make_tar_bytes([("apps/com.example/db/data.db", b"db")]))
+        data[0] ^= 0x01  # Corrupt the name without fixing the checksum
+        with pytest.raises(tarfile.ReadError):
+            _scan_ustar(bytes(data))
+
+    def test_malformed_pax_record_rejected(self):
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w', format=tarfile.PAX_FORMAT) as tf:
+            info = tarfile.TarInfo("apps/com.example/f/" + "deep/" * 30 + "file.txt")
+            tf.addfile(info)
+        data = bytearray(buf.getvalue())
+        data[512:514] = b"0 "  # Zero-length record in the pax payload
+        with pytest.raises(tarfile.ReadError):
+            _scan_ustar(bytes(data))
+
+
 class TestMagnetGetFileContent:
     """Tests for MagnetQuickImageParser.get_file_content()."""
 
@@ -255,6 +391,16 @@ class TestMagnetGetFileContent:
         content = MagnetQuickImageParser.get_file_content(backup, unique_file)
         assert content == b"unique content"
 
+    def test_get_sdcard_content_out_of_order(self, tmp_path):
+        adb = [("shared/0/", None)]
+        sdcard = [("sdcard/a.txt", b"first"), ("sdcard/b.txt", b"second")]
+        zip_path = _make_magnet_zip(str(tmp_path), adb_members=adb, sdcard_members=sdcard)
+        backup = MagnetQuickImageParser(zip_path).parse()
+
+        by_path = {f.relative_path: f for f in backup.files}
+        assert MagnetQuickImageParser.get_file_content(backup, by_path["b.txt"]) == b"second"
+        assert MagnetQuickImageParser.get_file_content(backup, by_path["a.txt"]) == b"first"
+
     def test_get_live_data_content(self, tmp_path):
         live = [("info.txt", b"live info")]
         zip_path = _make_magnet_zip(str(tmp_path), live_data=live)
@@ -265,6 +411,58 @@ class TestMagnetGetFileContent:
         content = MagnetQuickImageParser.get_file_content(backup, live_file)
         assert content == b"live info"
 
+    def test_duplicate_adb_member_uses_latest_content(self, tmp_path):
+        adb = [
+            ("apps/com.example/f/note.txt", b"old"),
+            ("apps/com.example/f/other.txt", b"x"),
+            ("apps/com.example/f/note.txt", b"newer content"),
+        ]
+        zip_path = _make_magnet_zip(str(tmp_path), adb_members=adb)
+        backup = MagnetQuickImageParser(zip_path).parse()
+
+        notes = [f for f in backup.files if f.relative_path == "f/note.txt"]
+        assert len(notes) == 1
+        assert notes[0].file_size == notes[0].actual_file_size == 13
+        assert MagnetQuickImageParser.get_file_content(backup, notes[0]) == b"newer content"
+        # The path keeps its first position
+        assert [f.relative_path for f in backup.files] == ["f/note.txt", "f/other.txt"]
+
+    def test_duplicate_sdcard_member_uses_latest_content(self, tmp_path):
+        adb = [("shared/0/", None)]
+        sdcard = [
+            ("sdcard/Download/file.pdf", b"old"),
+            ("sdcard/Download/file.pdf", b"newer content"),
+        ]
+        zip_path = _make_magnet_zip(str(tmp_path), adb_members=adb, sdcard_members=sdcard)
+        backup = MagnetQuickImageParser(zip_path).parse()
+
+        pdfs = [f for f in backup.files if f.relative_path == "Download/file.pdf"]
+        assert len(pdfs) == 1
+        assert pdfs[0].file_size == pdfs[0].actual_file_size == 13
+        assert MagnetQuickImageParser.get_file_content(backup, pdfs[0]) == b"newer content"
+        sizes = [e.manifest_size for e in backup.parsing_log.entries
+                 if e.relative_path == "Download/file.pdf"]
+        assert sizes == [13]
+
+    def test_close_releases_readers(self, tmp_path):
+        zip_path = os.path.join(str(tmp_path), "Quick Image.zip")
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("adb-data.tar", _make_tar_bytes([("apps/com.example/f/a.txt", b"alpha")]))
+            zf.writestr("sdcard.tar.gz", _make_tar_bytes([("sdcard/b.txt", b"beta")], mode='w:gz'))
+        backup = MagnetQuickImageParser(zip_path).parse()
+        by_path = {f.relative_path: f for f in backup.files}
+        assert MagnetQuickImageParser.get_file_content(backup, by_path["f/a.txt"]) == b"alpha"
+        assert MagnetQuickImageParser.get_file_content(backup, by_path["b.txt"]) == b"beta"
+        magnet_zip = backup._magnet_zip
+        readers = [backup._magnet_adb_tar, backup._magnet_sdcard_raw]
+
+        backup.close()
+
+        assert magnet_zip.fp is None
+        assert all(reader.closed for reader in readers)
+        assert backup._magnet_sdcard_tar is None
+        assert MagnetQuickImageParser.get_file_content(backup, by_path["b.txt"]) is None
+
     def test_directory_returns_none(self, tmp_path):
         zip_path = _make_magnet_zip(str(tmp_path))
         parser = MagnetQuickImageParser(zip_path)